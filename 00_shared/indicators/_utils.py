@@ -16,6 +16,28 @@ Provides a universal interface for extracting OHLCV values from:
 import numpy as np
 from typing import Any, Optional, Union
 
+try:
+    from numba import njit, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is optional - kernels decorated with njit run as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def vectorize(*args, **kwargs):
+        """np.vectorize stand-in for numba.vectorize when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return np.vectorize(args[0])
+        # Output dtype from the first "ret(args)" signature, e.g. "int8(float64)"
+        signatures = args[0] if args else kwargs.get('signatures')
+        otypes = [signatures[0].split('(')[0].strip()] if signatures else None
+        return lambda func: np.vectorize(func, otypes=otypes)
+
 
 # =============================================================================
 # SAFE TYPE CONVERSION
@@ -20,7 +20,7 @@ from typing import List, Optional, Any
 
 from ..config import CONFIG
 from ..types import ATRResult
-from .._utils import get_high, get_low, get_close
+from .._utils import get_high, get_low, get_close, njit, NUMBA_AVAILABLE
 
 
 # =============================================================================
@@ -35,18 +35,25 @@ def _true_range_core(
     """
     Calculate True Range for each bar.
 
-    First element uses high - low (no previous close available).
+    First element uses high - low (no previous close available). A missing
+    (NaN) previous close is ignored, leaving high - low for that bar; a NaN
+    high or low still gives NaN.
     """
     n = len(high)
     tr = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return tr
+
     tr[0] = high[0] - low[0]
 
-    for i in range(1, n):
-        tr[i] = max(
-            high[i] - low[i],
-            abs(high[i] - close[i - 1]),
-            abs(low[i] - close[i - 1]),
-        )
+    prev_close = close[:-1]
+    h, l = high[1:], low[1:]
+    # The gap terms are NaN whenever prev_close is; fmax then falls back to
+    # high - low. A NaN high or low makes both sides NaN, so it propagates.
+    tr[1:] = np.fmax(
+        h - l,
+        np.maximum(np.abs(h - prev_close), np.abs(l - prev_close)),
+    )
 
     return tr
 
@@ -67,12 +74,62 @@ def _atr_core(
     n = len(tr)
     result = np.full(n, np.nan)
 
-    for i in range(period - 1, n):
-        result[i] = tr[i - period + 1:i + 1].mean()
+    if n >= period:
+        result[period - 1:] = np.convolve(tr, np.ones(period) / period, mode="valid")
 
     return result
 
 
+@njit(cache=True)
+def _atr_series_nb(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+) -> np.ndarray:
+    """
+    Fused True Range + rolling ATR in a single pass (numba-compiled).
+
+    Same output as _atr_core (up to float rounding), using a running sum and
+    a ring buffer of the last `period` true ranges instead of re-averaging
+    each window. NaN true ranges are counted rather than summed, so the ATR
+    is NaN only while a NaN is inside the window.
+    """
+    n = len(high)
+    out = np.full(n, np.nan)
+    if n == 0:
+        return out
+
+    ring = np.zeros(period)
+    rsum = 0.0
+    nan_count = 0
+
+    for i in range(n):
+        tr = high[i] - low[i]
+        if i > 0 and not np.isnan(tr):
+            # A missing previous close is skipped, as in _true_range_core
+            prev_close = close[i - 1]
+            if not np.isnan(prev_close):
+                tr = max(tr, abs(high[i] - prev_close), abs(low[i] - prev_close))
+
+        slot = i % period
+        old = ring[slot]
+        if np.isnan(old):
+            nan_count -= 1
+        else:
+            rsum -= old
+        if np.isnan(tr):
+            nan_count += 1
+        else:
+            rsum += tr
+        ring[slot] = tr
+
+        if i >= period - 1 and nan_count == 0:
+            out[i] = rsum / period
+
+    return out
+
+
 # =============================================================================
 # SCALAR HELPER
 # =============================================================================
@@ -186,7 +243,8 @@ def calculate_atr_series(
     if n < 2:
         return [None] * n
 
-    atr_arr = _atr_core(
+    atr_kernel = _atr_series_nb if NUMBA_AVAILABLE else _atr_core
+    atr_arr = atr_kernel(
         np.array(highs, dtype=np.float64),
         np.array(lows, dtype=np.float64),
         np.array(closes, dtype=np.float64),
@@ -0,0 +1,74 @@
+"""
+Tests for the canonical ATR core (shared.indicators.core.atr).
+"""
+
+import numpy as np
+
+from shared.indicators.core.atr import (
+    _true_range_core, _atr_core, _atr_series_nb, calculate_atr_series,
+)
+
+
+def _bars(n: int = 40, seed: int = 0):
+    """Random-walk high/low/close arrays."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 + rng.standard_normal(n).cumsum()
+    high = close + rng.random(n)
+    low = close - rng.random(n)
+    return high, low, close
+
+
+def test_true_range_skips_missing_previous_close():
+    high = np.array([10.0, 11.0, 12.0, 13.0])
+    low = np.array([9.0, 10.0, 11.0, 12.0])
+    close = np.array([9.5, np.nan, 11.5, 12.5])
+
+    tr = _true_range_core(high, low, close)
+
+    np.testing.assert_array_equal(tr, [1.0, 1.5, 1.0, 1.5])
+
+
+def test_true_range_propagates_missing_high_or_low():
+    high, low, close = _bars()
+    high[5] = np.nan
+    low[9] = np.nan
+
+    tr = _true_range_core(high, low, close)
+
+    assert np.isnan(tr[5]) and np.isnan(tr[9])
+    assert np.count_nonzero(np.isnan(tr)) == 2
+
+
+def test_atr_is_nan_only_while_missing_high_is_in_window():
+    high, low, close = _bars()
+    high[5] = np.nan
+
+    atr = _atr_core(high, low, close, 14)
+
+    # Warm-up bars 0-12, then every window containing bar 5 (bars 13-18)
+    assert np.isnan(atr[:19]).all()
+    assert not np.isnan(atr[19:]).any()
+
+
+def test_atr_series_kernel_matches_core_with_nans():
+    for seed in range(20):
+        high, low, close = _bars(200, seed)
+        rng = np.random.default_rng(seed)
+        for arr in (high, low, close):
+            arr[rng.integers(0, 200, 3)] = np.nan
+
+        expected = _atr_core(high, low, close, 14)
+        actual = _atr_series_nb(high, low, close, 14)
+
+        np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+        np.testing.assert_allclose(actual, expected, equal_nan=True)
+
+
+def test_atr_series_recovers_after_missing_high():
+    high, low, close = _bars()
+    highs = [None if i == 5 else h for i, h in enumerate(high.tolist())]
+
+    atr = calculate_atr_series(highs, low.tolist(), close.tolist(), 14)
+
+    assert all(v is None for v in atr[:19])
+    assert all(v is not None for v in atr[19:])
@@ -6,16 +6,27 @@ This module provides backward-compatible dict-based wrappers.
 
 SWH-6: Single source of truth - shared.indicators
 """
-from calculations.volume_delta import calculate_all_deltas, calculate_bar_delta
+from calculations._utils import BarArrays, bars_to_soa
+from calculations.volume_delta import (
+    calculate_all_deltas,
+    calculate_all_deltas_arrays,
+    iter_deltas,
+    calculate_bar_delta
+)
 from calculations.candle_range import (
     calculate_all_candle_ranges,
+    calculate_all_candle_ranges_arrays,
+    iter_candle_ranges,
     calculate_candle_range_pct,
     is_absorption_zone,
     ABSORPTION_THRESHOLD,
-    NORMAL_THRESHOLD
+    NORMAL_THRESHOLD,
+    ABSORPTION_PCT
 )
 from calculations.volume_roc import (
     calculate_all_volume_roc,
+    calculate_all_volume_roc_arrays,
+    iter_volume_roc,
     calculate_volume_roc,
     is_elevated_volume,
     ELEVATED_THRESHOLD,
@@ -23,6 +34,8 @@ from calculations.volume_roc import (
 )
 from calculations.sma_config import (
     calculate_all_sma_configs,
+    calculate_all_sma_configs_arrays,
+    iter_sma_configs,
     SMAConfig,
     PricePosition,
     WIDE_SPREAD_THRESHOLD
@@ -0,0 +1,89 @@
+"""
+Bar Array Helpers
+Epoch Trading System - XIII Trading LLC
+
+Converts list-of-dict bars into struct-of-arrays (SoA) numpy columns once,
+so every calculation can run on contiguous float64 arrays instead of
+re-reading dict keys per bar.
+"""
+from operator import itemgetter
+from typing import List, NamedTuple, Union
+
+import numpy as np
+
+
+class BarArrays(NamedTuple):
+    """OHLCV + timestamp columns for a list of bars."""
+    timestamp: np.ndarray   # int64, milliseconds
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
+_SOA_DTYPE = np.dtype([
+    ('t', 'i8'), ('o', 'f8'), ('h', 'f8'), ('l', 'f8'), ('c', 'f8'), ('v', 'f8')
+])
+
+# Canonical key sets, in _SOA_DTYPE field order
+_LONG_KEYS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+_SHORT_KEYS = ('t', 'o', 'h', 'l', 'c', 'v')
+_GET_LONG = itemgetter(*_LONG_KEYS)
+_GET_SHORT = itemgetter(*_SHORT_KEYS)
+
+
+def _row_fallback(b: dict) -> tuple:
+    """Extract one row from a bar with mixed or missing keys."""
+    return (
+        b.get('timestamp') or b.get('t') or 0,
+        b.get('open') or b.get('o') or 0.0,
+        b.get('high') or b.get('h') or 0.0,
+        b.get('low') or b.get('l') or 0.0,
+        b.get('close') or b.get('c') or 0.0,
+        b.get('volume') or b.get('v') or 0.0,
+    )
+
+
+def bars_to_soa(bars: Union[List[dict], BarArrays]) -> BarArrays:
+    """
+    Convert bars to BarArrays in a single pass.
+
+    Accepts either long ('high') or short ('h') key names. Already-converted
+    BarArrays are returned unchanged, so callers can convert once upstream.
+    """
+    if isinstance(bars, BarArrays):
+        return bars
+
+    arr = None
+    if bars:
+        # Fast path: every bar uses one canonical key set, so a single C-level
+        # itemgetter replaces the chained .get() fallbacks
+        first = bars[0]
+        getter = None
+        if all(k in first for k in _LONG_KEYS):
+            getter = _GET_LONG
+        elif all(k in first for k in _SHORT_KEYS):
+            getter = _GET_SHORT
+
+        if getter is not None:
+            try:
+                arr = np.fromiter(map(getter, bars), dtype=_SOA_DTYPE, count=len(bars))
+            except (KeyError, TypeError, ValueError):
+                arr = None
+
+            # numpy reads None as NaN; re-extract so missing values become 0.0
+            if arr is not None and any(np.isnan(arr[f]).any() for f in 'ohlcv'):
+                arr = None
+
+    if arr is None:
+        arr = np.fromiter(map(_row_fallback, bars), dtype=_SOA_DTYPE, count=len(bars))
+
+    return BarArrays(
+        timestamp=np.ascontiguousarray(arr['t']),
+        open=np.ascontiguousarray(arr['o']),
+        high=np.ascontiguousarray(arr['h']),
+        low=np.ascontiguousarray(arr['l']),
+        close=np.ascontiguousarray(arr['c']),
+        volume=np.ascontiguousarray(arr['v']),
+    )
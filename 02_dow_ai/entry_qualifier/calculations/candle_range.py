@@ -7,7 +7,9 @@ Preserves dict-based return format for backward compatibility with data_worker.
 
 SWH-6: Single source of truth - shared.indicators
 """
-from typing import List
+from typing import Iterator, List, Tuple, Union
+
+import numpy as np
 
 from shared.indicators.core.candle_range import (
     calculate_candle_range_pct as _shared_candle_range_pct,
@@ -16,12 +18,19 @@ from shared.indicators.core.candle_range import (
 )
 from shared.indicators.config import CONFIG
 
+from calculations._utils import BarArrays, bars_to_soa
+
 
 # Re-export thresholds from canonical config (for backward compatibility)
 ABSORPTION_THRESHOLD = CONFIG.candle_range.absorption_threshold / 100  # 0.0012
 NORMAL_THRESHOLD = CONFIG.candle_range.normal_threshold / 100          # 0.0015
 HIGH_THRESHOLD = CONFIG.candle_range.high_threshold / 100              # 0.0020
 
+# Same thresholds in percentage units (matches candle_range_pct, no rescaling)
+ABSORPTION_PCT = CONFIG.candle_range.absorption_threshold  # 0.12
+NORMAL_PCT = CONFIG.candle_range.normal_threshold          # 0.15
+HIGH_PCT = CONFIG.candle_range.high_threshold              # 0.20
+
 
 def calculate_candle_range_pct(high: float, low: float, close: float) -> float:
     """
@@ -43,28 +52,50 @@ def is_absorption_zone(candle_range_pct: float) -> bool:
     return _shared_is_absorption(candle_range_pct)
 
 
-def calculate_all_candle_ranges(bars: List[dict]) -> List[dict]:
+def calculate_all_candle_ranges_arrays(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Calculate candle range percentage for all bars.
+    Vectorized candle range and absorption flag for all bars.
 
-    Args:
-        bars: List of bar dictionaries with h, l, c keys
+    Same formula as shared.indicators.core.candle_range._candle_range_pct_core
+    ((high - low) / close * 100, 0 where close <= 0), fused with the
+    absorption test so both arrays come out of one in-place pass.
 
     Returns:
-        List of dicts with 'candle_range_pct' and 'is_absorption' keys
+        Tuple of (candle_range_pct, is_absorption) numpy arrays
+    """
+    pct = np.subtract(highs, lows)
+    np.divide(pct, closes, out=pct, where=closes > 0)
+    pct[closes <= 0] = 0.0
+    pct *= 100.0
+    return pct, pct < ABSORPTION_PCT
+
+
+def iter_candle_ranges(bars: Union[List[dict], BarArrays]) -> Iterator[dict]:
     """
-    results = []
+    Yield candle range results one bar at a time.
 
-    for bar in bars:
-        high = bar.get('high', bar.get('h', 0))
-        low = bar.get('low', bar.get('l', 0))
-        close = bar.get('close', bar.get('c', 0))
+    Same values as calculate_all_candle_ranges, for consumers that stream
+    the results once instead of holding the full list.
+    """
+    soa = bars_to_soa(bars)
+    pct, absorb = calculate_all_candle_ranges_arrays(soa.high, soa.low, soa.close)
 
-        pct = calculate_candle_range_pct(high, low, close)
+    for p, a in zip(pct.tolist(), absorb.tolist()):
+        yield {'candle_range_pct': p, 'is_absorption': a}
 
-        results.append({
-            'candle_range_pct': pct,
-            'is_absorption': is_absorption_zone(pct)
-        })
 
-    return results
+def calculate_all_candle_ranges(bars: Union[List[dict], BarArrays]) -> List[dict]:
+    """
+    Calculate candle range percentage for all bars.
+
+    Args:
+        bars: List of bar dictionaries with h, l, c keys (or BarArrays)
+
+    Returns:
+        List of dicts with 'candle_range_pct' and 'is_absorption' keys
+    """
+    return list(iter_candle_ranges(bars))
@@ -8,13 +8,22 @@ for backward compatibility with data_worker.
 
 SWH-6: Single source of truth - shared.indicators
 """
-from typing import List, Optional, Dict, Any
+import time
+from bisect import bisect_right
+from typing import List, Optional, Dict, Any, Union
 from enum import Enum
-from datetime import datetime
+
+import numpy as np
 
 from shared.indicators.structure import calculate_structure_from_bars
+from shared.indicators.structure.market_structure import (
+    _detect_fractals_core as _shared_detect_fractals,
+    _get_structure_from_swings as _shared_structure_from_swings,
+)
 from shared.indicators.config import CONFIG
 
+from calculations._utils import BarArrays, bars_to_soa
+
 
 class MarketStructure(Enum):
     """Market structure states."""
@@ -29,94 +38,154 @@ _STRUCTURE_MAP = {
     "BEAR": MarketStructure.BEAR,
     "NEUTRAL": MarketStructure.NEUTRAL,
 }
+_STRUCTURE_BY_LABEL = _STRUCTURE_MAP.get
 
 
-def calculate_structure(bars: List[dict], lookback: int = 5) -> MarketStructure:
+def calculate_structure(
+    bars: Union[List[dict], BarArrays],
+    lookback: int = 5
+) -> MarketStructure:
     """
     Determine market structure from bars using canonical fractal-based detection.
 
-    Delegates to shared.indicators.structure.calculate_structure_from_bars.
+    Delegates to shared.indicators.structure.calculate_structure_from_bars
+    (or its numpy fractal core when given BarArrays).
 
     Args:
-        bars: List of bar dictionaries with 'high', 'low' keys
+        bars: List of bar dictionaries with 'high', 'low' keys (or BarArrays)
         lookback: Fractal length (bars each side for fractal detection)
 
     Returns:
         MarketStructure enum value
     """
+    if isinstance(bars, BarArrays):
+        return calculate_structure_from_arrays(bars.high, bars.low, lookback)
+
     if not bars or len(bars) < 2 * lookback + 1:
         return MarketStructure.NEUTRAL
 
     result = calculate_structure_from_bars(bars, length=lookback)
-    return _STRUCTURE_MAP.get(result.label, MarketStructure.NEUTRAL)
+    return _STRUCTURE_BY_LABEL(result.label, MarketStructure.NEUTRAL)
+
+
+def calculate_structure_from_arrays(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    lookback: int = 5
+) -> MarketStructure:
+    """
+    Determine market structure from high/low arrays.
+
+    Same result as calculate_structure on the equivalent bar list, without
+    re-extracting high/low from dicts.
+    """
+    if len(highs) < 2 * lookback + 1:
+        return MarketStructure.NEUTRAL
+
+    frac_highs, frac_lows = _shared_detect_fractals(highs, lows, lookback)
+    _, label, _, _ = _shared_structure_from_swings(
+        highs[frac_highs].tolist(), lows[frac_lows].tolist()
+    )
+    return _STRUCTURE_BY_LABEL(label, MarketStructure.NEUTRAL)
 
 
 def get_h1_bar_for_timestamp(
     h1_bars: List[dict],
-    m1_timestamp: int
+    m1_timestamp: int,
+    h1_timestamps: Optional[Union[List[int], np.ndarray]] = None
 ) -> Optional[dict]:
     """
     Find the H1 bar that contains a given M1 timestamp.
 
     Args:
-        h1_bars: List of H1 bars with 'timestamp' key (milliseconds)
+        h1_bars: List of H1 bars with 'timestamp' key (milliseconds),
+                 sorted ascending
         m1_timestamp: M1 bar timestamp in milliseconds
+        h1_timestamps: Optional precomputed H1 timestamps, e.g. from
+                       H1StructureCache.get_ts_arr (for repeated lookups)
 
     Returns:
-        The H1 bar dict, or None if not found
+        The H1 bar dict, or the last H1 bar if none contains the timestamp
+        (None if h1_bars is empty)
     """
     if not h1_bars:
         return None
 
     hour_ms = 3600000
 
-    for h1_bar in reversed(h1_bars):
-        h1_ts = h1_bar.get('timestamp', 0)
-        if h1_ts <= m1_timestamp < h1_ts + hour_ms:
-            return h1_bar
+    if h1_timestamps is None:
+        h1_timestamps = [b.get('timestamp', 0) for b in h1_bars]
 
-    return h1_bars[-1] if h1_bars else None
+    if isinstance(h1_timestamps, np.ndarray):
+        idx = int(np.searchsorted(h1_timestamps, m1_timestamp, side='right')) - 1
+    else:
+        idx = bisect_right(h1_timestamps, m1_timestamp) - 1
+
+    if idx >= 0 and m1_timestamp < h1_timestamps[idx] + hour_ms:
+        return h1_bars[idx]
+
+    return h1_bars[-1]
 
 
 def calculate_structure_for_bars(
-    h1_bars: List[dict],
-    m1_bars: List[dict],
+    h1_bars: Union[List[dict], BarArrays],
+    m1_bars: Union[List[dict], BarArrays],
     lookback: int = 5
 ) -> List[dict]:
     """
     Calculate HTF structure for each M1 bar using canonical fractal detection.
 
     For each M1 bar, finds HTF bars up to that point and calculates
-    the structure based on fractal swing analysis.
+    the structure based on fractal swing analysis. The structure is
+    computed once per distinct HTF prefix and reused for the M1 bars
+    that fall within it.
 
     Args:
-        h1_bars: List of HTF bar dictionaries
-        m1_bars: List of M1 bar dictionaries with 'timestamp' key
+        h1_bars: List of HTF bar dictionaries, sorted ascending by timestamp
+                 (or cached BarArrays from StructureCache.get_bars_soa)
+        m1_bars: List of M1 bar dictionaries with 'timestamp' key (or BarArrays)
         lookback: Fractal length (bars each side)
 
     Returns:
         List of dicts with 'h1_structure' and 'h1_display' keys for each M1 bar
     """
-    results = []
+    if isinstance(m1_bars, BarArrays):
+        m1_timestamps = m1_bars.timestamp
+    else:
+        m1_timestamps = np.fromiter(
+            (b.get('timestamp', 0) for b in m1_bars), dtype=np.int64, count=len(m1_bars)
+        )
 
-    if not h1_bars:
-        return [{'h1_structure': MarketStructure.NEUTRAL, 'h1_display': 'N'}
-                for _ in m1_bars]
+    h1_soa = bars_to_soa(h1_bars) if h1_bars is not None else None
 
-    for m1_bar in m1_bars:
-        m1_ts = m1_bar.get('timestamp', 0)
+    if h1_soa is None or len(h1_soa.timestamp) == 0:
+        return [{'h1_structure': MarketStructure.NEUTRAL, 'h1_display': 'N'}
+                for _ in range(len(m1_timestamps))]
 
-        # Find HTF bars up to this M1 timestamp
-        relevant_bars = [b for b in h1_bars if b.get('timestamp', 0) <= m1_ts]
+    # Number of HTF bars at or before each M1 timestamp, in one vectorized search
+    prefix_lengths = np.searchsorted(h1_soa.timestamp, m1_timestamps, side='right')
 
-        if len(relevant_bars) >= 2 * lookback + 1:
-            structure = calculate_structure(relevant_bars, lookback)
-        else:
-            structure = MarketStructure.NEUTRAL
+    # M1 bars within the same HTF bar share the same prefix, so the
+    # structure is only recomputed when the prefix length changes
+    results = []
+    last_idx = -1
+    structure = MarketStructure.NEUTRAL
+    display = structure.value
+
+    for idx in prefix_lengths.tolist():
+        if idx != last_idx:
+            if idx >= 2 * lookback + 1:
+                structure = calculate_structure_from_arrays(
+                    h1_soa.high[:idx], h1_soa.low[:idx], lookback
+                )
+            else:
+                structure = MarketStructure.NEUTRAL
+            display = structure.value
+            last_idx = idx
 
         results.append({
             'h1_structure': structure,
-            'h1_display': structure.value
+            'h1_display': display
         })
 
     return results
@@ -140,21 +209,38 @@ class StructureCache:
             return self._cache[ticker].get('bars')
         return None
 
+    def get_bars_soa(self, ticker: str) -> Optional[BarArrays]:
+        """Get cached bars for a ticker as numpy columns."""
+        if ticker in self._cache:
+            return self._cache[ticker].get('soa')
+        return None
+
+    def get_ts_arr(self, ticker: str) -> Optional[np.ndarray]:
+        """Get cached bar timestamps (int64 ms) for a ticker."""
+        soa = self.get_bars_soa(ticker)
+        return soa.timestamp if soa is not None else None
+
     def set_bars(self, ticker: str, bars: List[dict]):
-        """Cache bars for a ticker."""
+        """Cache bars (and their numpy columns) for a ticker."""
         last_bar_ts = bars[-1].get('timestamp', 0) if bars else 0
         self._cache[ticker] = {
             'bars': bars,
-            'last_update': datetime.now(),
+            'soa': bars_to_soa(bars),
+            'last_update': time.monotonic(),  # monotonic seconds (age checks only)
             'last_bar_ts': last_bar_ts
         }
 
     def needs_refresh(self, ticker: str, current_bar_ts: int) -> bool:
-        """Check if data needs to be refreshed."""
+        """
+        Check if data needs to be refreshed.
+
+        Only a timestamp in a later timeframe bucket than the cached last bar
+        triggers a refresh; M1 ticks within the same bar reuse the cache.
+        """
         if ticker not in self._cache:
             return True
         cached_ts = self._cache[ticker].get('last_bar_ts', 0)
-        return current_bar_ts > cached_ts
+        return current_bar_ts // self.timeframe_ms > cached_ts // self.timeframe_ms
 
     def clear(self, ticker: str = None):
         """Clear cache for a ticker or all tickers."""
@@ -170,6 +256,8 @@ class H1StructureCache:
     H1 data is fetched on initial load and refreshed hourly.
     """
 
+    HOUR_MS = 3_600_000
+
     def __init__(self):
         self._cache: Dict[str, Dict[str, Any]] = {}
 
@@ -179,21 +267,33 @@ class H1StructureCache:
             return self._cache[ticker].get('bars')
         return None
 
+    def get_bars_soa(self, ticker: str) -> Optional[BarArrays]:
+        """Get cached H1 bars for a ticker as numpy columns."""
+        if ticker in self._cache:
+            return self._cache[ticker].get('soa')
+        return None
+
+    def get_ts_arr(self, ticker: str) -> Optional[np.ndarray]:
+        """Get cached bar timestamps (int64 ms) for a ticker."""
+        soa = self.get_bars_soa(ticker)
+        return soa.timestamp if soa is not None else None
+
     def set_bars(self, ticker: str, bars: List[dict]):
-        """Cache H1 bars for a ticker."""
+        """Cache H1 bars (and their numpy columns) for a ticker."""
         last_h1_ts = bars[-1].get('timestamp', 0) if bars else 0
         self._cache[ticker] = {
             'bars': bars,
-            'last_update': datetime.now(),
+            'soa': bars_to_soa(bars),
+            'last_update': time.monotonic(),  # monotonic seconds (age checks only)
             'last_h1_ts': last_h1_ts
         }
 
     def needs_refresh(self, ticker: str, current_h1_ts: int) -> bool:
-        """Check if H1 data needs to be refreshed."""
+        """Check if H1 data needs to be refreshed (a new hour has started)."""
         if ticker not in self._cache:
             return True
         cached_ts = self._cache[ticker].get('last_h1_ts', 0)
-        return current_h1_ts > cached_ts
+        return current_h1_ts // self.HOUR_MS > cached_ts // self.HOUR_MS
 
     def clear(self, ticker: str = None):
         """Clear cache for a ticker or all tickers."""
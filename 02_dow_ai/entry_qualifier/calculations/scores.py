@@ -4,9 +4,14 @@ Scoring system has been deprecated per SWH-6.
 This module is retained as a placeholder to prevent import errors.
 LONG/SHORT composite scores were replaced by multi-timeframe fractal structure.
 """
+from types import MappingProxyType
 from typing import Optional, Any
 
 
+# Shared read-only zero score, repeated by reference instead of allocated per bar
+_ZERO_SCORES = MappingProxyType({'long_score': 0, 'short_score': 0})
+
+
 def calculate_long_score(*args, **kwargs) -> int:
     """DEPRECATED: Always returns 0."""
     return 0
@@ -18,5 +23,5 @@ def calculate_short_score(*args, **kwargs) -> int:
 
 
 def calculate_all_scores(bars: list) -> list:
-    """DEPRECATED: Returns zero scores for all bars."""
-    return [{'long_score': 0, 'short_score': 0} for _ in bars]
+    """DEPRECATED: Returns the same read-only zero score mapping for all bars."""
+    return [_ZERO_SCORES] * len(bars)
@@ -7,9 +7,11 @@ Preserves dict-based return format + enum types for backward compatibility.
 
 SWH-6: Single source of truth - shared.indicators
 """
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, Union
 from enum import Enum
 
+import numpy as np
+
 from shared.indicators.core.sma import (
     calculate_sma as _shared_calc_sma,
     calculate_sma_spread_pct as _shared_spread_pct,
@@ -18,6 +20,9 @@ from shared.indicators.core.sma import (
     is_wide_spread as _shared_is_wide,
 )
 from shared.indicators.config import CONFIG
+from shared.indicators._utils import njit, NUMBA_AVAILABLE
+
+from calculations._utils import BarArrays, bars_to_soa
 
 
 class SMAConfig(Enum):
@@ -42,6 +47,10 @@ WIDE_SPREAD_THRESHOLD = CONFIG.sma.wide_spread_threshold  # 0.15
 _CONFIG_MAP = {"BULL": SMAConfig.BULLISH, "BEAR": SMAConfig.BEARISH, "FLAT": SMAConfig.NEUTRAL}
 _POSITION_MAP = {"ABOVE": PricePosition.ABOVE_BOTH, "BELOW": PricePosition.BELOW_BOTH, "BTWN": PricePosition.BETWEEN}
 
+# Bound lookups for the per-bar loop (skips the attribute load on each call)
+_CONFIG_BY_LABEL = _CONFIG_MAP.get
+_POSITION_BY_LABEL = _POSITION_MAP.get
+
 
 def calculate_sma(prices: List[float], period: int) -> Optional[float]:
     """Calculate Simple Moving Average."""
@@ -57,14 +66,12 @@ def calculate_sma_spread_pct(sma9: float, sma21: float, price: float) -> float:
 
 def get_sma_config(sma9: float, sma21: float) -> SMAConfig:
     """Determine SMA configuration. Returns SMAConfig enum."""
-    label = _shared_sma_config(sma9, sma21)
-    return _CONFIG_MAP.get(label, SMAConfig.NEUTRAL)
+    return _CONFIG_BY_LABEL(_shared_sma_config(sma9, sma21), SMAConfig.NEUTRAL)
 
 
 def get_price_position(price: float, sma9: float, sma21: float) -> PricePosition:
     """Determine price position relative to SMAs. Returns PricePosition enum."""
-    label = _shared_price_position(price, sma9, sma21)
-    return _POSITION_MAP.get(label, PricePosition.BETWEEN)
+    return _POSITION_BY_LABEL(_shared_price_position(price, sma9, sma21), PricePosition.BETWEEN)
 
 
 def is_wide_spread(spread_pct: float) -> bool:
@@ -77,8 +84,131 @@ def format_sma_display(config: SMAConfig, spread_pct: float) -> str:
     return f"{config.value} {spread_pct:.2f}%"
 
 
+@njit(cache=True)
+def _sma9_21(closes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Specialized SMA9/SMA21 kernel for the default periods (numba-compiled).
+
+    Fixed window sizes let both running sums stay in registers. Output
+    matches calculate_all_sma_configs_arrays(closes, 9, 21).
+    """
+    n = closes.shape[0]
+    sma9 = np.full(n, np.nan)
+    sma21 = np.full(n, np.nan)
+    sum9 = 0.0
+    sum21 = 0.0
+
+    for i in range(n):
+        close = closes[i]
+        sum9 += close
+        if i >= 9:
+            sum9 -= closes[i - 9]
+        sum21 += close
+        if i >= 21:
+            sum21 -= closes[i - 21]
+
+        if i >= 20:
+            sma9[i] = sum9 / 9.0
+            sma21[i] = sum21 / 21.0
+
+    return sma9, sma21
+
+
+def calculate_all_sma_configs_arrays(
+    closes: np.ndarray,
+    sma_short: int = 9,
+    sma_long: int = 21
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate short and long SMA series from one shared prefix sum.
+
+    Each SMA is a difference of the same np.cumsum array, so both series
+    come from a single pass over the closes.
+
+    Returns:
+        Tuple of (sma_short, sma_long) numpy arrays, NaN until both SMAs
+        have a full window
+    """
+    if NUMBA_AVAILABLE and sma_short == 9 and sma_long == 21:
+        return _sma9_21(np.ascontiguousarray(closes, dtype=np.float64))
+
+    n = len(closes)
+    short_out = np.full(n, np.nan)
+    long_out = np.full(n, np.nan)
+    first_valid = max(sma_short, sma_long) - 1
+
+    if n <= first_valid:
+        return short_out, long_out
+
+    cumsum = np.concatenate(([0.0], np.cumsum(closes, dtype=np.float64)))
+    end = np.arange(first_valid + 1, n + 1)
+    short_out[first_valid:] = (cumsum[end] - cumsum[end - sma_short]) / sma_short
+    long_out[first_valid:] = (cumsum[end] - cumsum[end - sma_long]) / sma_long
+
+    return short_out, long_out
+
+
+# Enum lookup by np.sign(sma9 - sma21): index 0 = equal, 1 = above, -1 = below
+_CONFIG_BY_SIGN = (SMAConfig.NEUTRAL, SMAConfig.BULLISH, SMAConfig.BEARISH)
+# Enum lookup by position code: 0 = above both, 1 = between, 2 = below both
+_POSITION_BY_CODE = (PricePosition.ABOVE_BOTH, PricePosition.BETWEEN, PricePosition.BELOW_BOTH)
+
+
+def iter_sma_configs(
+    bars: Union[List[dict], BarArrays],
+    sma_short: int = 9,
+    sma_long: int = 21
+) -> Iterator[dict]:
+    """
+    Yield SMA configuration results one bar at a time.
+
+    Same values as calculate_all_sma_configs, for consumers that stream
+    the results once instead of holding the full list. Spread, config and
+    price position are computed as array operations before the dict build.
+    """
+    soa = bars_to_soa(bars)
+    short_arr, long_arr = calculate_all_sma_configs_arrays(soa.close, sma_short, sma_long)
+    first_valid = min(max(sma_short, sma_long) - 1, len(soa.close))
+
+    for _ in range(first_valid):
+        yield {
+            'sma9': None,
+            'sma21': None,
+            'sma_config': None,
+            'sma_spread_pct': None,
+            'price_position': None,
+            'sma_display': None
+        }
+
+    closes = soa.close[first_valid:]
+    sma9 = short_arr[first_valid:]
+    sma21 = long_arr[first_valid:]
+
+    safe_close = np.where(closes > 0, closes, 1.0)
+    spread_pct = np.where(closes > 0, np.abs(sma9 - sma21) / safe_close * 100, 0.0)
+    config_sign = np.sign(sma9 - sma21).astype(np.int8)
+    position_code = np.where(
+        closes > np.maximum(sma9, sma21), 0,
+        np.where(closes < np.minimum(sma9, sma21), 2, 1)
+    )
+
+    for s9, s21, spread, sign, code in zip(
+        sma9.tolist(), sma21.tolist(), spread_pct.tolist(),
+        config_sign.tolist(), position_code.tolist()
+    ):
+        config = _CONFIG_BY_SIGN[sign]
+        yield {
+            'sma9': s9,
+            'sma21': s21,
+            'sma_config': config,
+            'sma_spread_pct': spread,
+            'price_position': _POSITION_BY_CODE[code],
+            'sma_display': f"{config.value} {spread:.2f}%"
+        }
+
+
 def calculate_all_sma_configs(
-    bars: List[dict],
+    bars: Union[List[dict], BarArrays],
     sma_short: int = 9,
     sma_long: int = 21
 ) -> List[dict]:
@@ -86,55 +216,11 @@ def calculate_all_sma_configs(
     Calculate SMA configuration for all bars.
 
     Args:
-        bars: List of bar dictionaries with 'close' or 'c' key
+        bars: List of bar dictionaries with 'close' or 'c' key (or BarArrays)
         sma_short: Short SMA period (default 9)
         sma_long: Long SMA period (default 21)
 
     Returns:
         List of dicts with SMA-related values
     """
-    results = []
-    closes = []
-
-    for i, bar in enumerate(bars):
-        close = bar.get('close', bar.get('c', 0))
-        closes.append(close)
-
-        if i < sma_long - 1:
-            results.append({
-                'sma9': None,
-                'sma21': None,
-                'sma_config': None,
-                'sma_spread_pct': None,
-                'price_position': None,
-                'sma_display': None
-            })
-        else:
-            sma9 = calculate_sma(closes, sma_short)
-            sma21 = calculate_sma(closes, sma_long)
-
-            if sma9 is not None and sma21 is not None:
-                config = get_sma_config(sma9, sma21)
-                spread_pct = calculate_sma_spread_pct(sma9, sma21, close)
-                position = get_price_position(close, sma9, sma21)
-                display = format_sma_display(config, spread_pct)
-
-                results.append({
-                    'sma9': sma9,
-                    'sma21': sma21,
-                    'sma_config': config,
-                    'sma_spread_pct': spread_pct,
-                    'price_position': position,
-                    'sma_display': display
-                })
-            else:
-                results.append({
-                    'sma9': None,
-                    'sma21': None,
-                    'sma_config': None,
-                    'sma_spread_pct': None,
-                    'price_position': None,
-                    'sma_display': None
-                })
-
-    return results
+    return list(iter_sma_configs(bars, sma_short, sma_long))
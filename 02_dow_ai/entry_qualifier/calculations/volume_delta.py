@@ -7,12 +7,17 @@ Preserves dict-based return format for backward compatibility with data_worker.
 
 SWH-6: Single source of truth - shared.indicators
 """
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 
 from shared.indicators.core.volume_delta import (
+    _bar_delta_core_with_open as _shared_bar_delta_core,
     calculate_bar_delta as _shared_bar_delta,
 )
 
+from calculations._utils import BarArrays, bars_to_soa
+
 
 def calculate_bar_delta(
     open_price: float,
@@ -53,38 +58,78 @@ def calculate_rolling_delta(
     return sum(raw_deltas[-period:])
 
 
+def calculate_rolling_delta_array(
+    raw_deltas: np.ndarray,
+    period: int = 5
+) -> np.ndarray:
+    """
+    Calculate rolling sum of bar deltas for a whole series.
+
+    Returns:
+        numpy array aligned with input (NaN where insufficient data)
+    """
+    raw_deltas = np.asarray(raw_deltas, dtype=np.float64)
+    result = np.full(len(raw_deltas), np.nan)
+
+    if len(raw_deltas) >= period:
+        result[period - 1:] = np.convolve(raw_deltas, np.ones(period), mode='valid')
+
+    return result
+
+
+def calculate_all_deltas_arrays(
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    volumes: np.ndarray,
+    roll_period: int = 5
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized raw and rolling deltas for all bars.
+
+    Delegates to shared.indicators.core.volume_delta._bar_delta_core_with_open.
+
+    Returns:
+        Tuple of (raw_delta, roll_delta) numpy arrays (roll_delta NaN where
+        insufficient data)
+    """
+    # Volume is truncated to int to match calculate_bar_delta
+    raw = _shared_bar_delta_core(opens, highs, lows, closes, np.trunc(volumes))
+    return raw, calculate_rolling_delta_array(raw, roll_period)
+
+
+def iter_deltas(
+    bars: Union[List[dict], BarArrays],
+    roll_period: int = 5
+) -> Iterator[dict]:
+    """
+    Yield raw and rolling deltas one bar at a time.
+
+    Same values as calculate_all_deltas, for consumers that stream the
+    results once instead of holding the full list.
+    """
+    soa = bars_to_soa(bars)
+    raw, roll = calculate_all_deltas_arrays(
+        soa.open, soa.high, soa.low, soa.close, soa.volume, roll_period
+    )
+
+    for i, (d, r) in enumerate(zip(raw.tolist(), roll.tolist())):
+        yield {'raw_delta': d, 'roll_delta': None if i < roll_period - 1 else r}
+
+
 def calculate_all_deltas(
-    bars: List[dict],
+    bars: Union[List[dict], BarArrays],
     roll_period: int = 5
 ) -> List[dict]:
     """
     Calculate raw and rolling deltas for all bars.
 
     Args:
-        bars: List of bar dictionaries with o, h, l, c, v keys
+        bars: List of bar dictionaries with o, h, l, c, v keys (or BarArrays)
         roll_period: Period for rolling delta calculation
 
     Returns:
         List of dicts with 'raw_delta' and 'roll_delta' keys
     """
-    results = []
-    raw_deltas = []
-
-    for bar in bars:
-        raw_delta = calculate_bar_delta(
-            open_price=bar.get('open', bar.get('o', 0)),
-            high=bar.get('high', bar.get('h', 0)),
-            low=bar.get('low', bar.get('l', 0)),
-            close=bar.get('close', bar.get('c', 0)),
-            volume=bar.get('volume', bar.get('v', 0))
-        )
-        raw_deltas.append(raw_delta)
-
-        roll_delta = calculate_rolling_delta(raw_deltas, roll_period)
-
-        results.append({
-            'raw_delta': raw_delta,
-            'roll_delta': roll_delta
-        })
-
-    return results
+    return list(iter_deltas(bars, roll_period))
@@ -7,7 +7,9 @@ Preserves dict-based return format for backward compatibility with data_worker.
 
 SWH-6: Single source of truth - shared.indicators
 """
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 
 from shared.indicators.core.volume_roc import (
     is_elevated_volume as _shared_is_elevated,
@@ -15,8 +17,11 @@ from shared.indicators.core.volume_roc import (
 )
 from shared.indicators.config import CONFIG
 
+from calculations._utils import BarArrays, bars_to_soa
+
 
-# Re-export thresholds from canonical config
+# Re-export thresholds from canonical config (percentage units, same as volume_roc;
+# resolved once at import so the vectorized path compares against plain floats)
 DEFAULT_LOOKBACK = CONFIG.volume_roc.baseline_period       # 20
 ELEVATED_THRESHOLD = CONFIG.volume_roc.elevated_threshold  # 30
 HIGH_THRESHOLD = CONFIG.volume_roc.high_threshold          # 50
@@ -50,42 +55,65 @@ def is_high_volume(volume_roc: float) -> bool:
     return _shared_is_high(volume_roc)
 
 
+def calculate_all_volume_roc_arrays(
+    volumes: np.ndarray,
+    lookback: int = DEFAULT_LOOKBACK
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized volume ROC for all bars.
+
+    Returns:
+        Tuple of (volume_roc, is_elevated) numpy arrays. volume_roc is NaN
+        for the first 'lookback' bars, where is_elevated is False.
+    """
+    n = len(volumes)
+    roc = np.full(n, np.nan)
+    elevated = np.zeros(n, dtype=bool)
+
+    if n <= lookback:
+        return roc, elevated
+
+    # Average of previous 'lookback' bars (not including current) via prefix sums
+    cumsum = np.concatenate(([0.0], np.cumsum(volumes)))
+    avg = (cumsum[lookback:n] - cumsum[:n - lookback]) / lookback
+    current = volumes[lookback:]
+
+    safe_avg = np.where(avg > 0, avg, 1.0)
+    roc[lookback:] = np.where(avg > 0, (current - avg) / safe_avg * 100, 0.0)
+    elevated[lookback:] = roc[lookback:] >= ELEVATED_THRESHOLD
+
+    return roc, elevated
+
+
+def iter_volume_roc(
+    bars: Union[List[dict], BarArrays],
+    lookback: int = DEFAULT_LOOKBACK
+) -> Iterator[dict]:
+    """
+    Yield volume ROC results one bar at a time.
+
+    Same values as calculate_all_volume_roc, for consumers that stream
+    the results once instead of holding the full list.
+    """
+    soa = bars_to_soa(bars)
+    roc, elevated = calculate_all_volume_roc_arrays(soa.volume, lookback)
+
+    for i, (r, e) in enumerate(zip(roc.tolist(), elevated.tolist())):
+        yield {'volume_roc': None if i < lookback else r, 'is_elevated': e}
+
+
 def calculate_all_volume_roc(
-    bars: List[dict],
+    bars: Union[List[dict], BarArrays],
     lookback: int = DEFAULT_LOOKBACK
 ) -> List[dict]:
     """
     Calculate volume ROC for all bars.
 
     Args:
-        bars: List of bar dictionaries with 'volume' or 'v' key
+        bars: List of bar dictionaries with 'volume' or 'v' key (or BarArrays)
         lookback: Lookback period for average calculation
 
     Returns:
         List of dicts with 'volume_roc' and 'is_elevated' keys
     """
-    results = []
-    volumes = []
-
-    for i, bar in enumerate(bars):
-        volume = bar.get('volume', bar.get('v', 0))
-        volumes.append(volume)
-
-        if i < lookback:
-            results.append({
-                'volume_roc': None,
-                'is_elevated': False
-            })
-        else:
-            # Average of previous 'lookback' bars (not including current)
-            prev_volumes = volumes[i - lookback:i]
-            avg_volume = sum(prev_volumes) / lookback
-
-            volume_roc = calculate_volume_roc(volume, avg_volume)
-
-            results.append({
-                'volume_roc': volume_roc,
-                'is_elevated': is_elevated_volume(volume_roc)
-            })
-
-    return results
+    return list(iter_volume_roc(bars, lookback))
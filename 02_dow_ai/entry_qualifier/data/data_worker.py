@@ -19,10 +19,11 @@ from PyQt6.QtCore import QThread, pyqtSignal
 from typing import Dict, List, Any
 
 from data.api_client import PolygonClient
-from calculations.volume_delta import calculate_all_deltas
-from calculations.candle_range import calculate_all_candle_ranges
-from calculations.volume_roc import calculate_all_volume_roc
-from calculations.sma_config import calculate_all_sma_configs
+from calculations._utils import bars_to_soa
+from calculations.volume_delta import iter_deltas
+from calculations.candle_range import iter_candle_ranges
+from calculations.volume_roc import iter_volume_roc
+from calculations.sma_config import iter_sma_configs
 from calculations.h1_structure import (
     calculate_structure_for_bars,
     H1StructureCache,
@@ -110,17 +111,21 @@ class DataWorker(QThread):
             self.error_occurred.emit(ticker, "No data available")
             return
 
+        # Convert bars to numpy columns once for all calculations
+        bar_arrays = bars_to_soa(bars)
+
+        # Per-bar calculations are streamed (consumed once by the zip below)
         # Calculate deltas
-        delta_results = calculate_all_deltas(bars, roll_period=VOL_DELTA_ROLL_PERIOD)
+        delta_results = iter_deltas(bar_arrays, roll_period=VOL_DELTA_ROLL_PERIOD)
 
         # Calculate candle ranges
-        range_results = calculate_all_candle_ranges(bars)
+        range_results = iter_candle_ranges(bar_arrays)
 
         # Calculate volume ROC
-        vol_roc_results = calculate_all_volume_roc(bars, lookback=VOL_ROC_LOOKBACK)
+        vol_roc_results = iter_volume_roc(bar_arrays, lookback=VOL_ROC_LOOKBACK)
 
         # Calculate SMA configurations
-        sma_results = calculate_all_sma_configs(bars)
+        sma_results = iter_sma_configs(bar_arrays)
 
         # Fetch/use cached structure bars and calculate structure for each timeframe
         h1_results = self._get_h1_structure(ticker, bars)
@@ -197,7 +202,7 @@ class DataWorker(QThread):
                         for _ in m1_bars]
 
         # Calculate structure for each M1 bar
-        return calculate_structure_for_bars(h1_bars, m1_bars)
+        return calculate_structure_for_bars(_h1_cache.get_bars_soa(ticker), m1_bars)
 
     def _get_m5_structure(self, ticker: str, m1_bars: List[dict]) -> List[dict]:
         """
@@ -231,7 +236,7 @@ class DataWorker(QThread):
                 return [{'h1_structure': MarketStructure.NEUTRAL, 'h1_display': 'N'}
                         for _ in m1_bars]
 
-        return calculate_structure_for_bars(m5_bars, m1_bars)
+        return calculate_structure_for_bars(_m5_cache.get_bars_soa(ticker), m1_bars)
 
     def _get_m15_structure(self, ticker: str, m1_bars: List[dict]) -> List[dict]:
         """
@@ -265,7 +270,7 @@ class DataWorker(QThread):
                 return [{'h1_structure': MarketStructure.NEUTRAL, 'h1_display': 'N'}
                         for _ in m1_bars]
 
-        return calculate_structure_for_bars(m15_bars, m1_bars)
+        return calculate_structure_for_bars(_m15_cache.get_bars_soa(ticker), m1_bars)
 
     def set_force_h1_refresh(self, force: bool = True):
         """Set flag to force H1 data refresh on next fetch."""
@@ -34,14 +34,18 @@ Version: 1.0.0
 import psycopg2
 from psycopg2.extras import execute_values
 import numpy as np
+import functools
+import hashlib
+import multiprocessing
 from datetime import datetime, date, time, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple, Union
 from dataclasses import dataclass
 from decimal import Decimal
 import logging
 
 from config import (
-    DB_CONFIG, EOD_CUTOFF, R_LEVELS, SOURCE_TABLES, TARGET_TABLE
+    DB_CONFIG, EOD_CUTOFF, R_LEVELS, SOURCE_TABLES, TARGET_TABLE,
+    M1_DAY_CACHE_SIZE, INSERT_PAGE_SIZE
 )
 
 
@@ -129,6 +133,75 @@ def _truncate_to_m1_candle(time_val) -> Optional[time]:
 # DATA STRUCTURES
 # =============================================================================
 
+class M1DayBars(NamedTuple):
+    """Read-only M1 bar arrays for one ticker-date, sorted by bar time."""
+    minutes: np.ndarray             # minutes from midnight
+    bar_time: Tuple[time, ...]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
+def _m1_day_bars(m1_bars: List[Dict[str, Any]]) -> M1DayBars:
+    """
+    Convert M1 bar dicts to M1DayBars.
+
+    Bars without a parseable bar_time are dropped; the rest are stably
+    sorted by time. Missing prices become 0.0, as with _safe_float.
+    """
+    rows = []
+    for bar in m1_bars:
+        minutes = _time_to_minutes(bar.get('bar_time'))
+        if minutes is not None:
+            rows.append((minutes, bar))
+    rows.sort(key=lambda row: row[0])
+
+    def column(values) -> np.ndarray:
+        arr = np.array(values, dtype=np.float64)
+        arr.setflags(write=False)
+        return arr
+
+    bars = [bar for _, bar in rows]
+    return M1DayBars(
+        minutes=column([minutes for minutes, _ in rows]),
+        bar_time=tuple(_timedelta_to_time(b.get('bar_time')) for b in bars),
+        open=column([_safe_float(b.get('open')) for b in bars]),
+        high=column([_safe_float(b.get('high')) for b in bars]),
+        low=column([_safe_float(b.get('low')) for b in bars]),
+        close=column([_safe_float(b.get('close')) for b in bars]),
+        volume=column([_safe_float(b.get('volume')) for b in bars]),
+    )
+
+
+def _trade_input_hash(
+    trade: Dict[str, Any],
+    m1_atr_value: float,
+    day: M1DayBars
+) -> bytes:
+    """
+    SHA-256 of every input calculate_single_trade reads for a trade.
+
+    Covers the trade fields, the entry-candle ATR, the R-level/EOD config and
+    the M1 bars from entry to EOD, so a matching stored hash means the stored
+    result would be recalculated unchanged.
+    """
+    entry_time = _timedelta_to_time(trade['entry_time']) or trade['entry_time']
+    entry_minutes = _time_to_minutes(entry_time)
+    start = int(np.searchsorted(day.minutes, entry_minutes, side='right'))
+    end = int(np.searchsorted(day.minutes, _time_to_minutes(EOD_CUTOFF), side='right'))
+
+    digest = hashlib.sha256(
+        f"{trade['ticker']}|{trade['date']}|{entry_time}|"
+        f"{_safe_float(trade['entry_price'])!r}|{trade['direction']}|"
+        f"{m1_atr_value!r}|{EOD_CUTOFF}|{tuple(R_LEVELS)}".encode()
+    )
+    for column in (day.minutes, day.high, day.low, day.close):
+        digest.update(np.ascontiguousarray(column[start:end]).tobytes())
+    return digest.digest()
+
+
 @dataclass
 class M1AtrStopResult:
     """Result of M1 ATR Stop calculation for a single trade."""
@@ -188,6 +261,9 @@ class M1AtrStopResult:
     max_r: int = -1          # -1 = LOSS, 1-5 = highest R-level hit before stop
     result: str = 'LOSS'
 
+    # Skip detection (see _trade_input_hash)
+    input_hash: Optional[bytes] = None
+
 
 # =============================================================================
 # CALCULATOR CLASS
@@ -213,6 +289,10 @@ class M1AtrStopCalculator:
             'trades_processed': 0,
             'trades_skipped': 0,
             'records_created': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'hash_hits': 0,
+            'hash_misses': 0,
             'errors': []
         }
 
@@ -226,11 +306,32 @@ class M1AtrStopCalculator:
     # DATABASE OPERATIONS
     # =========================================================================
 
-    def get_trades_needing_calculation(self, conn, limit: int = None) -> List[Dict[str, Any]]:
+    def get_trades_needing_calculation(
+        self,
+        conn,
+        limit: int = None,
+        recheck: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Query trades_2 for trades not yet processed in m1_atr_stop_2.
         Requires entry_time and entry_price to be populated.
+
+        With recheck=True, already-processed trades are returned as well,
+        with their stored input_hash as 'stored_hash' (None for new trades).
         """
+        if recheck:
+            stored_hash = "r.input_hash AS stored_hash"
+            target_filter = f"LEFT JOIN {TARGET_TABLE} r ON r.trade_id = t.trade_id"
+            exists_filter = ""
+        else:
+            stored_hash = "NULL AS stored_hash"
+            target_filter = ""
+            exists_filter = f"""
+              AND NOT EXISTS (
+                  SELECT 1 FROM {TARGET_TABLE} r
+                  WHERE r.trade_id = t.trade_id
+              )"""
+
         query = f"""
             SELECT
                 t.trade_id,
@@ -240,14 +341,12 @@ class M1AtrStopCalculator:
                 t.model,
                 t.zone_type,
                 t.entry_time,
-                t.entry_price
+                t.entry_price,
+                {stored_hash}
             FROM {SOURCE_TABLES['trades']} t
+            {target_filter}
             WHERE t.entry_time IS NOT NULL
-              AND t.entry_price IS NOT NULL
-              AND NOT EXISTS (
-                  SELECT 1 FROM {TARGET_TABLE} r
-                  WHERE r.trade_id = t.trade_id
-              )
+              AND t.entry_price IS NOT NULL{exists_filter}
             ORDER BY t.date, t.ticker, t.entry_time
         """
 
@@ -259,41 +358,38 @@ class M1AtrStopCalculator:
             columns = [desc[0] for desc in cur.description]
             rows = cur.fetchall()
 
-        return [dict(zip(columns, row)) for row in rows]
+        trades = [dict(zip(columns, row)) for row in rows]
+        # BYTEA arrives as memoryview, which can't be pickled to pool workers
+        for trade in trades:
+            if trade['stored_hash'] is not None:
+                trade['stored_hash'] = bytes(trade['stored_hash'])
+        return trades
 
-    def get_m1_atr_at_entry(
+    def get_m1_atr_for_day(
         self,
         conn,
         ticker: str,
-        trade_date: date,
-        m1_candle_time: time
-    ) -> Optional[float]:
+        trade_date: date
+    ) -> Dict[time, Optional[float]]:
         """
-        Fetch pre-computed atr_m1 from m1_indicator_bars_2 at the adjusted entry candle.
+        Fetch all pre-computed atr_m1 values for a ticker/date, keyed by bar_time.
 
-        Args:
-            conn: Database connection
-            ticker: Stock symbol
-            trade_date: Trading date
-            m1_candle_time: M1 candle time (seconds truncated)
-
-        Returns:
-            atr_m1 value or None if not available
+        One query per ticker-date; trades look up their entry candle in the result.
         """
         query = f"""
-            SELECT atr_m1
+            SELECT bar_time, atr_m1
             FROM {SOURCE_TABLES['m1_indicator_bars']}
-            WHERE ticker = %s AND bar_date = %s AND bar_time = %s
+            WHERE ticker = %s AND bar_date = %s
         """
 
         with conn.cursor() as cur:
-            cur.execute(query, (ticker, trade_date, m1_candle_time))
-            row = cur.fetchone()
-
-        if row is None or row[0] is None:
-            return None
+            cur.execute(query, (ticker, trade_date))
+            rows = cur.fetchall()
 
-        return float(row[0])
+        return {
+            _timedelta_to_time(bar_time): (float(atr) if atr is not None else None)
+            for bar_time, atr in rows
+        }
 
     def get_m1_bars(
         self,
@@ -317,7 +413,12 @@ class M1AtrStopCalculator:
         return [dict(zip(columns, row)) for row in rows]
 
     def insert_results(self, conn, results: List[M1AtrStopResult]) -> int:
-        """Insert calculation results into m1_atr_stop_2 table."""
+        """
+        Insert calculation results into m1_atr_stop_2 table.
+
+        Upserts go out as multi-VALUES statements of INSERT_PAGE_SIZE rows
+        (execute_values), one round-trip per page.
+        """
         if not results:
             return 0
 
@@ -333,7 +434,7 @@ class M1AtrStopCalculator:
                 r4_hit, r4_time, r4_bars_from_entry,
                 r5_hit, r5_time, r5_bars_from_entry,
                 stop_hit, stop_time, stop_bars_from_entry,
-                max_r, result
+                max_r, result, input_hash
             ) VALUES %s
             ON CONFLICT (trade_id) DO UPDATE SET
                 m1_atr_value = EXCLUDED.m1_atr_value,
@@ -365,6 +466,7 @@ class M1AtrStopCalculator:
                 stop_bars_from_entry = EXCLUDED.stop_bars_from_entry,
                 max_r = EXCLUDED.max_r,
                 result = EXCLUDED.result,
+                input_hash = EXCLUDED.input_hash,
                 updated_at = NOW()
         """
 
@@ -388,12 +490,13 @@ class M1AtrStopCalculator:
                 r.r5_hit, r.r5_time, r.r5_bars_from_entry,
                 r.stop_hit, r.stop_time, r.stop_bars_from_entry,
                 r.max_r, r.result,
+                psycopg2.Binary(r.input_hash) if r.input_hash is not None else None,
             )
             for r in results
         ]
 
         with conn.cursor() as cur:
-            execute_values(cur, query, values)
+            execute_values(cur, query, values, page_size=INSERT_PAGE_SIZE)
 
         return len(results)
 
@@ -404,13 +507,13 @@ class M1AtrStopCalculator:
     def calculate_single_trade(
         self,
         trade: Dict[str, Any],
-        m1_bars: List[Dict[str, Any]],
+        m1_bars: Union[M1DayBars, List[Dict[str, Any]]],
         m1_atr_value: float
     ) -> Optional[M1AtrStopResult]:
         """
         Calculate M1 ATR Stop outcome for a single trade.
 
-        Walk M1 bars sequentially from entry to 15:30:
+        Evaluate M1 bars from entry to 15:30 as arrays (first-touch indices):
         - Check R-level targets (price-based: high/low touch)
         - Check stop (close-based: M1 close beyond stop)
         - Same-candle conflict: R-level hit + close beyond stop => stop takes priority
@@ -480,106 +583,55 @@ class M1AtrStopCalculator:
             self._log(f"Skipping {trade_id}: could not parse entry time", 'warning')
             return None
 
-        # Track state during walk
-        r_levels_hit = {}  # {r_level: bar_time}
-        stop_triggered = False
-        bar_count = 0
+        # Bars strictly after entry, up to and including EOD cutoff
+        day = m1_bars if isinstance(m1_bars, M1DayBars) else _m1_day_bars(m1_bars)
+        start = int(np.searchsorted(day.minutes, entry_minutes, side='right'))
+        end = int(np.searchsorted(day.minutes, eod_minutes, side='right'))
 
-        # Sort M1 bars by time
-        sorted_m1 = sorted(m1_bars, key=lambda b: _time_to_minutes(b.get('bar_time')) or 0)
+        n_bars = end - start
+        if n_bars <= 0:
+            return result
 
-        for bar in sorted_m1:
-            bar_minutes = _time_to_minutes(bar.get('bar_time'))
-            if bar_minutes is None:
-                continue
-
-            # Only process bars after entry and up to EOD cutoff
-            if bar_minutes <= entry_minutes:
-                continue
-            if bar_minutes > eod_minutes:
-                break
-
-            bar_count += 1
-            bar_high = _safe_float(bar.get('high'))
-            bar_low = _safe_float(bar.get('low'))
-            bar_close = _safe_float(bar.get('close'))
-            bar_time = _timedelta_to_time(bar.get('bar_time'))
+        highs = day.high[start:end]
+        lows = day.low[start:end]
+        closes = day.close[start:end]
+        targets = np.array([r_prices[r] for r in R_LEVELS])
 
-            # --- Check stop (close-based) ---
-            stop_on_this_bar = False
-            if is_long:
-                if bar_close <= stop_price:
-                    stop_on_this_bar = True
-            else:
-                if bar_close >= stop_price:
-                    stop_on_this_bar = True
-
-            # --- Check R-level targets (price-based: high/low touch) ---
-            new_r_hits_this_bar = []
-            for r in R_LEVELS:
-                if r in r_levels_hit:
-                    continue  # Already hit this level
-
-                target = r_prices[r]
-                target_hit = False
-                if is_long:
-                    if bar_high >= target:
-                        target_hit = True
-                else:
-                    if bar_low <= target:
-                        target_hit = True
-
-                if target_hit:
-                    new_r_hits_this_bar.append(r)
-
-            # --- Same-candle conflict resolution ---
-            # If stop triggers on this bar, R-level hits on this SAME bar
-            # are invalidated. The stop takes priority.
-            if stop_on_this_bar:
-                stop_triggered = True
-                result.stop_hit = True
-                result.stop_time = bar_time
-                result.stop_bars_from_entry = bar_count
-                # Do NOT credit R-levels hit on this same bar
-                break
-
-            # If no stop on this bar, credit R-level hits
-            for r in new_r_hits_this_bar:
-                r_levels_hit[r] = bar_time
-                if r == 1:
-                    result.r1_hit = True
-                    result.r1_time = bar_time
-                    result.r1_bars_from_entry = bar_count
-                elif r == 2:
-                    result.r2_hit = True
-                    result.r2_time = bar_time
-                    result.r2_bars_from_entry = bar_count
-                elif r == 3:
-                    result.r3_hit = True
-                    result.r3_time = bar_time
-                    result.r3_bars_from_entry = bar_count
-                elif r == 4:
-                    result.r4_hit = True
-                    result.r4_time = bar_time
-                    result.r4_bars_from_entry = bar_count
-                elif r == 5:
-                    result.r5_hit = True
-                    result.r5_time = bar_time
-                    result.r5_bars_from_entry = bar_count
-
-            # All R-levels hit, no need to continue
-            if len(r_levels_hit) == len(R_LEVELS):
-                break
+        # First-touch bar per R-level (price-based) and first stop bar (close-based);
+        # n_bars means "never"
+        if is_long:
+            touched = highs[:, None] >= targets
+            stop_mask = closes <= stop_price
+        else:
+            touched = lows[:, None] <= targets
+            stop_mask = closes >= stop_price
+
+        first_touch = np.where(touched.any(axis=0), touched.argmax(axis=0), n_bars)
+        stop_bar = int(stop_mask.argmax()) if stop_mask.any() else n_bars
+
+        # Same-candle conflict: an R-level only counts if touched strictly before
+        # the stop bar. The walk ends once every level is hit, so a later stop
+        # is not recorded.
+        r_hit = first_touch < stop_bar
+        if stop_bar < n_bars and not r_hit.all():
+            result.stop_hit = True
+            result.stop_time = day.bar_time[start + stop_bar]
+            result.stop_bars_from_entry = stop_bar + 1
+
+        for r, hit, bar_idx in zip(R_LEVELS, r_hit, first_touch):
+            if hit:
+                setattr(result, f'r{r}_hit', True)
+                setattr(result, f'r{r}_time', day.bar_time[start + bar_idx])
+                setattr(result, f'r{r}_bars_from_entry', int(bar_idx) + 1)
 
         # --- Determine result and max_r ---
         # WIN = R1 hit before stop, LOSS = everything else
         # max_r: -1 for LOSS (allows direct use in R-multiple calculations)
         #        1-5 for WIN (highest R-level hit before stop_time)
         if result.r1_hit:
-            # R1 was hit (and it was before stop, since same-candle conflict
-            # prevents R-hits on the stop bar)
+            # R1 was hit before stop (R-hits on the stop bar are not credited)
             result.result = 'WIN'
-            result.max_r = max(r_levels_hit.keys())
+            result.max_r = max(r for r, hit in zip(R_LEVELS, r_hit) if hit)
         else:
             result.result = 'LOSS'
             result.max_r = -1
@@ -593,7 +645,9 @@ class M1AtrStopCalculator:
     def run_batch_calculation(
         self,
         limit: int = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        workers: int = 1,
+        recheck: bool = False
     ) -> Dict[str, Any]:
         """
         Main entry point. Process all trades needing M1 ATR Stop calculation.
@@ -601,6 +655,9 @@ class M1AtrStopCalculator:
         Args:
             limit: Max trades to process (for testing)
             dry_run: If True, calculate but don't write to DB
+            workers: Number of worker processes (1 = run in this process)
+            recheck: If True, also revisit processed trades and recalculate
+                only those whose input_hash no longer matches their inputs
 
         Returns:
             Dictionary with execution statistics
@@ -616,6 +673,10 @@ class M1AtrStopCalculator:
         print(f"Dry Run: {dry_run}")
         if limit:
             print(f"Limit: {limit} trades")
+        if workers > 1:
+            print(f"Workers: {workers}")
+        if recheck:
+            print(f"Recheck: processed trades with changed inputs")
         print()
 
         # Reset statistics
@@ -623,6 +684,10 @@ class M1AtrStopCalculator:
             'trades_processed': 0,
             'trades_skipped': 0,
             'records_created': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'hash_hits': 0,
+            'hash_misses': 0,
             'errors': []
         }
 
@@ -635,7 +700,7 @@ class M1AtrStopCalculator:
 
             # Get trades needing calculation
             print("\n[2/4] Querying trades needing calculation...")
-            trades = self.get_trades_needing_calculation(conn, limit)
+            trades = self.get_trades_needing_calculation(conn, limit, recheck)
             print(f"  Found {len(trades)} trades to process")
 
             if not trades:
@@ -644,78 +709,20 @@ class M1AtrStopCalculator:
 
             # Process trades
             print("\n[3/4] Processing trades...")
-            all_results = []
-
-            # Cache M1 bars by ticker+date to minimize DB queries
-            m1_cache = {}
-
-            for idx, trade in enumerate(trades):
-                trade_id = trade['trade_id']
-                ticker = trade['ticker']
-                trade_date = trade['date']
-
-                # Step 1: Adjust entry time to M1 candle
-                m1_candle = _truncate_to_m1_candle(trade['entry_time'])
-                if m1_candle is None:
-                    self._log(f"Skipping {trade_id}: could not parse entry time", 'warning')
-                    self.stats['trades_skipped'] += 1
-                    continue
-
-                # Step 2: Fetch M1 ATR at adjusted entry candle
-                m1_atr = self.get_m1_atr_at_entry(conn, ticker, trade_date, m1_candle)
-                if m1_atr is None or m1_atr <= 0:
-                    self._log(
-                        f"Skipping {trade_id}: no M1 ATR at {ticker} {trade_date} {m1_candle}",
-                        'warning'
-                    )
-                    self.stats['trades_skipped'] += 1
-                    continue
-
-                # Step 3: Get M1 bars (cached by ticker+date)
-                m1_key = f"{ticker}_{trade_date}"
-                if m1_key not in m1_cache:
-                    m1_cache[m1_key] = self.get_m1_bars(conn, ticker, trade_date)
-                m1_bars = m1_cache[m1_key]
-
-                if not m1_bars:
-                    self._log(f"Skipping {trade_id}: no M1 bars", 'warning')
-                    self.stats['trades_skipped'] += 1
-                    continue
-
-                # Step 4: Calculate
-                try:
-                    result = self.calculate_single_trade(trade, m1_bars, m1_atr)
-
-                    if result is not None:
-                        all_results.append(result)
-                        self.stats['trades_processed'] += 1
-
-                        # Trade-by-trade output
-                        r_hits = ''.join([
-                            f"R{r}" for r in R_LEVELS
-                            if getattr(result, f'r{r}_hit', False)
-                        ]) or '-'
-                        stop_info = f"stop@{result.stop_time}" if result.stop_hit else "no_stop"
-                        print(
-                            f"  [{idx + 1}/{len(trades)}] "
-                            f"{result.trade_id:<35s} "
-                            f"{result.direction:<6s} "
-                            f"{result.result:<5s} "
-                            f"maxR={result.max_r} "
-                            f"hits={r_hits} "
-                            f"{stop_info}"
-                        )
-                    else:
-                        self.stats['trades_skipped'] += 1
-                        print(
-                            f"  [{idx + 1}/{len(trades)}] "
-                            f"{trade_id:<35s} "
-                            f"SKIPPED"
-                        )
-
-                except Exception as e:
-                    self.stats['errors'].append(f"{trade_id}: {str(e)}")
-                    self._log(f"Error processing {trade_id}: {e}", 'error')
+            indexed_trades = list(enumerate(trades))
+            if workers > 1:
+                all_results = self._process_trades_parallel(indexed_trades, workers)
+            else:
+                all_results = self._process_trades(conn, indexed_trades, len(trades))
+            print(
+                f"  M1 bar cache: {self.stats['cache_hits']} hits, "
+                f"{self.stats['cache_misses']} misses"
+            )
+            if recheck:
+                print(
+                    f"  Input hash: {self.stats['hash_hits']} unchanged (skipped), "
+                    f"{self.stats['hash_misses']} new or changed"
+                )
 
             # Write results to database
             print(f"\n[4/4] Writing results to database...")
@@ -739,6 +746,153 @@ class M1AtrStopCalculator:
             if conn:
                 conn.close()
 
+    def _process_trades(
+        self,
+        conn,
+        indexed_trades: List[Tuple[int, Dict[str, Any]]],
+        total: int
+    ) -> List[M1AtrStopResult]:
+        """
+        Calculate results for (position, trade) pairs on one connection.
+
+        Skips and errors are recorded in self.stats; position is only used
+        for the [n/total] progress output.
+        """
+        all_results = []
+
+        # LRU caches keyed by (ticker, date): trades on the same session share
+        # one bar fetch and one ATR fetch
+        load_day_bars = functools.lru_cache(maxsize=M1_DAY_CACHE_SIZE)(
+            lambda ticker, trade_date: _m1_day_bars(self.get_m1_bars(conn, ticker, trade_date))
+        )
+        load_day_atr = functools.lru_cache(maxsize=M1_DAY_CACHE_SIZE)(
+            lambda ticker, trade_date: self.get_m1_atr_for_day(conn, ticker, trade_date)
+        )
+
+        for idx, trade in indexed_trades:
+            trade_id = trade['trade_id']
+            ticker = trade['ticker']
+            trade_date = trade['date']
+
+            # Step 1: Adjust entry time to M1 candle
+            m1_candle = _truncate_to_m1_candle(trade['entry_time'])
+            if m1_candle is None:
+                self._log(f"Skipping {trade_id}: could not parse entry time", 'warning')
+                self.stats['trades_skipped'] += 1
+                continue
+
+            # Step 2: Look up M1 ATR at adjusted entry candle (cached by ticker+date)
+            m1_atr = load_day_atr(ticker, trade_date).get(m1_candle)
+            if m1_atr is None or m1_atr <= 0:
+                self._log(
+                    f"Skipping {trade_id}: no M1 ATR at {ticker} {trade_date} {m1_candle}",
+                    'warning'
+                )
+                self.stats['trades_skipped'] += 1
+                continue
+
+            # Step 3: Get M1 bars (cached by ticker+date)
+            m1_bars = load_day_bars(ticker, trade_date)
+
+            if len(m1_bars.close) == 0:
+                self._log(f"Skipping {trade_id}: no M1 bars", 'warning')
+                self.stats['trades_skipped'] += 1
+                continue
+
+            # Step 4: Skip trades whose stored result was built from the same inputs
+            input_hash = _trade_input_hash(trade, m1_atr, m1_bars)
+            stored_hash = trade.get('stored_hash')
+            if stored_hash is not None and stored_hash == input_hash:
+                self.stats['hash_hits'] += 1
+                continue
+            self.stats['hash_misses'] += 1
+
+            # Step 5: Calculate
+            try:
+                result = self.calculate_single_trade(trade, m1_bars, m1_atr)
+
+                if result is not None:
+                    result.input_hash = input_hash
+                    all_results.append(result)
+                    self.stats['trades_processed'] += 1
+
+                    # Trade-by-trade output
+                    r_hits = ''.join([
+                        f"R{r}" for r in R_LEVELS
+                        if getattr(result, f'r{r}_hit', False)
+                    ]) or '-'
+                    stop_info = f"stop@{result.stop_time}" if result.stop_hit else "no_stop"
+                    print(
+                        f"  [{idx + 1}/{total}] "
+                        f"{result.trade_id:<35s} "
+                        f"{result.direction:<6s} "
+                        f"{result.result:<5s} "
+                        f"maxR={result.max_r} "
+                        f"hits={r_hits} "
+                        f"{stop_info}"
+                    )
+                else:
+                    self.stats['trades_skipped'] += 1
+                    print(
+                        f"  [{idx + 1}/{total}] "
+                        f"{trade_id:<35s} "
+                        f"SKIPPED"
+                    )
+
+            except Exception as e:
+                self.stats['errors'].append(f"{trade_id}: {str(e)}")
+                self._log(f"Error processing {trade_id}: {e}", 'error')
+
+        bar_cache = load_day_bars.cache_info()
+        self.stats['cache_hits'] += bar_cache.hits
+        self.stats['cache_misses'] += bar_cache.misses
+
+        return all_results
+
+    def _process_trades_parallel(
+        self,
+        indexed_trades: List[Tuple[int, Dict[str, Any]]],
+        workers: int
+    ) -> List[M1AtrStopResult]:
+        """
+        Shard trades across a multiprocessing.Pool and merge the results.
+
+        Trades are grouped by ticker+date and whole groups are dealt
+        round-robin to the shards, so each worker's M1 bar cache stays
+        effective. Each worker opens its own database connection.
+        """
+        groups: Dict[Tuple[str, Any], List[Tuple[int, Dict[str, Any]]]] = {}
+        for item in indexed_trades:
+            trade = item[1]
+            groups.setdefault((trade['ticker'], trade['date']), []).append(item)
+
+        shards = [[] for _ in range(workers)]
+        for i, group in enumerate(groups.values()):
+            shards[i % workers].extend(group)
+        shards = [shard for shard in shards if shard]
+
+        total = len(indexed_trades)
+        print(f"  Sharded {total} trades across {len(shards)} workers")
+
+        with multiprocessing.Pool(len(shards)) as pool:
+            partials = pool.map(
+                _process_shard,
+                [(shard, total, self.verbose) for shard in shards]
+            )
+
+        all_results = []
+        for results, stats in partials:
+            all_results.extend(results)
+            self.stats['trades_processed'] += stats['trades_processed']
+            self.stats['trades_skipped'] += stats['trades_skipped']
+            self.stats['cache_hits'] += stats['cache_hits']
+            self.stats['cache_misses'] += stats['cache_misses']
+            self.stats['hash_hits'] += stats['hash_hits']
+            self.stats['hash_misses'] += stats['hash_misses']
+            self.stats['errors'].extend(stats['errors'])
+
+        return all_results
+
     def _build_result(self, start_time: datetime) -> Dict[str, Any]:
         """Build the result dictionary."""
         elapsed = (datetime.now() - start_time).total_seconds()
@@ -747,11 +901,36 @@ class M1AtrStopCalculator:
             'trades_processed': self.stats['trades_processed'],
             'trades_skipped': self.stats['trades_skipped'],
             'records_created': self.stats['records_created'],
+            'trades_unchanged': self.stats['hash_hits'],
             'errors': self.stats['errors'],
             'execution_time_seconds': round(elapsed, 2)
         }
 
 
+# =============================================================================
+# WORKER ENTRY POINT
+# =============================================================================
+
+def _process_shard(
+    args: Tuple[List[Tuple[int, Dict[str, Any]]], int, bool]
+) -> Tuple[List[M1AtrStopResult], Dict[str, Any]]:
+    """
+    multiprocessing.Pool worker: process one shard on its own connection.
+
+    Returns the shard's results and stats for the parent to merge.
+    """
+    indexed_trades, total, verbose = args
+    calculator = M1AtrStopCalculator(verbose=verbose)
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        results = calculator._process_trades(conn, indexed_trades, total)
+    finally:
+        conn.close()
+
+    return results, calculator.stats
+
+
 # =============================================================================
 # STANDALONE TEST
 # =============================================================================
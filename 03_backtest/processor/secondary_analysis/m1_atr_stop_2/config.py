@@ -68,6 +68,12 @@ SOURCE_TABLES = {
 }
 TARGET_TABLE = "m1_atr_stop_2"
 
+# =============================================================================
+# PROCESSING
+# =============================================================================
+M1_DAY_CACHE_SIZE = 512       # Ticker-dates of M1 bars / ATR kept in the LRU cache
+INSERT_PAGE_SIZE = 1000       # Rows per multi-VALUES upsert statement
+
 # =============================================================================
 # LOGGING
 # =============================================================================
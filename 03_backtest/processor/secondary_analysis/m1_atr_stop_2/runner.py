@@ -12,6 +12,7 @@ Usage:
     python runner.py              # Full batch run
     python runner.py --dry-run    # Calculate but don't save
     python runner.py --limit 50   # Process max 50 trades
+    python runner.py --workers 8  # Process trades in 8 worker processes
     python runner.py --verbose    # Detailed logging
     python runner.py --schema     # Run schema creation only
     python runner.py --info       # Show processor information
@@ -140,6 +141,8 @@ def run_calculation(args):
     print(f"Mode: {'DRY-RUN' if args.dry_run else 'FULL RUN'}")
     if args.limit:
         print(f"Limit: {args.limit} trades")
+    if args.workers > 1:
+        print(f"Workers: {args.workers}")
     print()
 
     # Create calculator
@@ -148,7 +151,9 @@ def run_calculation(args):
     # Run calculation
     results = calculator.run_batch_calculation(
         limit=args.limit,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        workers=args.workers,
+        recheck=args.recheck
     )
 
     # Print results summary
@@ -158,6 +163,8 @@ def run_calculation(args):
     print("=" * 60)
     print(f"  Trades Processed:  {results['trades_processed']}")
     print(f"  Trades Skipped:    {results['trades_skipped']}")
+    if args.recheck:
+        print(f"  Trades Unchanged:  {results['trades_unchanged']}")
     print(f"  Records Created:   {results['records_created']}")
     print(f"  Execution Time:    {results['execution_time_seconds']:.1f}s")
 
@@ -193,6 +200,8 @@ Examples:
   python runner.py              # Full batch run
   python runner.py --dry-run    # Test without saving
   python runner.py --limit 50   # Process 50 trades
+  python runner.py --workers 8  # Shard trades across 8 processes
+  python runner.py --recheck    # Recalculate processed trades whose inputs changed
   python runner.py --schema     # Create database table
   python runner.py --info       # Show processor information
 
@@ -215,6 +224,20 @@ Output:
         help='Maximum number of trades to process'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of worker processes (default: 1, single process)'
+    )
+
+    parser.add_argument(
+        '--recheck',
+        action='store_true',
+        help='Also revisit processed trades; recalculate only those whose inputs changed'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -105,6 +105,7 @@ CREATE TABLE IF NOT EXISTS m1_atr_stop_2 (
     -- =========================================================================
     -- SYSTEM METADATA
     -- =========================================================================
+    input_hash BYTEA,                     -- SHA-256 of calculation inputs (skip detection)
     calculated_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
 
@@ -117,6 +118,9 @@ CREATE TABLE IF NOT EXISTS m1_atr_stop_2 (
     CONSTRAINT valid_max_r CHECK (max_r >= -1 AND max_r <= 5)
 );
 
+-- Existing tables: add skip-detection hash
+ALTER TABLE m1_atr_stop_2 ADD COLUMN IF NOT EXISTS input_hash BYTEA;
+
 -- ============================================================================
 -- INDEXES
 -- ============================================================================
@@ -153,6 +157,7 @@ COMMENT ON COLUMN m1_atr_stop_2.r1_time IS 'Time when R1 was first reached';
 COMMENT ON COLUMN m1_atr_stop_2.r1_bars_from_entry IS 'M1 bars from entry to R1 hit';
 COMMENT ON COLUMN m1_atr_stop_2.max_r IS 'R-multiple result: -1 = LOSS (stopped out), 1-5 = highest R-level hit before stop. AVG(max_r) = net expectancy in R.';
 COMMENT ON COLUMN m1_atr_stop_2.result IS 'WIN if R1 hit before stop, LOSS otherwise';
+COMMENT ON COLUMN m1_atr_stop_2.input_hash IS 'SHA-256 of trade fields, entry ATR, R-level/EOD config and M1 bars entry-15:30. --recheck skips trades whose hash still matches.';
 COMMENT ON COLUMN m1_atr_stop_2.stop_time IS 'Time when stop was first triggered (M1 close beyond stop level)';
 
 -- ============================================================================
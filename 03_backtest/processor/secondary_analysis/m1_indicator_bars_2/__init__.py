@@ -17,7 +17,7 @@ Version: 2.0.0
 
 from .calculator import M1IndicatorBarsCalculator, M1IndicatorBarResult
 from .populator import M1IndicatorBarsPopulator
-from .indicators import M1IndicatorCalculator, IndicatorSnapshot
+from .indicators import M1IndicatorCalculator, IndicatorSnapshot, IndicatorSnapshotView
 from .structure import StructureAnalyzer, StructureResult
 
 __all__ = [
@@ -26,6 +26,7 @@ __all__ = [
     'M1IndicatorBarsPopulator',
     'M1IndicatorCalculator',
     'IndicatorSnapshot',
+    'IndicatorSnapshotView',
     'StructureAnalyzer',
     'StructureResult',
 ]
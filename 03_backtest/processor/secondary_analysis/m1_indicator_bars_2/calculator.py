@@ -23,9 +23,9 @@ from dataclasses import dataclass
 from datetime import datetime, date, time, timedelta
 from typing import Dict, List, Optional, Any
 import logging
+import sys
 import pandas as pd
 import numpy as np
-import psycopg2
 
 # Use explicit path imports to avoid collisions with 03_indicators modules
 import importlib.util
@@ -54,6 +54,14 @@ _structure_spec.loader.exec_module(_structure_mod)
 StructureAnalyzer = _structure_mod.StructureAnalyzer
 StructureResult = _structure_mod.StructureResult
 
+# Load shared connection pool (one instance per process, see db_pool.py)
+db_pool = sys.modules.get("m1_indicator_bars_2_db_pool")
+if db_pool is None:
+    _db_pool_spec = importlib.util.spec_from_file_location("m1_indicator_bars_2_db_pool", _MODULE_DIR / "db_pool.py")
+    db_pool = importlib.util.module_from_spec(_db_pool_spec)
+    sys.modules["m1_indicator_bars_2_db_pool"] = db_pool
+    _db_pool_spec.loader.exec_module(db_pool)
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -176,12 +184,8 @@ class M1IndicatorBarsCalculator:
             ORDER BY bar_timestamp ASC
         """
 
-        conn = psycopg2.connect(**DB_CONFIG)
-        try:
-            df = pd.read_sql_query(query, conn, params=(ticker, trade_date))
-            return df
-        finally:
-            conn.close()
+        with db_pool.pooled_connection() as conn:
+            return pd.read_sql_query(query, conn, params=(ticker, trade_date))
 
     def calculate_for_ticker_date(
         self,
@@ -270,10 +274,10 @@ class M1IndicatorBarsCalculator:
                 m5_structure=structures['M5'].direction_label if structures.get('M5') else None,
                 m1_structure=structures['M1'].direction_label if structures.get('M1') else None,
 
-                # Composite Scores
-                health_score=self._safe_int(row.get('health_score')),
-                long_score=self._safe_int(row.get('long_score')),
-                short_score=self._safe_int(row.get('short_score')),
+                # Composite Scores (DEPRECATED per SWH-6, not written)
+                health_score=None,
+                long_score=None,
+                short_score=None,
 
                 # ATR (Average True Range, 14-period)
                 atr_m1=self._safe_float(row.get('atr_m1')),
@@ -135,6 +135,10 @@ HTF_LOOKBACK_DAYS = {
 # =============================================================================
 BATCH_INSERT_SIZE = 500  # Insert bars in batches of 500
 
+# Read connections (M1 bars, H1 bars) are reused from a pool instead of
+# opening a new SSL connection per ticker-date
+DB_POOL_MAXCONN = 4
+
 # =============================================================================
 # LOGGING
 # =============================================================================
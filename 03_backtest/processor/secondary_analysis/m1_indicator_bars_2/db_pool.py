@@ -0,0 +1,68 @@
+"""
+================================================================================
+EPOCH TRADING SYSTEM - MODULE 09: SECONDARY ANALYSIS
+M1 Indicator Bars v2 - Connection Pool
+XIII Trading LLC
+================================================================================
+
+Process-wide psycopg2 connection pool for the per-ticker-date reads in
+calculator.py (m1_bars_2) and structure.py (h1_bars). Each read used to open
+and close its own SSL connection; pooled connections skip that handshake.
+
+Callers load it via importlib like the other local modules, but register
+it in sys.modules as "m1_indicator_bars_2_db_pool" so they share one pool.
+
+Version: 2.0.0
+================================================================================
+"""
+
+import importlib.util
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+import psycopg2
+from psycopg2.pool import SimpleConnectionPool
+
+_MODULE_DIR = Path(__file__).resolve().parent
+
+# Load local config
+_config_spec = importlib.util.spec_from_file_location("local_config", _MODULE_DIR / "config.py")
+_config = importlib.util.module_from_spec(_config_spec)
+_config_spec.loader.exec_module(_config)
+DB_CONFIG = _config.DB_CONFIG
+DB_POOL_MAXCONN = _config.DB_POOL_MAXCONN
+
+_pool: Optional[SimpleConnectionPool] = None
+
+
+def get_pool() -> SimpleConnectionPool:
+    """Create the pool on first use (connections open lazily)."""
+    global _pool
+    if _pool is None or _pool.closed:
+        _pool = SimpleConnectionPool(0, DB_POOL_MAXCONN, **DB_CONFIG)
+    return _pool
+
+
+@contextmanager
+def pooled_connection() -> Iterator["psycopg2.extensions.connection"]:
+    """
+    Borrow a connection from the pool.
+
+    The pool rolls back any open transaction when the connection is
+    returned; broken connections are discarded rather than reused.
+    """
+    pool = get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn, close=bool(conn.closed))
+
+
+def close_pool() -> None:
+    """Close every pooled connection (end of a batch run)."""
+    global _pool
+    if _pool is not None and not _pool.closed:
+        _pool.closeall()
+    _pool = None
@@ -35,6 +35,8 @@ Version: 3.0.0 (SWH-6 migration)
 ================================================================================
 """
 
+import weakref
+from dataclasses import dataclass
 from typing import List, Dict, Optional, NamedTuple
 import numpy as np
 import pandas as pd
@@ -44,16 +46,21 @@ import pandas as pd
 # =============================================================================
 
 from shared.indicators.config import CONFIG
+from shared.indicators._utils import njit, vectorize, NUMBA_AVAILABLE
 
 # DataFrame wrappers (vectorized - preferred for DataFrame operations)
 from shared.indicators.core.volume_delta import volume_delta_df, rolling_delta_df
 from shared.indicators.core.volume_roc import volume_roc_df
 from shared.indicators.core.cvd import cvd_slope_df
 from shared.indicators.core.atr import atr_df
-from shared.indicators.core.sma import sma_df, sma_spread_df
 from shared.indicators.core.vwap import vwap_df
 from shared.indicators.core.candle_range import candle_range_pct_df
 
+# Compute the price/volume indicators in one compiled pass over the bars instead
+# of one shared.indicators scan per indicator. Falls back to the shared
+# DataFrame wrappers when numba is not installed.
+USE_FUSED_KERNEL = NUMBA_AVAILABLE
+
 
 # =============================================================================
 # RESULT DATA STRUCTURES
@@ -90,6 +97,295 @@ class IndicatorSnapshot(NamedTuple):
     bars_in_calculation: int
 
 
+# Snapshot field -> DataFrame column, used by the bulk snapshot builder
+_SNAPSHOT_FLOAT_COLUMNS = {
+    'vwap': 'vwap_calc',
+    'sma9': 'sma9',
+    'sma21': 'sma21',
+    'sma_spread_pct': 'sma_spread_pct',
+    'sma_spread': 'sma_spread',
+    'sma_momentum_ratio': 'sma_momentum_ratio',
+    'vol_roc': 'vol_roc',
+    'vol_delta_raw': 'vol_delta_raw',
+    'vol_delta_roll': 'vol_delta_roll',
+    'cvd_slope': 'cvd_slope',
+    'candle_range_pct': 'candle_range_pct',
+}
+_SNAPSHOT_LABEL_COLUMNS = ('sma_config', 'price_position', 'sma_momentum_label')
+
+# Continuous indicator outputs eligible for downcasting (see float_dtype)
+_INDICATOR_FLOAT_COLUMNS = (
+    'vwap_calc', 'sma9', 'sma21', 'sma_spread', 'sma_momentum_ratio',
+    'vol_roc', 'cvd_slope', 'candle_range_pct', 'atr_m1',
+)
+
+
+def _float_field(name: str) -> property:
+    """Read-only view property: arrays[name][i], rounded to 6 dp, NaN -> None."""
+    def getter(self) -> Optional[float]:
+        value = self.arrays[name][self.i]
+        if np.isnan(value):
+            return None
+        return round(float(value), 6)
+    return property(getter)
+
+
+def _label_field(name: str) -> property:
+    """Read-only view property: arrays[name][i] (None where missing)."""
+    return property(lambda self: self.arrays[name][self.i])
+
+
+@dataclass(frozen=True, eq=False)
+class IndicatorSnapshotView:
+    """
+    Snapshot of a single M1 bar backed by shared column arrays (SoA).
+
+    Exposes the same fields as IndicatorSnapshot, but only stores the array
+    mapping and a row index, so iterating bars allocates no per-field objects.
+    Obtain via M1IndicatorCalculator.get_snapshot_view.
+    """
+    arrays: Dict[str, np.ndarray]
+    i: int
+
+    vwap = _float_field('vwap')
+    sma9 = _float_field('sma9')
+    sma21 = _float_field('sma21')
+    sma_config = _label_field('sma_config')
+    sma_spread_pct = _float_field('sma_spread_pct')
+    price_position = _label_field('price_position')
+    sma_spread = _float_field('sma_spread')
+    sma_momentum_ratio = _float_field('sma_momentum_ratio')
+    sma_momentum_label = _label_field('sma_momentum_label')
+    vol_roc = _float_field('vol_roc')
+    vol_delta_raw = _float_field('vol_delta_raw')
+    vol_delta_roll = _float_field('vol_delta_roll')
+    cvd_slope = _float_field('cvd_slope')
+    candle_range_pct = _float_field('candle_range_pct')
+
+    # DEPRECATED per SWH-6 - always None
+    health_score = None
+    long_score = None
+    short_score = None
+
+    @property
+    def bars_in_calculation(self) -> int:
+        return self.i + 1
+
+    def to_snapshot(self) -> IndicatorSnapshot:
+        """Materialize as an IndicatorSnapshot."""
+        return IndicatorSnapshot(**{f: getattr(self, f) for f in IndicatorSnapshot._fields})
+
+
+# =============================================================================
+# ROLLING MEAN
+# =============================================================================
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Simple moving average from prefix sums, O(N) for any period.
+
+    Matches shared sma _sma_core: NaN for the first period-1 bars and for
+    any window containing a NaN (NaNs are counted with a second prefix sum
+    so they don't poison the running total).
+    """
+    n = len(values)
+    result = np.full(n, np.nan)
+    if n < period:
+        return result
+
+    nan_mask = np.isnan(values)
+    csum = np.cumsum(np.where(nan_mask, 0.0, values))
+    cnan = np.cumsum(nan_mask)
+
+    window_sum = csum[period - 1:] - np.concatenate(([0.0], csum[:-period]))
+    window_nan = cnan[period - 1:] - np.concatenate(([0], cnan[:-period]))
+    result[period - 1:] = np.where(window_nan == 0, window_sum / period, np.nan)
+    return result
+
+
+# =============================================================================
+# SMA MOMENTUM LABEL
+# =============================================================================
+
+# Indexed by momentum code + 1; labels are shared objects, not per-row strings
+_MOMENTUM_LABELS = np.array([None, 'NARROWING', 'STABLE', 'WIDENING'], dtype=object)
+
+# Baked into the compiled ufunc; other thresholds take the np.select path
+_WIDENING_THRESHOLD = CONFIG.sma.widening_threshold
+
+
+@vectorize(["int8(float64)"])
+def _momentum_code(ratio):
+    """Momentum code for one ratio: -1 NaN, 0 NARROWING, 1 STABLE, 2 WIDENING."""
+    if np.isnan(ratio):
+        return -1
+    if ratio > _WIDENING_THRESHOLD:
+        return 2
+    if ratio < 1.0 / _WIDENING_THRESHOLD:
+        return 0
+    return 1
+
+
+# =============================================================================
+# FUSED KERNEL
+# =============================================================================
+
+@njit
+def _window_push(ring: np.ndarray, state: np.ndarray, i: int, x: float) -> None:
+    """
+    Push x into a rolling window ring buffer at bar i.
+
+    state holds [running sum, NaN count]; NaN values are counted rather than
+    summed so a single NaN only poisons the windows that contain it.
+    """
+    slot = i % len(ring)
+    old = ring[slot]
+    if np.isnan(old):
+        state[1] -= 1.0
+    else:
+        state[0] -= old
+    ring[slot] = x
+    if np.isnan(x):
+        state[1] += 1.0
+    else:
+        state[0] += x
+
+
+@njit
+def _fused_indicators_nb(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    day_code: np.ndarray,
+    n_days: int,
+    fast_period: int,
+    slow_period: int,
+    atr_period: int,
+    roc_period: int,
+    delta_period: int,
+):
+    """
+    Single pass over the bars computing the rolling price/volume indicators.
+
+    Matches the shared.indicators DataFrame wrappers used by the unfused path:
+    daily-reset VWAP (per day_code, -1 = no date), SMA fast/slow, ATR (SMA of
+    True Range), volume ROC vs the prior baseline, per-bar and rolling volume
+    delta, rolling average volume and candle range %.
+
+    NaN inputs are handled as the shared path does: rolling windows are NaN
+    while a NaN is inside them, True Range skips a missing previous close,
+    and the rolling delta is a difference of running totals, so a NaN delta
+    leaves every later rolling delta NaN (shared _rolling_delta_core).
+    test_indicators.py checks both paths on NaN-containing bars.
+    """
+    n = len(close)
+    vwap = np.full(n, np.nan)
+    sma_fast = np.full(n, np.nan)
+    sma_slow = np.full(n, np.nan)
+    atr = np.full(n, np.nan)
+    vol_roc = np.full(n, np.nan)
+    delta_raw = np.empty(n)
+    delta_roll = np.empty(n)
+    vol_avg = np.full(n, np.nan)
+    range_pct = np.empty(n)
+
+    day_tp_vol = np.zeros(n_days)
+    day_vol = np.zeros(n_days)
+
+    fast_ring = np.zeros(fast_period)
+    fast_state = np.zeros(2)
+    slow_ring = np.zeros(slow_period)
+    slow_state = np.zeros(2)
+    tr_ring = np.zeros(atr_period)
+    tr_state = np.zeros(2)
+    roc_ring = np.zeros(roc_period)
+    roc_state = np.zeros(2)
+    delta_cum = 0.0
+    delta_cum_ring = np.zeros(delta_period)
+    avg_ring = np.zeros(delta_period)
+    avg_state = np.zeros(2)
+
+    for i in range(n):
+        o = open_[i]
+        h = high[i]
+        l = low[i]
+        c = close[i]
+        v = volume[i]
+
+        # VWAP (cumulative, reset per day)
+        d = day_code[i]
+        if d >= 0:
+            tp_vol = (h + l + c) / 3.0 * v
+            if not np.isnan(tp_vol):
+                day_tp_vol[d] += tp_vol
+            if not np.isnan(v):
+                day_vol[d] += v
+            if not np.isnan(tp_vol) and not np.isnan(v) and day_vol[d] != 0.0:
+                vwap[i] = day_tp_vol[d] / day_vol[d]
+
+        # SMA fast / slow
+        _window_push(fast_ring, fast_state, i, c)
+        if i >= fast_period - 1 and fast_state[1] == 0.0:
+            sma_fast[i] = fast_state[0] / fast_period
+        _window_push(slow_ring, slow_state, i, c)
+        if i >= slow_period - 1 and slow_state[1] == 0.0:
+            sma_slow[i] = slow_state[0] / slow_period
+
+        # ATR (first bar has no previous close; a missing previous close
+        # is skipped, as in shared _true_range_core)
+        tr = h - l
+        if i > 0 and not np.isnan(tr):
+            pc = close[i - 1]
+            if not np.isnan(pc):
+                tr = max(tr, abs(h - pc), abs(l - pc))
+        _window_push(tr_ring, tr_state, i, tr)
+        if i >= atr_period - 1 and tr_state[1] == 0.0:
+            atr[i] = tr_state[0] / atr_period
+
+        # Volume ROC against the baseline of the previous roc_period bars
+        if i >= roc_period and roc_state[1] == 0.0:
+            baseline = roc_state[0] / roc_period
+            if baseline == 0.0:
+                vol_roc[i] = 0.0
+            else:
+                vol_roc[i] = (v - baseline) / baseline * 100.0
+        _window_push(roc_ring, roc_state, i, v)
+
+        # Volume delta (doji bars use close vs open)
+        bar_range = h - l
+        if bar_range == 0.0:
+            position = 1.0 if c >= o else 0.0
+        else:
+            position = (c - l) / bar_range
+        delta = v * (2.0 * position - 1.0)
+        delta_raw[i] = delta
+        # Rolling delta as a difference of running totals, like shared
+        # _rolling_delta_core: a NaN delta stays in the total from then on
+        delta_cum += delta
+        slot = i % delta_period
+        if i < delta_period:
+            delta_roll[i] = delta_cum
+        else:
+            delta_roll[i] = delta_cum - delta_cum_ring[slot]
+        delta_cum_ring[slot] = delta_cum
+        _window_push(avg_ring, avg_state, i, v)
+        if i >= delta_period - 1 and avg_state[1] == 0.0:
+            vol_avg[i] = avg_state[0] / delta_period
+
+        # Candle range %
+        if c <= 0.0:
+            range_pct[i] = 0.0
+        else:
+            range_pct[i] = bar_range / c * 100.0
+
+    return (
+        vwap, sma_fast, sma_slow, atr, vol_roc,
+        delta_raw, delta_roll, vol_avg, range_pct,
+    )
+
+
 # =============================================================================
 # INDICATOR CALCULATION CLASS
 # =============================================================================
@@ -107,9 +403,21 @@ class M1IndicatorCalculator:
     All calculations delegate to the canonical shared.indicators library (SWH-6).
     """
 
-    def __init__(self):
-        """Initialize the indicator calculator."""
-        pass
+    def __init__(self, float_dtype=np.float64):
+        """
+        Initialize the indicator calculator.
+
+        Args:
+            float_dtype: dtype for the continuous indicator columns returned by
+                add_all_indicators. float32 halves their memory, but only has
+                ~7 significant digits, so price-level columns (vwap, sma9,
+                ...) lose the 6th decimal kept by DECIMAL(10,6). Keep float64
+                for anything written to the database.
+        """
+        self.float_dtype = np.dtype(float_dtype)
+        # Column arrays bound by get_indicator_arrays (one DataFrame at a time)
+        self._bound_df = None
+        self._bound_arrays = None
 
     def add_all_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -125,221 +433,335 @@ class M1IndicatorCalculator:
         if df.empty:
             return df
 
-        df = df.copy()
+        # Fused single-pass kernel; empty when unavailable (shared fallback)
+        fused = self._compute_fused(df)
+
+        # All outputs are collected as arrays and assigned once at the end
+        # (df.assign leaves the caller's frame untouched, so no upfront copy)
+        out: Dict[str, np.ndarray] = {}
 
         # Calculate VWAP (cumulative daily reset)
-        df = self._add_vwap(df)
+        out.update(self._vwap_columns(df, fused.get('vwap_calc')))
 
         # Calculate SMAs + config + spread + price position (all vectorized)
-        df = self._add_sma_suite(df)
+        out.update(self._sma_suite_columns(df, fused.get('sma9'), fused.get('sma21')))
 
         # Calculate SMA momentum
-        df = self._add_sma_momentum(df)
+        out.update(self._sma_momentum_columns(out['sma_spread']))
 
         # Calculate Volume ROC (vectorized)
-        df = self._add_volume_roc(df)
+        out.update(self._volume_roc_columns(df, fused.get('vol_roc')))
 
         # Calculate Volume Delta - raw + rolling (vectorized)
-        df = self._add_volume_delta(df)
+        out.update(self._volume_delta_columns(df, fused))
 
         # Calculate CVD Slope (vectorized)
-        df = self._add_cvd_slope(df)
+        out.update(self._cvd_slope_columns(df))
 
         # Candle Range % (vectorized)
-        df = self._add_candle_range(df)
+        out.update(self._candle_range_columns(df, fused.get('candle_range_pct')))
 
         # ATR (vectorized)
-        df = self._add_atr_m1(df)
+        out.update(self._atr_m1_columns(df, fused.get('atr_m1')))
+
+        # DEPRECATED: Health score and composite scores (SWH-6) are not
+        # emitted; the DB columns are left to their NULL default
+
+        # Indicators are computed in float64; downcast only the outputs
+        if self.float_dtype != np.float64:
+            for col in _INDICATOR_FLOAT_COLUMNS:
+                out[col] = out[col].astype(self.float_dtype)
+
+        return df.assign(**out)
+
+    # =========================================================================
+    # FUSED KERNEL
+    # =========================================================================
 
-        # DEPRECATED: Health score and composite scores (SWH-6)
-        # Columns retained as NULL for backward compatibility
-        df['health_score'] = np.nan
-        df['long_score'] = np.nan
-        df['short_score'] = np.nan
+    def _compute_fused(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Run the fused single-pass kernel over the OHLCV columns.
 
-        return df
+        Returns an empty dict when USE_FUSED_KERNEL is off or the frame has no
+        'bar_date' column, in which case each _add_* method falls back to the
+        shared.indicators DataFrame wrappers.
+        """
+        if not USE_FUSED_KERNEL or 'bar_date' not in df.columns:
+            return {}
+
+        day_code, days = pd.factorize(df['bar_date'])
+
+        (
+            vwap, sma_fast, sma_slow, atr, vol_roc,
+            delta_raw, delta_roll, vol_avg, range_pct,
+        ) = _fused_indicators_nb(
+            df['open'].to_numpy(dtype=np.float64),
+            df['high'].to_numpy(dtype=np.float64),
+            df['low'].to_numpy(dtype=np.float64),
+            df['close'].to_numpy(dtype=np.float64),
+            df['volume'].to_numpy(dtype=np.float64),
+            day_code.astype(np.int64),
+            len(days),
+            CONFIG.sma.fast_period,
+            CONFIG.sma.slow_period,
+            CONFIG.atr.period,
+            CONFIG.volume_roc.baseline_period,
+            CONFIG.volume_delta.rolling_period,
+        )
+
+        return {
+            'vwap_calc': vwap,
+            'sma9': sma_fast,
+            'sma21': sma_slow,
+            'atr_m1': atr,
+            'vol_roc': vol_roc,
+            'vol_delta_raw': delta_raw,
+            'vol_delta_roll': delta_roll,
+            'vol_avg': vol_avg,
+            'candle_range_pct': range_pct,
+        }
 
     # =========================================================================
     # VWAP
     # =========================================================================
 
-    def _add_vwap(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _vwap_columns(self, df: pd.DataFrame, vwap: np.ndarray = None) -> Dict[str, np.ndarray]:
         """
-        Add calculated VWAP column (cumulative daily VWAP).
+        Calculated VWAP column (cumulative daily VWAP).
 
-        Uses shared.indicators.core.vwap.vwap_df with daily reset.
+        Unless precomputed by the fused kernel, typical price * volume and
+        volume are cumulated per bar_date with a groupby cumsum on plain
+        arrays (same result as shared vwap_df, without its frame copy).
+        Falls back to vwap_df when there is no bar_date column.
         """
-        df['vwap_calc'] = vwap_df(df, reset_daily=True)
-        return df
+        if vwap is not None:
+            return {'vwap_calc': vwap}
+        if 'bar_date' not in df.columns:
+            return {'vwap_calc': vwap_df(df, reset_daily=True).to_numpy(dtype=np.float64)}
+
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
+        days = df['bar_date'].to_numpy()
+
+        tp = (high + low + close) / 3.0
+        cum_tp_vol = pd.Series(tp * volume).groupby(days).cumsum().to_numpy()
+        cum_vol = pd.Series(volume).groupby(days).cumsum().to_numpy()
+
+        vwap = np.divide(
+            cum_tp_vol, cum_vol, out=np.full(len(df), np.nan), where=cum_vol != 0
+        )
+        return {'vwap_calc': vwap}
 
     # =========================================================================
     # SMA SUITE: SMA9, SMA21, config, spread_pct, price_position
     # =========================================================================
 
-    def _add_sma_suite(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _sma_suite_columns(
+        self,
+        df: pd.DataFrame,
+        sma9: np.ndarray = None,
+        sma21: np.ndarray = None
+    ) -> Dict[str, np.ndarray]:
         """
-        Add all SMA-related columns using shared vectorized calculation.
+        All SMA-related columns.
+
+        Returns: sma9, sma21, sma_spread, sma_config, sma_spread_pct, price_position
 
-        Adds: sma9, sma21, sma_spread, sma_config, sma_spread_pct, price_position
+        sma9/sma21 come from the fused kernel, or from _rolling_mean with
+        CONFIG.sma fast/slow periods; spread, config and spread_pct use the
+        same formulas as shared sma_spread_df.
         """
-        # Use shared sma_spread_df for sma9, sma21, spread, config, spread_pct
-        sma_result = sma_spread_df(df)
-        df['sma9'] = sma_result['sma9']
-        df['sma21'] = sma_result['sma21']
-        df['sma_spread'] = sma_result['sma_spread']
-        df['sma_config'] = sma_result['sma_config']
-        df['sma_spread_pct'] = sma_result['sma_spread_pct']
+        close = df['close'].to_numpy(dtype=np.float64)
 
-        # Handle NaN -> None for sma_config (string column)
-        df['sma_config'] = df['sma_config'].where(
-            df['sma9'].notna() & df['sma21'].notna(), other=None
-        )
+        if sma9 is None or sma21 is None:
+            sma9 = _rolling_mean(close, CONFIG.sma.fast_period)
+            sma21 = _rolling_mean(close, CONFIG.sma.slow_period)
 
-        # Price position: ABOVE, BTWN, BELOW
-        def get_position(row):
-            close = row.get('close')
-            sma9 = row.get('sma9')
-            sma21 = row.get('sma21')
-            if pd.isna(sma9) or pd.isna(sma21) or pd.isna(close):
-                return None
-            higher = max(sma9, sma21)
-            lower = min(sma9, sma21)
-            if close > higher:
-                return 'ABOVE'
-            elif close < lower:
-                return 'BELOW'
-            else:
-                return 'BTWN'
+        spread = sma9 - sma21
+        config = np.where(
+            sma9 > sma21, 'BULL', np.where(sma9 < sma21, 'BEAR', 'FLAT')
+        ).astype(object)
+        spread_pct = np.where(close > 0, np.abs(spread) / close * 100, 0.0)
 
-        df['price_position'] = df.apply(get_position, axis=1)
-        return df
+        # Handle NaN -> None for sma_config (string column)
+        sma_nan = np.isnan(sma9) | np.isnan(sma21)
+        config[sma_nan] = None
+
+        # Price position: ABOVE, BTWN, BELOW (vectorized, None where any input is NaN)
+        higher = np.maximum(sma9, sma21)
+        lower = np.minimum(sma9, sma21)
+        position = np.select(
+            [close > higher, close < lower], ['ABOVE', 'BELOW'], default='BTWN'
+        ).astype(object)
+        position[sma_nan | np.isnan(close)] = None
+
+        return {
+            'sma9': sma9,
+            'sma21': sma21,
+            'sma_spread': spread,
+            'sma_config': config,
+            'sma_spread_pct': spread_pct,
+            'price_position': position,
+        }
 
     # =========================================================================
     # SMA MOMENTUM
     # =========================================================================
 
-    def _add_sma_momentum(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _sma_momentum_columns(self, sma_spread: np.ndarray) -> Dict[str, np.ndarray]:
         """
-        Add SMA momentum ratio and label columns.
+        SMA momentum ratio and label columns.
 
         Uses CONFIG.sma.momentum_lookback and CONFIG.sma.widening_threshold.
         """
         cfg = CONFIG.sma
-
-        # Get absolute spread
-        abs_spread = df['sma_spread'].abs()
-
-        # Calculate spread from N bars ago
-        prev_spread = abs_spread.shift(cfg.momentum_lookback)
-
-        # Calculate ratio
-        df['sma_momentum_ratio'] = abs_spread / prev_spread.replace(0, np.nan)
+        lookback = cfg.momentum_lookback
+        n = len(sma_spread)
+
+        # Absolute spread now vs N bars ago
+        abs_spread = np.abs(sma_spread)
+        prev_spread = np.full(n, np.nan)
+        if lookback < n:
+            prev_spread[lookback:] = abs_spread[:n - lookback]
+
+        # Calculate ratio (NaN where the previous spread is 0 or unavailable)
+        ratio = np.divide(
+            abs_spread, prev_spread, out=np.full(n, np.nan), where=prev_spread != 0
+        )
 
         # Cap ratio to prevent database overflow (max 9999.999999 for DECIMAL(10,6))
-        df['sma_momentum_ratio'] = df['sma_momentum_ratio'].clip(upper=999.0)
-
-        # Determine momentum label
-        def get_momentum_label(ratio):
-            if pd.isna(ratio):
-                return None
-            if ratio > cfg.widening_threshold:
-                return 'WIDENING'
-            elif ratio < 1.0 / cfg.widening_threshold:
-                return 'NARROWING'
-            else:
-                return 'STABLE'
-
-        df['sma_momentum_label'] = df['sma_momentum_ratio'].apply(get_momentum_label)
-
-        return df
+        np.minimum(ratio, 999.0, out=ratio)
+
+        # Determine momentum label (None where ratio is NaN)
+        if NUMBA_AVAILABLE and cfg.widening_threshold == _WIDENING_THRESHOLD:
+            # NaN inputs trip the ufunc's FP-error check; they map to -1 by design
+            with np.errstate(invalid='ignore'):
+                codes = _momentum_code(ratio)
+        else:
+            codes = np.select(
+                [np.isnan(ratio),
+                 ratio > cfg.widening_threshold,
+                 ratio < 1.0 / cfg.widening_threshold],
+                [-1, 2, 0],
+                default=1
+            )
+        label = _MOMENTUM_LABELS[codes + 1]
+
+        return {'sma_momentum_ratio': ratio, 'sma_momentum_label': label}
 
     # =========================================================================
     # VOLUME ROC
     # =========================================================================
 
-    def _add_volume_roc(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _volume_roc_columns(self, df: pd.DataFrame, vol_roc: np.ndarray = None) -> Dict[str, np.ndarray]:
         """
-        Add Volume ROC column using shared vectorized calculation.
+        Volume ROC column using shared vectorized calculation.
 
-        Uses shared.indicators.core.volume_roc.volume_roc_df.
+        Uses shared.indicators.core.volume_roc.volume_roc_df unless precomputed
+        by the fused kernel.
         Output: percentage (0% = average, 30% = elevated, 50% = high).
         """
-        df['vol_roc'] = volume_roc_df(df)
-        return df
+        if vol_roc is None:
+            vol_roc = volume_roc_df(df).to_numpy(dtype=np.float64)
+        return {'vol_roc': vol_roc}
 
     # =========================================================================
     # VOLUME DELTA
     # =========================================================================
 
-    def _add_volume_delta(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _volume_delta_columns(
+        self,
+        df: pd.DataFrame,
+        fused: Dict[str, np.ndarray] = None
+    ) -> Dict[str, np.ndarray]:
         """
-        Add Volume Delta columns (raw single-bar + rolling sum + normalized).
+        Volume Delta columns (raw single-bar + rolling sum + normalized).
 
         Uses shared.indicators.core.volume_delta:
         - volume_delta_df() for per-bar delta
         - rolling_delta_df() for rolling sum
 
         v3 change: Added vol_delta_norm (roll / avg_volume) for cross-ticker comparability.
+
+        fused supplies vol_delta_raw, vol_delta_roll and vol_avg from the fused
+        kernel when available.
         """
-        # Per-bar delta using shared vectorized calculation
-        df['vol_delta_raw'] = volume_delta_df(df)
+        if fused:
+            delta_raw = fused['vol_delta_raw']
+            delta_roll = fused['vol_delta_roll']
+            avg_vol = fused['vol_avg']
+        else:
+            # Per-bar delta using shared vectorized calculation
+            delta_raw = volume_delta_df(df).to_numpy(dtype=np.float64)
 
-        # Rolling sum using shared vectorized calculation
-        df['vol_delta_roll'] = rolling_delta_df(df)
+            # Rolling sum using shared vectorized calculation
+            delta_roll = rolling_delta_df(df).to_numpy(dtype=np.float64)
 
-        # Normalize by average volume for cross-ticker comparability
-        period = CONFIG.volume_delta.rolling_period
-        avg_vol = df['volume'].rolling(window=period, min_periods=period).mean()
-        df['vol_delta_norm'] = df['vol_delta_roll'] / avg_vol.replace(0, np.nan)
+            period = CONFIG.volume_delta.rolling_period
+            avg_vol = df['volume'].rolling(window=period, min_periods=period).mean()
+            avg_vol = avg_vol.to_numpy(dtype=np.float64)
 
-        # Keep backward-compatible vol_delta alias
-        df['vol_delta'] = df['vol_delta_roll']
+        # Normalize by average volume for cross-ticker comparability
+        # (NaN where the average is 0 or unavailable)
+        delta_norm = np.divide(
+            delta_roll, avg_vol, out=np.full(len(avg_vol), np.nan), where=avg_vol != 0
+        )
 
-        return df
+        return {
+            'vol_delta_raw': delta_raw,
+            'vol_delta_roll': delta_roll,
+            'vol_delta_norm': delta_norm,
+            # Keep backward-compatible vol_delta alias
+            'vol_delta': delta_roll,
+        }
 
     # =========================================================================
     # CVD SLOPE
     # =========================================================================
 
-    def _add_cvd_slope(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _cvd_slope_columns(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
         """
-        Add CVD Slope column using shared vectorized calculation.
+        CVD Slope column using shared vectorized calculation.
 
         Uses shared.indicators.core.cvd.cvd_slope_df.
         Linear regression, normalized by CVD range x window, clamped [-2, 2].
         """
-        df['cvd_slope'] = cvd_slope_df(df)
-        return df
+        return {'cvd_slope': cvd_slope_df(df).to_numpy(dtype=np.float64)}
 
     # =========================================================================
     # CANDLE RANGE
     # =========================================================================
 
-    def _add_candle_range(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _candle_range_columns(self, df: pd.DataFrame, range_pct: np.ndarray = None) -> Dict[str, np.ndarray]:
         """
-        Add candle_range_pct column using shared vectorized calculation.
+        candle_range_pct column using shared vectorized calculation.
 
         Formula: (high - low) / close * 100
         Used as primary skip filter for absorption zones.
         """
-        df['candle_range_pct'] = candle_range_pct_df(df)
-        return df
+        if range_pct is None:
+            range_pct = candle_range_pct_df(df).to_numpy(dtype=np.float64)
+        return {'candle_range_pct': range_pct}
 
     # =========================================================================
     # ATR (AVERAGE TRUE RANGE) - M1 TIMEFRAME
     # =========================================================================
 
-    def _add_atr_m1(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _atr_m1_columns(self, df: pd.DataFrame, atr: np.ndarray = None) -> Dict[str, np.ndarray]:
         """
-        Add M1 ATR column using shared vectorized calculation.
+        M1 ATR column using shared vectorized calculation.
 
         True Range = max(high - low, |high - prev_close|, |low - prev_close|)
         ATR = SMA of True Range over CONFIG.atr.period bars
 
-        Uses shared.indicators.core.atr.atr_df.
+        Uses shared.indicators.core.atr.atr_df unless precomputed by the
+        fused kernel.
         """
-        df['atr_m1'] = atr_df(df)
-        return df
+        if atr is None:
+            atr = atr_df(df).to_numpy(dtype=np.float64)
+        return {'atr_m1': atr}
 
     # =========================================================================
     # SNAPSHOT UTILITIES
@@ -382,6 +804,106 @@ class M1IndicatorCalculator:
             bars_in_calculation=index + 1
         )
 
+    def get_indicator_arrays(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Get the snapshot columns of df as NumPy arrays, keyed by snapshot field.
+
+        Float fields are float64 (NaN where missing), label fields are object
+        arrays (None where missing). Arrays are extracted once and reused for
+        repeated calls with the same DataFrame, so do not mutate df in between.
+        """
+        bound = self._bound_df() if self._bound_df is not None else None
+        if bound is df:
+            return self._bound_arrays
+
+        n = len(df)
+        arrays = {}
+        for field, col in _SNAPSHOT_FLOAT_COLUMNS.items():
+            if col in df.columns:
+                arrays[field] = df[col].to_numpy(dtype=np.float64)
+            else:
+                arrays[field] = np.full(n, np.nan)
+        for field in _SNAPSHOT_LABEL_COLUMNS:
+            if field in df.columns:
+                labels = df[field].to_numpy(dtype=object, copy=True)
+                labels[pd.isna(labels)] = None
+                arrays[field] = labels
+            else:
+                arrays[field] = np.full(n, None, dtype=object)
+
+        self._bound_df = weakref.ref(df)
+        self._bound_arrays = arrays
+        return arrays
+
+    def get_snapshot_view(self, df: pd.DataFrame, index: int) -> Optional[IndicatorSnapshotView]:
+        """
+        Get an array-backed indicator snapshot at a specific DataFrame index.
+
+        Same fields and values as get_snapshot_at_index, without building a
+        row Series or a tuple of converted values per call.
+
+        Args:
+            df: DataFrame with indicator columns already added
+            index: Row index to get snapshot for
+
+        Returns:
+            IndicatorSnapshotView or None if index is invalid
+        """
+        if index < 0 or index >= len(df):
+            return None
+        return IndicatorSnapshotView(self.get_indicator_arrays(df), index)
+
+    def get_snapshots(
+        self,
+        df: pd.DataFrame,
+        indices: List[int]
+    ) -> List[Optional[IndicatorSnapshot]]:
+        """
+        Get indicator snapshots for many DataFrame indices at once.
+
+        Equivalent to calling get_snapshot_at_index for each index, but rounds
+        and converts NaN -> None column-wise instead of per field per row.
+
+        Args:
+            df: DataFrame with indicator columns already added
+            indices: Row indices to get snapshots for
+
+        Returns:
+            List aligned with indices (None for invalid indices)
+        """
+        idx = np.asarray(indices, dtype=np.int64).reshape(-1)
+        valid = (idx >= 0) & (idx < len(df))
+        rows = idx[valid]
+        arrays = self.get_indicator_arrays(df)
+
+        columns = {}
+        for field in _SNAPSHOT_FLOAT_COLUMNS:
+            values = np.round(arrays[field][rows], 6)
+            cleaned = values.astype(object)
+            cleaned[np.isnan(values)] = None
+            columns[field] = cleaned
+        for field in _SNAPSHOT_LABEL_COLUMNS:
+            columns[field] = arrays[field][rows]
+
+        snapshots = [
+            IndicatorSnapshot(
+                **dict(zip(columns, values)),
+                health_score=None,  # DEPRECATED per SWH-6
+                long_score=None,    # DEPRECATED per SWH-6
+                short_score=None,   # DEPRECATED per SWH-6
+                bars_in_calculation=int(i) + 1
+            )
+            for i, *values in zip(rows, *columns.values())
+        ]
+
+        if valid.all():
+            return snapshots
+
+        results: List[Optional[IndicatorSnapshot]] = [None] * len(idx)
+        for pos, snapshot in zip(np.flatnonzero(valid), snapshots):
+            results[pos] = snapshot
+        return results
+
     def _safe_float(self, value) -> Optional[float]:
         """Convert value to float, returning None for NaN."""
         if value is None or (isinstance(value, float) and np.isnan(value)):
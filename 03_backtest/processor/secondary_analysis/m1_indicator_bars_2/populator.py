@@ -164,6 +164,9 @@ class M1IndicatorBarsPopulator:
         """
         Insert calculation results into m1_indicator_bars_2 table.
 
+        The deprecated health_score/long_score/short_score columns are not
+        in the column list, so they take their NULL default.
+
         Args:
             conn: Database connection
             results: List of M1IndicatorBarResult objects
@@ -182,7 +185,6 @@ class M1IndicatorBarsPopulator:
                 sma9, sma21, sma_config, sma_spread_pct, price_position,
                 vwap, sma_spread, sma_momentum_ratio, sma_momentum_label, cvd_slope,
                 h4_structure, h1_structure, m15_structure, m5_structure, m1_structure,
-                health_score, long_score, short_score,
                 atr_m1, atr_m5, atr_m15,
                 bars_in_calculation
             ) VALUES %s
@@ -220,9 +222,6 @@ class M1IndicatorBarsPopulator:
                 r.m15_structure,
                 r.m5_structure,
                 r.m1_structure,
-                self._convert_numpy(r.health_score),
-                self._convert_numpy(r.long_score),
-                self._convert_numpy(r.short_score),
                 self._convert_numpy(r.atr_m1),
                 self._convert_numpy(r.atr_m5),
                 self._convert_numpy(r.atr_m15),
@@ -390,6 +389,7 @@ class M1IndicatorBarsPopulator:
         finally:
             if calculator:
                 calculator.clear_caches()
+            _calc_mod.db_pool.close_pool()
             if conn:
                 conn.close()
 
@@ -75,5 +75,25 @@ CREATE INDEX IF NOT EXISTS idx_m1_indicator_bars_2_structure
 CREATE INDEX IF NOT EXISTS idx_m1_indicator_bars_2_sma_config
     ON m1_indicator_bars_2 (ticker, bar_date, sma_config, price_position);
 
+-- Covering index for the secondary-analysis bar windows (trade, ramp-up and
+-- post-trade processors: ticker, bar_date, bar_time range ORDER BY bar_time).
+-- INCLUDE-ing the columns those processors pull lets the lookups run as
+-- index-only scans instead of visiting the heap for every bar.
+-- On a large live table, build it by hand first with
+-- CREATE INDEX CONCURRENTLY (not allowed inside this multi-statement script).
+CREATE INDEX IF NOT EXISTS idx_m1_indicator_bars_2_covering
+    ON m1_indicator_bars_2 (ticker, bar_date, bar_time)
+    INCLUDE (
+        open, high, low, close, volume,
+        candle_range_pct,
+        vol_delta_raw, vol_delta_roll, vol_delta_norm,
+        vol_roc,
+        sma9, sma21, sma_config, sma_spread_pct,
+        sma_momentum_label, price_position,
+        cvd_slope,
+        m5_structure, m15_structure, h1_structure,
+        health_score, long_score, short_score
+    );
+
 COMMENT ON TABLE m1_indicator_bars_2 IS
     'Pre-computed 1-minute indicator bars (v2). Reads from m1_bars_2, calculates entry qualifier standard + extended indicators.';
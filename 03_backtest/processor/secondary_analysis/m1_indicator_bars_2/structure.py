@@ -20,6 +20,8 @@ Version: 2.0.0
 """
 
 from typing import Dict, List, Optional, Tuple, NamedTuple
+from contextlib import contextmanager
+import sys
 import numpy as np
 from datetime import datetime, date, time, timedelta
 import requests
@@ -55,6 +57,14 @@ HTF_BARS_NEEDED = _config.HTF_BARS_NEEDED
 HTF_LOOKBACK_DAYS = _config.HTF_LOOKBACK_DAYS
 DB_CONFIG = _config.DB_CONFIG
 
+# Load shared connection pool (one instance per process, see db_pool.py)
+db_pool = sys.modules.get("m1_indicator_bars_2_db_pool")
+if db_pool is None:
+    _db_pool_spec = importlib.util.spec_from_file_location("m1_indicator_bars_2_db_pool", _MODULE_DIR / "db_pool.py")
+    db_pool = importlib.util.module_from_spec(_db_pool_spec)
+    sys.modules["m1_indicator_bars_2_db_pool"] = db_pool
+    _db_pool_spec.loader.exec_module(db_pool)
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -433,11 +443,10 @@ class HTFBarFetcher:
         """
 
         try:
-            conn = psycopg2.connect(**self.db_config)
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(query, (ticker, from_date, trade_date))
-                rows = cur.fetchall()
-            conn.close()
+            with self._connect() as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    cur.execute(query, (ticker, from_date, trade_date))
+                    rows = cur.fetchall()
 
             if not rows:
                 return []
@@ -463,6 +472,19 @@ class HTFBarFetcher:
             # Log error but don't crash - will fall back to API
             return []
 
+    @contextmanager
+    def _connect(self):
+        """Pooled connection for the default DB_CONFIG, a dedicated one otherwise."""
+        if self.db_config is DB_CONFIG:
+            with db_pool.pooled_connection() as conn:
+                yield conn
+        else:
+            conn = psycopg2.connect(**self.db_config)
+            try:
+                yield conn
+            finally:
+                conn.close()
+
     def _filter_bars_by_time(self, bars: List[Dict], trade_date: date, end_time: time) -> List[Dict]:
         """Filter bars to only include those before end_time on the trading date."""
         filtered = []
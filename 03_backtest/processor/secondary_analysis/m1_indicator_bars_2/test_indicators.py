@@ -0,0 +1,64 @@
+"""
+Tests that the fused indicator kernel matches the shared.indicators path.
+"""
+
+import importlib.util
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Load local indicators by path, as calculator.py does
+_indicators_spec = importlib.util.spec_from_file_location(
+    "indicators", Path(__file__).resolve().parent / "indicators.py"
+)
+indicators = importlib.util.module_from_spec(_indicators_spec)
+_indicators_spec.loader.exec_module(indicators)
+
+
+def _bars(n: int = 900, seed: int = 0) -> pd.DataFrame:
+    """Random-walk M1 OHLCV frame spanning a few sessions."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 + (rng.standard_normal(n) * 0.1).cumsum()
+    open_ = close + rng.standard_normal(n) * 0.05
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + rng.random(n) * 0.2,
+        'low': np.minimum(open_, close) - rng.random(n) * 0.2,
+        'close': close,
+        'volume': rng.integers(100, 5000, n).astype(np.float64),
+        'vwap': close,
+        'bar_date': [date(2024, 1, 2) + timedelta(days=i // 390) for i in range(n)],
+    })
+
+
+def _both_paths(monkeypatch, df: pd.DataFrame):
+    """add_all_indicators output with the fused kernel on, then off."""
+    frames = []
+    for fused in (True, False):
+        monkeypatch.setattr(indicators, 'USE_FUSED_KERNEL', fused)
+        frames.append(indicators.M1IndicatorCalculator().add_all_indicators(df))
+    return frames
+
+
+def test_fused_matches_shared_path_with_nan_close_and_volume(monkeypatch):
+    df = _bars()
+    df.loc[100, 'close'] = np.nan
+    df.loc[400, 'volume'] = np.nan
+
+    fused, shared = _both_paths(monkeypatch, df)
+
+    pd.testing.assert_frame_equal(fused, shared)
+
+
+def test_fused_matches_shared_path_with_nan_in_every_column(monkeypatch):
+    for seed in range(5):
+        df = _bars(seed=seed)
+        rng = np.random.default_rng(seed)
+        for col in ('open', 'high', 'low', 'close', 'volume'):
+            df.loc[rng.integers(0, len(df), 2), col] = np.nan
+
+        fused, shared = _both_paths(monkeypatch, df)
+
+        pd.testing.assert_frame_equal(fused, shared)
@@ -12,11 +12,17 @@ Trade outcome is stamped on every row for easy aggregation.
 Pipeline:
     1. Query trades in trades_2 INNER JOIN m5_atr_stop_2 (outcome required)
        that are NOT yet in m1_post_trade_indicator_2
-    2. For each trade: query 25 bars from m1_indicator_bars_2 starting at
+    2. LATERAL-join 25 bars from m1_indicator_bars_2 per trade starting at
        the entry candle (entry_time floored to minute)
-    3. Assign bar_sequence 0-24
+    3. Assign bar_sequence 0-24 with ROW_NUMBER()
     4. Stamp outcome (is_winner, pnl_r, max_r) on every row
-    5. INSERT with ON CONFLICT DO UPDATE
+    5. Upsert with a single INSERT ... SELECT ... ON CONFLICT DO UPDATE,
+       run entirely server-side (no row data crosses the wire)
+
+Dry runs stream the same bars through a server-side cursor and build the
+rows in Python (build_trade_rows) for preview. There are no per-trade
+bar queries left to overlap, so the fetch stays on a single psycopg2
+connection rather than an async driver or connection pool.
 
 Note: The entry candle IS included here (bar_sequence 0) because we are
 analyzing what happens AFTER the trade is entered.
@@ -27,39 +33,54 @@ Version: 1.0.0
 ================================================================================
 """
 
-import sys
 import logging
-from pathlib import Path
-from datetime import date, time, datetime, timedelta
-from decimal import Decimal
-from typing import List, Dict, Tuple, Optional
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterator, List, Dict, Tuple, Optional
 
 import psycopg2
-from psycopg2.extras import execute_values, RealDictCursor
 
 # Self-contained imports
 from config import (
     DB_CONFIG, SOURCE_TABLES, TARGET_TABLE,
-    INDICATOR_COLUMNS, POST_TRADE_BARS, BATCH_SIZE
+    INDICATOR_COLUMNS, POST_TRADE_BARS
 )
 
 logger = logging.getLogger(__name__)
 
+# Target columns, in build_trade_rows tuple order
+_TARGET_COLUMNS = (
+    'trade_id', 'bar_sequence',
+    'ticker', 'bar_date', 'bar_time',
+    'open', 'high', 'low', 'close', 'volume',
+    'candle_range_pct',
+    'vol_delta_raw', 'vol_delta_roll', 'vol_delta_norm',
+    'vol_roc',
+    'sma9', 'sma21', 'sma_config', 'sma_spread_pct',
+    'sma_momentum_label', 'price_position',
+    'cvd_slope',
+    'm5_structure', 'm15_structure', 'h1_structure',
+    'health_score', 'long_score', 'short_score',
+    'is_winner', 'pnl_r', 'max_r_achieved',
+)
+_IS_WINNER_IDX = _TARGET_COLUMNS.index('is_winner')
+_DONE_IDS_TABLE = "m1_post_trade_indicator_2_done"
+
+# Trade fields returned alongside each bar by stream_post_trade_bars
+_TRADE_FIELDS = (
+    'trade_id', 'ticker', 'date', 'direction', 'model', 'zone_type',
+    'entry_time', 'entry_price', 'result', 'max_r',
+)
+# Stream rows are _TRADE_FIELDS, then the bar: bar_date, bar_time, *INDICATOR_COLUMNS
+_BAR_OFFSET = len(_TRADE_FIELDS)
+_BAR_TIME_IDX = _BAR_OFFSET + 1
+_STREAM_ITERSIZE = 10_000
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def _safe_float(val) -> Optional[float]:
-    """Convert Decimal/numpy to Python float, None-safe."""
-    if val is None:
-        return None
-    try:
-        return float(val)
-    except (TypeError, ValueError):
-        return None
-
-
 def _safe_int(val) -> Optional[int]:
     """Convert to Python int, None-safe."""
     if val is None:
@@ -70,12 +91,20 @@ def _safe_int(val) -> Optional[int]:
         return None
 
 
-def _floor_to_minute(entry_time: time) -> time:
-    """Floor a time value to the minute boundary.
-
-    Example: 09:35:15 -> 09:35:00 (this is the entry candle start)
-    """
-    return time(entry_time.hour, entry_time.minute, 0)
+# Builtin converter per INDICATOR_COLUMNS value of a bar tuple (None = pass
+# through). The bars come straight from typed NUMERIC/INTEGER columns, so
+# float()/int() cannot fail and only NULLs need guarding.
+_INT_COLUMNS = ('volume', 'health_score', 'long_score', 'short_score')
+_TEXT_COLUMNS = (
+    'sma_config', 'sma_momentum_label', 'price_position',
+    'm5_structure', 'm15_structure', 'h1_structure',
+)
+_BAR_CONVERTERS = tuple(
+    None if col in _TEXT_COLUMNS
+    else int if col in _INT_COLUMNS
+    else float
+    for col in INDICATOR_COLUMNS
+)
 
 
 # =============================================================================
@@ -87,7 +116,7 @@ class M1PostTradeIndicatorPopulator:
     Populates m1_post_trade_indicator_2 with 25-bar post-trade indicator windows.
 
     For each trade in trades_2 that has an outcome in m5_atr_stop_2:
-    - Query 25 M1 bars starting at entry candle
+    - Join 25 M1 bars starting at entry candle (one query for all trades)
     - Stamp outcome on every row
     - Insert into m1_post_trade_indicator_2
     """
@@ -96,91 +125,111 @@ class M1PostTradeIndicatorPopulator:
         self.verbose = verbose
 
     # -----------------------------------------------------------------
-    # STEP 1: Get eligible trades
+    # ELIGIBILITY: Snapshot already-populated trades
     # -----------------------------------------------------------------
 
-    def get_eligible_trades(self, conn, limit: Optional[int] = None) -> List[dict]:
+    def _stage_done_ids(self, cur):
         """
-        Query trades that have outcomes but are not yet in m1_post_trade_indicator_2.
+        Materialize the trade_ids already in m1_post_trade_indicator_2 into
+        an indexed, analyzed temp table (dropped on commit).
 
-        INNER JOIN m5_atr_stop_2 ensures only trades with completed outcomes
-        are returned. Trades without outcomes are SKIPPED entirely.
+        The eligibility queries anti-join against this one-row-per-trade
+        snapshot instead of probing the 25-rows-per-trade target.
         """
-        trades_table = SOURCE_TABLES['trades']
-        m5_table = SOURCE_TABLES['m5_atr_stop']
-
-        query = f"""
-            SELECT
-                t.trade_id,
-                t.ticker,
-                t.date,
-                t.direction,
-                t.model,
-                t.zone_type,
-                t.entry_time,
-                t.entry_price,
-                m5.result,
-                m5.max_r
-            FROM {trades_table} t
-            INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
-            WHERE NOT EXISTS (
-                SELECT 1 FROM {TARGET_TABLE} pt
-                WHERE pt.trade_id = t.trade_id
-            )
-            ORDER BY t.date, t.ticker, t.entry_time
-        """
-
-        if limit:
-            query += f" LIMIT {limit}"
-
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(query)
-            rows = cur.fetchall()
-
-        if self.verbose:
-            print(f"  Found {len(rows)} trades needing post-trade data")
-
-        return [dict(r) for r in rows]
+        cur.execute(f"DROP TABLE IF EXISTS pg_temp.{_DONE_IDS_TABLE}")
+        cur.execute(f"""
+            CREATE TEMP TABLE {_DONE_IDS_TABLE} ON COMMIT DROP AS
+            SELECT DISTINCT trade_id FROM {TARGET_TABLE}
+        """)
+        cur.execute(f"CREATE INDEX ON {_DONE_IDS_TABLE} (trade_id)")
+        cur.execute(f"ANALYZE {_DONE_IDS_TABLE}")
 
     # -----------------------------------------------------------------
-    # STEP 2: Get post-trade indicator bars for a single trade
+    # STEPS 1-2: Stream eligible trades with their post-trade bars
     # -----------------------------------------------------------------
 
-    def get_post_trade_bars(self, conn, ticker: str, bar_date: date,
-                            start_bar_time: time, num_bars: int = 25) -> List[dict]:
+    def stream_post_trade_bars(
+        self, conn, limit: Optional[int] = None,
+        num_bars: int = POST_TRADE_BARS
+    ) -> Iterator[Tuple[dict, List[tuple]]]:
         """
-        Fetch the N M1 indicator bars starting at start_bar_time (inclusive).
+        Stream (trade, bars) for every eligible trade from a single query.
+
+        Eligible trades have an outcome in m5_atr_stop_2 (INNER JOIN) and are
+        not yet in m1_post_trade_indicator_2. A LATERAL join pulls the first
+        num_bars indicator bars at or after each entry candle, rows are
+        streamed through a server-side cursor in _STREAM_ITERSIZE batches,
+        and consecutive rows are grouped per trade. Trades without indicator
+        bars are yielded with an empty bar list.
 
-        Returns bars in chronological order.
+        Each bar is a plain tuple (bar_date, bar_time, *INDICATOR_COLUMNS).
         """
+        trades_table = SOURCE_TABLES['trades']
+        m5_table = SOURCE_TABLES['m5_atr_stop']
         indicators_table = SOURCE_TABLES['m1_indicators']
         cols = ', '.join(INDICATOR_COLUMNS)
+        bar_cols = ', '.join(f"b.{c}" for c in INDICATOR_COLUMNS)
+        limit_clause = f"LIMIT {int(limit)}" if limit else ""
 
         query = f"""
-            SELECT bar_date, bar_time, {cols}
-            FROM {indicators_table}
-            WHERE ticker = %s AND bar_date = %s AND bar_time >= %s
-            ORDER BY bar_time ASC
-            LIMIT %s
+            WITH eligible AS (
+                SELECT
+                    t.trade_id,
+                    t.ticker,
+                    t.date,
+                    t.direction,
+                    t.model,
+                    t.zone_type,
+                    t.entry_time,
+                    t.entry_price,
+                    m5.result,
+                    m5.max_r
+                FROM {trades_table} t
+                INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
+                LEFT JOIN {_DONE_IDS_TABLE} d ON d.trade_id = t.trade_id
+                WHERE d.trade_id IS NULL
+                ORDER BY t.date, t.ticker, t.entry_time
+                {limit_clause}
+            )
+            SELECT e.*, b.bar_date, b.bar_time, {bar_cols}
+            FROM eligible e
+            LEFT JOIN LATERAL (
+                SELECT bar_date, bar_time, {cols}
+                FROM {indicators_table}
+                WHERE ticker = e.ticker AND bar_date = e.date
+                  AND bar_time >= date_trunc('minute', e.entry_time::interval)::time
+                ORDER BY bar_time ASC
+                LIMIT %s
+            ) b ON TRUE
+            ORDER BY e.date, e.ticker, e.entry_time, e.trade_id, b.bar_time
         """
 
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(query, (ticker, bar_date, start_bar_time, num_bars))
-            rows = cur.fetchall()
+        with conn.cursor() as cur:
+            self._stage_done_ids(cur)
+
+        with conn.cursor(name='post_trade_stream') as cur:
+            cur.itersize = _STREAM_ITERSIZE
+            cur.execute(query, (num_bars,))
 
-        return [dict(r) for r in rows]
+            for _, rows in groupby(cur, key=itemgetter(0)):
+                rows = list(rows)
+                trade = dict(zip(_TRADE_FIELDS, rows[0]))
+                # LEFT JOIN yields one all-NULL bar row for trades without bars
+                bars = [r[_BAR_OFFSET:] for r in rows if r[_BAR_TIME_IDX] is not None]
+                yield trade, bars
 
     # -----------------------------------------------------------------
     # STEP 3: Build rows for a single trade
     # -----------------------------------------------------------------
 
-    def build_trade_rows(self, trade: dict, bars: List[dict]) -> List[tuple]:
+    def build_trade_rows(self, trade: dict, bars: List[tuple]) -> List[tuple]:
         """
         Build rows for m1_post_trade_indicator_2 from a trade's post-trade bars.
 
-        Each bar gets a bar_sequence from 0 (entry candle) to len(bars)-1.
-        Trade outcome is stamped on every row.
-        Returns list of tuples ready for execute_values INSERT.
+        Bars are tuples as yielded by stream_post_trade_bars. Each bar gets a
+        bar_sequence from 0 (entry candle) to len(bars)-1. Trade outcome is
+        stamped on every row.
+        Returns list of tuples in _TARGET_COLUMNS order.
         """
         rows = []
         trade_id = trade['trade_id']
@@ -190,115 +239,127 @@ class M1PostTradeIndicatorPopulator:
         is_winner = (trade['result'] == 'WIN')
         max_r = _safe_int(trade['max_r']) or -1
         pnl_r = float(max_r)
+        outcome = (is_winner, pnl_r, max_r)
 
         for seq, bar in enumerate(bars):
-            row = (
-                trade_id,
-                seq,
-                ticker,
-                bar['bar_date'],
-                bar['bar_time'],
-                # OHLCV
-                _safe_float(bar.get('open')),
-                _safe_float(bar.get('high')),
-                _safe_float(bar.get('low')),
-                _safe_float(bar.get('close')),
-                _safe_int(bar.get('volume')),
-                # Core Indicators
-                _safe_float(bar.get('candle_range_pct')),
-                _safe_float(bar.get('vol_delta_raw')),
-                _safe_float(bar.get('vol_delta_roll')),
-                _safe_float(bar.get('vol_delta_norm')),
-                _safe_float(bar.get('vol_roc')),
-                _safe_float(bar.get('sma9')),
-                _safe_float(bar.get('sma21')),
-                bar.get('sma_config'),
-                _safe_float(bar.get('sma_spread_pct')),
-                bar.get('sma_momentum_label'),
-                bar.get('price_position'),
-                _safe_float(bar.get('cvd_slope')),
-                # Structure
-                bar.get('m5_structure'),
-                bar.get('m15_structure'),
-                bar.get('h1_structure'),
-                # Composite Scores
-                _safe_int(bar.get('health_score')),
-                _safe_int(bar.get('long_score')),
-                _safe_int(bar.get('short_score')),
-                # Outcome (stamped on every row)
-                is_winner,
-                pnl_r,
-                max_r,
+            values = tuple(
+                val if val is None or convert is None else convert(val)
+                for convert, val in zip(_BAR_CONVERTERS, bar[2:])
             )
-            rows.append(row)
+            rows.append((trade_id, seq, ticker, bar[0], bar[1]) + values + outcome)
 
         return rows
 
-    # -----------------------------------------------------------------
-    # STEP 4: Insert rows
-    # -----------------------------------------------------------------
+    def populate_in_database(self, conn, limit: Optional[int] = None,
+                             num_bars: int = POST_TRADE_BARS,
+                             skip_partial: bool = False) -> Dict:
+        """
+        Build and upsert post-trade rows entirely server-side.
 
-    def insert_rows(self, conn, rows: List[tuple]) -> int:
-        """Insert rows into m1_post_trade_indicator_2 with ON CONFLICT upsert."""
-        if not rows:
-            return 0
+        One INSERT ... SELECT does the work of stream_post_trade_bars and
+        build_trade_rows plus the upsert: ROW_NUMBER() over the first
+        num_bars bars at or after each entry candle gives bar_sequence, and
+        the outcome is stamped with the same rules as build_trade_rows
+        (is_winner = result 'WIN', max_r 0/NULL -> -1, pnl_r = max_r).
+        With skip_partial, trades with fewer than num_bars bars are left out.
 
-        query = f"""
-            INSERT INTO {TARGET_TABLE} (
-                trade_id, bar_sequence,
-                ticker, bar_date, bar_time,
-                open, high, low, close, volume,
-                candle_range_pct,
-                vol_delta_raw, vol_delta_roll, vol_delta_norm,
-                vol_roc,
-                sma9, sma21, sma_config, sma_spread_pct,
-                sma_momentum_label, price_position,
-                cvd_slope,
-                m5_structure, m15_structure, h1_structure,
-                health_score, long_score, short_score,
-                is_winner, pnl_r, max_r_achieved
-            ) VALUES %s
-            ON CONFLICT (trade_id, bar_sequence) DO UPDATE SET
-                ticker = EXCLUDED.ticker,
-                bar_date = EXCLUDED.bar_date,
-                bar_time = EXCLUDED.bar_time,
-                open = EXCLUDED.open,
-                high = EXCLUDED.high,
-                low = EXCLUDED.low,
-                close = EXCLUDED.close,
-                volume = EXCLUDED.volume,
-                candle_range_pct = EXCLUDED.candle_range_pct,
-                vol_delta_raw = EXCLUDED.vol_delta_raw,
-                vol_delta_roll = EXCLUDED.vol_delta_roll,
-                vol_delta_norm = EXCLUDED.vol_delta_norm,
-                vol_roc = EXCLUDED.vol_roc,
-                sma9 = EXCLUDED.sma9,
-                sma21 = EXCLUDED.sma21,
-                sma_config = EXCLUDED.sma_config,
-                sma_spread_pct = EXCLUDED.sma_spread_pct,
-                sma_momentum_label = EXCLUDED.sma_momentum_label,
-                price_position = EXCLUDED.price_position,
-                cvd_slope = EXCLUDED.cvd_slope,
-                m5_structure = EXCLUDED.m5_structure,
-                m15_structure = EXCLUDED.m15_structure,
-                h1_structure = EXCLUDED.h1_structure,
-                health_score = EXCLUDED.health_score,
-                long_score = EXCLUDED.long_score,
-                short_score = EXCLUDED.short_score,
-                is_winner = EXCLUDED.is_winner,
-                pnl_r = EXCLUDED.pnl_r,
-                max_r_achieved = EXCLUDED.max_r_achieved,
-                calculated_at = NOW()
+        Returns:
+            Dict with total_eligible, trades_processed, trades_partial_bars,
+            trades_skipped_partial, rows_inserted and winner_rows
         """
+        trades_table = SOURCE_TABLES['trades']
+        m5_table = SOURCE_TABLES['m5_atr_stop']
+        indicators_table = SOURCE_TABLES['m1_indicators']
+        columns = ', '.join(_TARGET_COLUMNS)
+        bar_cols = ', '.join(f"b.{c}" for c in INDICATOR_COLUMNS)
+        ind_cols = ', '.join(f"ind.{c}" for c in INDICATOR_COLUMNS)
+        window_cols = ', '.join(f"w.{c}" for c in INDICATOR_COLUMNS)
+        updates = ',\n                    '.join(
+            f"{col} = EXCLUDED.{col}" for col in _TARGET_COLUMNS[2:]
+        )
+        limit_clause = f"LIMIT {int(limit)}" if limit else ""
 
-        total_inserted = 0
-        for i in range(0, len(rows), BATCH_SIZE):
-            batch = rows[i:i + BATCH_SIZE]
-            with conn.cursor() as cur:
-                execute_values(cur, query, batch)
-            total_inserted += len(batch)
+        query = f"""
+            WITH eligible AS (
+                SELECT
+                    t.trade_id,
+                    t.ticker,
+                    t.date,
+                    date_trunc('minute', t.entry_time::interval)::time AS entry_candle,
+                    COALESCE(m5.result = 'WIN', FALSE) AS is_winner,
+                    COALESCE(NULLIF(m5.max_r, 0), -1) AS max_r
+                FROM {trades_table} t
+                INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
+                LEFT JOIN {_DONE_IDS_TABLE} d ON d.trade_id = t.trade_id
+                WHERE d.trade_id IS NULL
+                ORDER BY t.date, t.ticker, t.entry_time
+                {limit_clause}
+            ),
+            windows AS (
+                SELECT
+                    e.trade_id, e.ticker, e.is_winner, e.max_r,
+                    b.bar_sequence, b.bar_date, b.bar_time, {bar_cols}
+                FROM eligible e
+                CROSS JOIN LATERAL (
+                    SELECT
+                        ind.bar_date, ind.bar_time, {ind_cols},
+                        ROW_NUMBER() OVER (ORDER BY ind.bar_time) - 1 AS bar_sequence
+                    FROM {indicators_table} ind
+                    WHERE ind.ticker = e.ticker AND ind.bar_date = e.date
+                      AND ind.bar_time >= e.entry_candle
+                    ORDER BY ind.bar_time ASC
+                    LIMIT %(num_bars)s
+                ) b
+            ),
+            partial AS (
+                SELECT trade_id
+                FROM windows
+                GROUP BY trade_id
+                HAVING COUNT(*) < %(num_bars)s
+            ),
+            upserted AS (
+                INSERT INTO {TARGET_TABLE} ({columns})
+                SELECT
+                    w.trade_id, w.bar_sequence,
+                    w.ticker, w.bar_date, w.bar_time,
+                    {window_cols},
+                    w.is_winner, w.max_r::numeric, w.max_r
+                FROM windows w
+                WHERE NOT (%(skip_partial)s AND w.trade_id IN (SELECT trade_id FROM partial))
+                ON CONFLICT (trade_id, bar_sequence) DO UPDATE SET
+                    {updates},
+                    calculated_at = NOW()
+                RETURNING trade_id, bar_sequence, is_winner
+            ),
+            per_trade AS (
+                SELECT trade_id, COUNT(*) AS n_bars,
+                       COUNT(*) FILTER (WHERE is_winner) AS n_winner
+                FROM upserted
+                GROUP BY trade_id
+            )
+            SELECT
+                (SELECT COUNT(*) FROM eligible),
+                COUNT(*),
+                (SELECT COUNT(*) FROM partial),
+                COALESCE(SUM(n_bars), 0),
+                COALESCE(SUM(n_winner), 0)
+            FROM per_trade
+        """
 
-        return total_inserted
+        with conn.cursor() as cur:
+            cur.execute("SET LOCAL synchronous_commit = off")
+            self._stage_done_ids(cur)
+            cur.execute(query, {'num_bars': num_bars, 'skip_partial': skip_partial})
+            eligible, processed, partial, inserted, winners = cur.fetchone()
+
+        return {
+            'total_eligible': int(eligible),
+            'trades_processed': int(processed),
+            'trades_partial_bars': int(partial),
+            'trades_skipped_partial': int(partial) if skip_partial else 0,
+            'rows_inserted': int(inserted),
+            'winner_rows': int(winners),
+        }
 
     # -----------------------------------------------------------------
     # STATUS: Show pipeline state
@@ -309,24 +370,22 @@ class M1PostTradeIndicatorPopulator:
         trades_table = SOURCE_TABLES['trades']
         m5_table = SOURCE_TABLES['m5_atr_stop']
 
-        with conn.cursor() as cur:
-            # Total trades
-            cur.execute(f"SELECT COUNT(*) FROM {trades_table}")
-            total_trades = cur.fetchone()[0]
-
-            # Trades with outcomes
-            cur.execute(f"""
-                SELECT COUNT(*) FROM {trades_table} t
-                INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
-            """)
-            with_outcomes = cur.fetchone()[0]
+        total_sql = f"SELECT COUNT(*) FROM {trades_table}"
+        outcomes_sql = f"""
+            SELECT COUNT(*) FROM {trades_table} t
+            INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
+        """
+        done_sql = f"SELECT COUNT(DISTINCT trade_id) FROM {TARGET_TABLE}"
 
-            # Already populated (count distinct trade_ids)
+        with conn.cursor() as cur:
+            # All three counts in one round trip
             try:
-                cur.execute(f"SELECT COUNT(DISTINCT trade_id) FROM {TARGET_TABLE}")
-                already_done = cur.fetchone()[0]
+                cur.execute(f"SELECT ({total_sql}), ({outcomes_sql}), ({done_sql})")
+                total_trades, with_outcomes, already_done = cur.fetchone()
             except psycopg2.errors.UndefinedTable:
                 conn.rollback()
+                cur.execute(f"SELECT ({total_sql}), ({outcomes_sql})")
+                total_trades, with_outcomes = cur.fetchone()
                 already_done = "TABLE NOT FOUND"
 
             # Ready to process
@@ -352,7 +411,7 @@ class M1PostTradeIndicatorPopulator:
     # -----------------------------------------------------------------
 
     def run(self, limit: Optional[int] = None,
-            dry_run: bool = False) -> Dict:
+            dry_run: bool = False, skip_partial: bool = False) -> Dict:
         """
         Main entry point: populate m1_post_trade_indicator_2.
 
@@ -364,6 +423,8 @@ class M1PostTradeIndicatorPopulator:
         Args:
             limit: Maximum trades to process (None = all)
             dry_run: If True, compute but don't write to DB
+            skip_partial: If True, skip trades with fewer than
+                POST_TRADE_BARS bars instead of inserting them
 
         Returns:
             Dict with processing stats
@@ -373,6 +434,7 @@ class M1PostTradeIndicatorPopulator:
             'trades_processed': 0,
             'trades_skipped_no_bars': 0,
             'trades_partial_bars': 0,
+            'trades_skipped_partial': 0,
             'rows_built': 0,
             'rows_inserted': 0,
             'errors': 0,
@@ -383,30 +445,17 @@ class M1PostTradeIndicatorPopulator:
             conn = psycopg2.connect(**DB_CONFIG)
             conn.autocommit = False
 
-            # Step 1: Get eligible trades
-            print(f"\n[1/4] Querying eligible trades (with outcomes, not yet populated)...")
-            trades = self.get_eligible_trades(conn, limit)
-            stats['total_eligible'] = len(trades)
+            if not dry_run:
+                return self._run_in_database(conn, limit, stats, skip_partial)
 
-            if not trades:
-                print("  No new trades to process")
-                return stats
-
-            # Step 2: Build rows
-            print(f"[2/4] Fetching post-trade bars for {len(trades)} trades ({POST_TRADE_BARS} bars each)...")
-            all_rows = []
-            for idx, trade in enumerate(trades):
+            # Steps 1-2: Stream eligible trades with their post-trade bars
+            print(f"\n[1/4] Querying eligible trades (with outcomes, not yet populated)...")
+            print(f"[2/4] Streaming post-trade bars ({POST_TRADE_BARS} bars each)...")
+            sample = None
+            win_rows = 0
+            for idx, (trade, bars) in enumerate(self.stream_post_trade_bars(conn, limit)):
+                stats['total_eligible'] += 1
                 try:
-                    # Calculate the entry candle time (bar_sequence 0)
-                    entry_time = trade['entry_time']
-                    entry_candle_start = _floor_to_minute(entry_time)
-
-                    # Fetch post-trade bars
-                    bars = self.get_post_trade_bars(
-                        conn, trade['ticker'], trade['date'],
-                        entry_candle_start, POST_TRADE_BARS
-                    )
-
                     if not bars:
                         stats['trades_skipped_no_bars'] += 1
                         if self.verbose:
@@ -418,15 +467,22 @@ class M1PostTradeIndicatorPopulator:
                         stats['trades_partial_bars'] += 1
                         if self.verbose:
                             print(f"  PARTIAL: {trade['trade_id']} - only {len(bars)}/{POST_TRADE_BARS} bars")
+                        if skip_partial:
+                            stats['trades_skipped_partial'] += 1
+                            continue
 
                     # Build rows for this trade
                     trade_rows = self.build_trade_rows(trade, bars)
-                    all_rows.extend(trade_rows)
+                    stats['rows_built'] += len(trade_rows)
+                    if trade_rows[0][_IS_WINNER_IDX]:
+                        win_rows += len(trade_rows)
+                    if sample is None:
+                        sample = trade_rows[0]
                     stats['trades_processed'] += 1
 
                     # Progress indicator every 100 trades
                     if self.verbose and (idx + 1) % 100 == 0:
-                        print(f"  ... processed {idx + 1}/{len(trades)} trades")
+                        print(f"  ... processed {idx + 1} trades")
 
                 except Exception as e:
                     stats['errors'] += 1
@@ -434,40 +490,38 @@ class M1PostTradeIndicatorPopulator:
                     if self.verbose:
                         print(f"  ERROR: {trade['trade_id']}: {e}")
 
-            stats['rows_built'] = len(all_rows)
+            if self.verbose:
+                print(f"  Found {stats['total_eligible']} trades needing post-trade data")
+
+            if not stats['total_eligible']:
+                print("  No new trades to process")
+                return stats
 
             # Step 3: Summary
             print(f"[3/4] Summary:")
             print(f"  Trades processed:   {stats['trades_processed']}")
             print(f"  Trades skipped:     {stats['trades_skipped_no_bars']} (no bars)")
             print(f"  Trades partial:     {stats['trades_partial_bars']} (<{POST_TRADE_BARS} bars)")
+            if skip_partial:
+                print(f"  Partial skipped:    {stats['trades_skipped_partial']}")
             print(f"  Rows built:         {stats['rows_built']}")
             print(f"  Errors:             {stats['errors']}")
 
-            if all_rows:
-                win_rows = sum(1 for r in all_rows if r[27] is True)  # is_winner index
-                loss_rows = len(all_rows) - win_rows
+            if stats['rows_built']:
+                loss_rows = stats['rows_built'] - win_rows
                 print(f"  Winner rows: {win_rows}, Loser rows: {loss_rows}")
 
-            # Step 4: Insert
-            if dry_run:
-                print(f"[4/4] DRY RUN - skipping database write")
-                if self.verbose and all_rows:
-                    sample = all_rows[0]
-                    print(f"\n  Sample row:")
-                    print(f"    trade_id:     {sample[0]}")
-                    print(f"    bar_sequence: {sample[1]}")
-                    print(f"    ticker:       {sample[2]}")
-                    print(f"    bar_time:     {sample[4]}")
-                    print(f"    candle_%:     {sample[10]}")
-                    print(f"    is_winner:    {sample[27]}")
-                    print(f"    pnl_r:        {sample[28]}")
-            else:
-                print(f"[4/4] Inserting {len(all_rows)} rows into {TARGET_TABLE}...")
-                inserted = self.insert_rows(conn, all_rows)
-                conn.commit()
-                stats['rows_inserted'] = inserted
-                print(f"  Inserted: {inserted} rows")
+            # Step 4: Dry run only - live runs insert server-side
+            print(f"[4/4] DRY RUN - skipping database write")
+            if self.verbose and sample:
+                print(f"\n  Sample row:")
+                print(f"    trade_id:     {sample[0]}")
+                print(f"    bar_sequence: {sample[1]}")
+                print(f"    ticker:       {sample[2]}")
+                print(f"    bar_time:     {sample[4]}")
+                print(f"    candle_%:     {sample[10]}")
+                print(f"    is_winner:    {sample[_IS_WINNER_IDX]}")
+                print(f"    pnl_r:        {sample[_IS_WINNER_IDX + 1]}")
 
         except KeyboardInterrupt:
             print("\n  Interrupted by user")
@@ -487,3 +541,35 @@ class M1PostTradeIndicatorPopulator:
                 conn.close()
 
         return stats
+
+    def _run_in_database(self, conn, limit: Optional[int], stats: Dict,
+                         skip_partial: bool = False) -> Dict:
+        """Live run: build and upsert all rows with populate_in_database."""
+        print(f"\n[1/4] Querying eligible trades (with outcomes, not yet populated)...")
+        print(f"[2/4] Building post-trade rows server-side ({POST_TRADE_BARS} bars each)...")
+        result = self.populate_in_database(conn, limit, skip_partial=skip_partial)
+        winner_rows = result.pop('winner_rows')
+        stats.update(result)
+
+        if not stats['total_eligible']:
+            conn.rollback()
+            print("  No new trades to process")
+            return stats
+
+        conn.commit()
+        stats['trades_skipped_no_bars'] = (
+            stats['total_eligible'] - stats['trades_processed'] - stats['trades_skipped_partial']
+        )
+        stats['rows_built'] = stats['rows_inserted']
+
+        print(f"[3/4] Summary:")
+        print(f"  Trades processed:   {stats['trades_processed']}")
+        print(f"  Trades skipped:     {stats['trades_skipped_no_bars']} (no bars)")
+        print(f"  Trades partial:     {stats['trades_partial_bars']} (<{POST_TRADE_BARS} bars)")
+        if skip_partial:
+            print(f"  Partial skipped:    {stats['trades_skipped_partial']}")
+        print(f"  Rows built:         {stats['rows_built']}")
+        print(f"  Winner rows: {winner_rows}, Loser rows: {stats['rows_inserted'] - winner_rows}")
+        print(f"[4/4] Inserted: {stats['rows_inserted']} rows into {TARGET_TABLE}")
+
+        return stats
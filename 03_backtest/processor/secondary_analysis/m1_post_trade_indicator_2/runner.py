@@ -124,7 +124,7 @@ def show_info():
 # MAIN CALCULATION
 # =============================================================================
 
-def run_calculation(limit=None, dry_run=False, verbose=True):
+def run_calculation(limit=None, dry_run=False, verbose=True, skip_partial=False):
     """Run the population calculation."""
     print(f"\n{'='*70}")
     print(f"M1 POST-TRADE INDICATOR POPULATION")
@@ -133,11 +133,13 @@ def run_calculation(limit=None, dry_run=False, verbose=True):
     if limit:
         print(f"  Limit: {limit} trades")
     print(f"  Bars per trade: {POST_TRADE_BARS}")
+    if skip_partial:
+        print(f"  Partial trades: SKIPPED (<{POST_TRADE_BARS} bars)")
     print(f"  Target: {TARGET_TABLE}")
     print(f"  Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
     populator = M1PostTradeIndicatorPopulator(verbose=verbose)
-    stats = populator.run(limit=limit, dry_run=dry_run)
+    stats = populator.run(limit=limit, dry_run=dry_run, skip_partial=skip_partial)
 
     print(f"\n{'='*70}")
     print(f"POPULATION COMPLETE")
@@ -146,6 +148,8 @@ def run_calculation(limit=None, dry_run=False, verbose=True):
     print(f"  Trades processed: {stats['trades_processed']}")
     print(f"  No bars:          {stats['trades_skipped_no_bars']}")
     print(f"  Partial bars:     {stats['trades_partial_bars']}")
+    if skip_partial:
+        print(f"  Partial skipped:  {stats['trades_skipped_partial']}")
     print(f"  Rows built:       {stats['rows_built']}")
     print(f"  Rows inserted:    {stats['rows_inserted']}")
     print(f"  Errors:           {stats['errors']}")
@@ -181,6 +185,7 @@ Examples:
   python runner.py              # Full population run
   python runner.py --dry-run    # Preview without saving
   python runner.py --limit 50   # Process 50 trades
+  python runner.py --skip-partial  # Leave out trades with <{POST_TRADE_BARS} bars
   python runner.py --schema     # Create database table
   python runner.py --status     # Show pipeline status
   python runner.py --info       # Show processor information
@@ -197,6 +202,8 @@ Output:
                         help='Process without saving to database')
     parser.add_argument('--limit', type=int, metavar='N',
                         help='Maximum number of trades to process')
+    parser.add_argument('--skip-partial', action='store_true',
+                        help=f'Skip trades with fewer than {POST_TRADE_BARS} post-entry bars')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose logging')
     parser.add_argument('--schema', action='store_true',
@@ -226,7 +233,8 @@ Output:
         success = run_calculation(
             limit=args.limit,
             dry_run=args.dry_run,
-            verbose=args.verbose
+            verbose=args.verbose,
+            skip_partial=args.skip_partial
         )
         sys.exit(0 if success else 1)
 
@@ -77,5 +77,15 @@ INDICATOR_COLUMNS = [
 # =============================================================================
 # PROCESSING
 # =============================================================================
-BATCH_SIZE = 500  # Rows per execute_values batch
+BATCH_SIZE = 500  # Rows per insert_rows call (one COPY + upsert) from the writer thread
+WRITER_QUEUE_SIZE = 64  # Trade row batches buffered for the insert thread
+
+# Session settings for the insert thread's bulk-load connection. The table
+# is derived and rebuilt by re-running, so commits skip the WAL flush wait;
+# temp_buffers must be set before the first temp stage table is created.
+WRITER_SESSION_SETTINGS = {
+    'synchronous_commit': 'off',
+    'temp_buffers': '256MB',
+    'work_mem': '256MB',
+}
 VERBOSE = True
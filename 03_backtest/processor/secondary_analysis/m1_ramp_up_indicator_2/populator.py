@@ -12,10 +12,13 @@ the M1 bar that closed just before the entry candle.
 Pipeline:
     1. Query trades in trades_2 INNER JOIN m5_atr_stop_2 (outcome required)
        that are NOT yet in m1_ramp_up_indicator_2
-    2. For each trade: query 25 bars from m1_indicator_bars_2 ending at
-       the bar just before entry candle
+    2. LATERAL-join 25 bars from m1_indicator_bars_2 per trade ending at
+       the bar just before the entry candle (computed in SQL), streamed
+       through a server-side cursor
     3. Assign bar_sequence 0-24 (chronological order)
-    4. INSERT with ON CONFLICT DO UPDATE
+    4. COPY into a temp stage, then INSERT ... SELECT (ON CONFLICT DO
+       UPDATE only with force_upsert) on a background writer thread,
+       overlapping the bar fetches
 
 Look-ahead protection: The entry candle has NOT closed when the trade is
 entered. Bar_sequence 24 is the LAST COMPLETED M1 bar before the entry
@@ -27,66 +30,197 @@ Version: 1.0.0
 ================================================================================
 """
 
+import io
 import sys
+import queue
+import struct
 import logging
+import threading
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from datetime import date, time, datetime, timedelta
+from datetime import date
 from decimal import Decimal
-from typing import List, Dict, Tuple, Optional
+from typing import Iterator, List, Dict, Tuple, Optional
 
 import psycopg2
-from psycopg2.extras import execute_values, RealDictCursor
 
 # Self-contained imports
 from config import (
     DB_CONFIG, SOURCE_TABLES, TARGET_TABLE,
-    INDICATOR_COLUMNS, RAMP_UP_BARS, BATCH_SIZE
+    INDICATOR_COLUMNS, RAMP_UP_BARS, BATCH_SIZE, WRITER_QUEUE_SIZE,
+    WRITER_SESSION_SETTINGS
 )
 
 logger = logging.getLogger(__name__)
 
+# Column order of the tuples produced by build_trade_rows
+_TARGET_COLUMNS = (
+    'trade_id', 'bar_sequence',
+    'ticker', 'bar_date', 'bar_time',
+    *INDICATOR_COLUMNS,
+)
+
+_STAGE_TABLE = "_m1_ramp_up_stage"
+_DONE_IDS_TABLE = "m1_ramp_up_indicator_2_done"
+
+# Staging column types, in _TARGET_COLUMNS order. Numerics are staged as
+# float8 so rows can be sent in binary COPY format (there is no cheap client
+# encoding for NUMERIC); INSERT ... SELECT casts them to the target types.
+_STAGE_TYPES = (
+    'text', 'int4',
+    'text', 'date', 'time',
+    'float8', 'float8', 'float8', 'float8', 'int8',
+    'float8',
+    'float8', 'float8', 'float8',
+    'float8',
+    'float8', 'float8', 'text', 'float8',
+    'text', 'text',
+    'float8',
+    'text', 'text', 'text',
+    'int4', 'int4', 'int4',
+)
+
+# Trade fields returned alongside each bar by stream_ramp_up_bars
+_TRADE_FIELDS = (
+    'trade_id', 'ticker', 'date', 'direction', 'model', 'zone_type',
+    'entry_time', 'entry_price', 'result', 'max_r', 'prior_bar',
+)
+# Stream rows are _TRADE_FIELDS, then the bar: bar_date, bar_time, *INDICATOR_COLUMNS
+_BAR_OFFSET = len(_TRADE_FIELDS)
+_BAR_TIME_IDX = _BAR_OFFSET + 1
+_STREAM_ITERSIZE = 10_000
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def _safe_float(val) -> Optional[float]:
-    """Convert Decimal/numpy to Python float, None-safe."""
-    if val is None:
-        return None
-    try:
-        return float(val)
-    except (TypeError, ValueError):
-        return None
-
-
-def _safe_int(val) -> Optional[int]:
-    """Convert to Python int, None-safe."""
-    if val is None:
-        return None
-    try:
-        return int(val)
-    except (TypeError, ValueError):
-        return None
+_PG_EPOCH = date(2000, 1, 1)
+_COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+_COPY_TRAILER = struct.pack('!h', -1)
+_COPY_NULL = struct.pack('!i', -1)
+
+
+def _binary_encoder(pg_type: str):
+    """Return a function packing one non-NULL value as a length-prefixed binary COPY field."""
+    if pg_type == 'text':
+        def encode(val):
+            data = str(val).encode('utf-8')
+            return struct.pack('!i', len(data)) + data
+        return encode
+    if pg_type == 'date':
+        return lambda val: struct.pack('!ii', 4, (val - _PG_EPOCH).days)
+    if pg_type == 'time':
+        # Microseconds since midnight
+        return lambda val: struct.pack('!iq', 8, (
+            (val.hour * 3600 + val.minute * 60 + val.second) * 1_000_000 + val.microsecond
+        ))
+    fmt = {'int4': '!ii', 'int8': '!iq', 'float8': '!id'}[pg_type]
+    size = struct.calcsize('!' + fmt[2:])
+    packer = struct.Struct(fmt)
+    return lambda val: packer.pack(size, val)
+
+
+_STAGE_ENCODERS = tuple(_binary_encoder(t) for t in _STAGE_TYPES)
+
+
+def _copy_binary(rows: List[tuple]) -> bytes:
+    """Build a COPY ... (FORMAT binary) payload for rows in _TARGET_COLUMNS order."""
+    field_count = struct.pack('!h', len(_STAGE_ENCODERS))
+    parts = [_COPY_HEADER]
+    for row in rows:
+        parts.append(field_count)
+        for encode, val in zip(_STAGE_ENCODERS, row):
+            parts.append(_COPY_NULL if val is None else encode(val))
+    parts.append(_COPY_TRAILER)
+    return b''.join(parts)
 
 
-def _floor_to_minute(entry_time: time) -> time:
-    """Floor a time value to the minute boundary.
+# =============================================================================
+# BACKGROUND WRITER
+# =============================================================================
 
-    Example: 09:35:15 -> 09:35:00 (this is the entry candle start)
+class _RowWriter(threading.Thread):
+    """
+    Insert thread for run(): drains per-trade row lists off a bounded queue
+    and upserts them on its own connection every BATCH_SIZE rows, so bar
+    fetches and inserts overlap and at most WRITER_QUEUE_SIZE trades plus
+    one batch are held in memory. Everything commits once in close().
     """
-    return time(entry_time.hour, entry_time.minute, 0)
 
+    _COMMIT = object()
+    _ABORT = object()
+
+    def __init__(self, populator: 'M1RampUpIndicatorPopulator',
+                 force_upsert: bool = False):
+        super().__init__(name=f"{TARGET_TABLE}_writer", daemon=True)
+        self._populator = populator
+        self._force_upsert = force_upsert
+        self._queue = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+        self._conn = psycopg2.connect(**DB_CONFIG)
+        self._conn.autocommit = False
+        with self._conn.cursor() as cur:
+            for name, value in WRITER_SESSION_SETTINGS.items():
+                cur.execute(f"SET {name} = %s", (value,))
+        # Commit the settings on their own so a rolled-back load can't undo them
+        self._conn.commit()
+        self.rows_inserted = 0
+        self.error = None
+
+    def put(self, rows: List[tuple]):
+        """Queue one trade's rows, re-raising any failure from the writer."""
+        while True:
+            if self.error is not None:
+                raise self.error
+            try:
+                self._queue.put(rows, timeout=1.0)
+                return
+            except queue.Full:
+                continue
+
+    def close(self, commit: bool = True) -> int:
+        """Flush and commit (or roll back) the writer; returns rows inserted."""
+        if self.is_alive():
+            if self.error is None:
+                self.put(self._COMMIT if commit else self._ABORT)
+            self.join()
+        if commit and self.error is not None:
+            raise self.error
+        return self.rows_inserted
+
+    def run(self):
+        pending = []
+        try:
+            while True:
+                item = self._queue.get()
+                if item is self._ABORT:
+                    self._conn.rollback()
+                    return
+                if item is self._COMMIT:
+                    break
+                pending.extend(item)
+                if len(pending) >= BATCH_SIZE:
+                    self.rows_inserted += self._populator.insert_rows(
+                        self._conn, pending, self._force_upsert
+                    )
+                    pending = []
 
-def _prior_bar_time(entry_candle_start: time) -> time:
-    """Get the time of the M1 bar that closed just before the entry candle.
+            self.rows_inserted += self._populator.insert_rows(
+                self._conn, pending, self._force_upsert
+            )
+            self._conn.commit()
 
-    Example: entry_candle_start = 09:35:00 -> prior bar = 09:34:00
-    """
-    dt = datetime(2000, 1, 1, entry_candle_start.hour,
-                  entry_candle_start.minute, 0)
-    prior = dt - timedelta(minutes=1)
-    return time(prior.hour, prior.minute, 0)
+        except Exception as e:
+            logger.error(f"Insert thread failed: {e}")
+            self.error = e
+            try:
+                self._conn.rollback()
+            except psycopg2.Error:
+                pass
+
+        finally:
+            self._conn.close()
 
 
 # =============================================================================
@@ -98,7 +232,8 @@ class M1RampUpIndicatorPopulator:
     Populates m1_ramp_up_indicator_2 with 25-bar ramp-up indicator windows.
 
     For each trade in trades_2 that has an outcome in m5_atr_stop_2:
-    - Query 25 M1 bars ending at the bar just before entry candle
+    - Join 25 M1 bars ending at the bar just before entry candle (one query
+      for all trades)
     - Assign bar_sequence 0-24 (chronological)
     - Insert into m1_ramp_up_indicator_2
     """
@@ -106,198 +241,177 @@ class M1RampUpIndicatorPopulator:
     def __init__(self, verbose: bool = True):
         self.verbose = verbose
 
-    # -----------------------------------------------------------------
-    # STEP 1: Get eligible trades
-    # -----------------------------------------------------------------
-
-    def get_eligible_trades(self, conn, limit: Optional[int] = None) -> List[dict]:
+    def _stage_done_ids(self, cur):
         """
-        Query trades that have outcomes but are not yet in m1_ramp_up_indicator_2.
+        Materialize the trade_ids already in m1_ramp_up_indicator_2 into an
+        indexed, analyzed temp table (dropped on commit).
 
-        INNER JOIN m5_atr_stop_2 ensures only trades with completed outcomes
-        are returned. Trades without outcomes are SKIPPED entirely.
+        The eligibility query anti-joins against this one-row-per-trade
+        snapshot instead of probing the 25-rows-per-trade target.
         """
-        trades_table = SOURCE_TABLES['trades']
-        m5_table = SOURCE_TABLES['m5_atr_stop']
-
-        query = f"""
-            SELECT
-                t.trade_id,
-                t.ticker,
-                t.date,
-                t.direction,
-                t.model,
-                t.zone_type,
-                t.entry_time,
-                t.entry_price,
-                m5.result,
-                m5.max_r
-            FROM {trades_table} t
-            INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
-            WHERE NOT EXISTS (
-                SELECT 1 FROM {TARGET_TABLE} ru
-                WHERE ru.trade_id = t.trade_id
-            )
-            ORDER BY t.date, t.ticker, t.entry_time
-        """
-
-        if limit:
-            query += f" LIMIT {limit}"
-
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(query)
-            rows = cur.fetchall()
-
-        if self.verbose:
-            print(f"  Found {len(rows)} trades needing ramp-up data")
-
-        return [dict(r) for r in rows]
+        cur.execute(f"DROP TABLE IF EXISTS pg_temp.{_DONE_IDS_TABLE}")
+        cur.execute(f"""
+            CREATE TEMP TABLE {_DONE_IDS_TABLE} ON COMMIT DROP AS
+            SELECT DISTINCT trade_id FROM {TARGET_TABLE}
+        """)
+        cur.execute(f"CREATE INDEX ON {_DONE_IDS_TABLE} (trade_id)")
+        cur.execute(f"ANALYZE {_DONE_IDS_TABLE}")
 
     # -----------------------------------------------------------------
-    # STEP 2: Get ramp-up indicator bars for a single trade
+    # STEPS 1-2: Stream eligible trades with their ramp-up bars
     # -----------------------------------------------------------------
 
-    def get_ramp_up_bars(self, conn, ticker: str, bar_date: date,
-                         end_bar_time: time, num_bars: int = 25) -> List[dict]:
+    def stream_ramp_up_bars(
+        self, conn, limit: Optional[int] = None,
+        num_bars: int = RAMP_UP_BARS
+    ) -> Iterator[Tuple[dict, List[tuple]]]:
         """
-        Fetch the N M1 indicator bars ending at end_bar_time (inclusive).
-
-        Returns bars in chronological order (oldest first).
+        Stream (trade, bars) for every eligible trade from a single query.
+
+        Eligible trades have an outcome in m5_atr_stop_2 (INNER JOIN) and are
+        not yet in m1_ramp_up_indicator_2 (anti-joined against the
+        _stage_done_ids snapshot). The prior bar (entry_time floored
+        to the minute, minus one minute) is computed in SQL, and a LATERAL
+        join pulls the last num_bars indicator bars at or before it. Rows
+        are streamed through a server-side cursor in _STREAM_ITERSIZE
+        batches and grouped per trade; bars are plain tuples of (bar_date,
+        bar_time, *INDICATOR_COLUMNS), oldest first. Trades without
+        indicator bars are yielded with an empty bar list.
         """
+        trades_table = SOURCE_TABLES['trades']
+        m5_table = SOURCE_TABLES['m5_atr_stop']
         indicators_table = SOURCE_TABLES['m1_indicators']
-        cols = ', '.join(INDICATOR_COLUMNS)
+        # NUMERIC indicators are cast to float8 server-side so psycopg2
+        # parses them straight into floats instead of building Decimals
+        cols = ', '.join(
+            f"{col}::float8 AS {col}" if pg_type == 'float8' else col
+            for col, pg_type in zip(INDICATOR_COLUMNS, _STAGE_TYPES[5:])
+        )
+        bar_cols = ', '.join(f"b.{c}" for c in INDICATOR_COLUMNS)
+        limit_clause = f"LIMIT {int(limit)}" if limit else ""
 
         query = f"""
-            SELECT bar_date, bar_time, {cols}
-            FROM {indicators_table}
-            WHERE ticker = %s AND bar_date = %s AND bar_time <= %s
-            ORDER BY bar_time DESC
-            LIMIT %s
+            WITH eligible AS (
+                SELECT
+                    t.trade_id,
+                    t.ticker,
+                    t.date,
+                    t.direction,
+                    t.model,
+                    t.zone_type,
+                    t.entry_time,
+                    t.entry_price,
+                    m5.result,
+                    m5.max_r,
+                    (date_trunc('minute', t.entry_time::interval)
+                        - interval '1 minute')::time AS prior_bar
+                FROM {trades_table} t
+                INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
+                LEFT JOIN {_DONE_IDS_TABLE} d ON d.trade_id = t.trade_id
+                WHERE d.trade_id IS NULL
+                ORDER BY t.date, t.ticker, t.entry_time
+                {limit_clause}
+            )
+            SELECT e.*, b.bar_date, b.bar_time, {bar_cols}
+            FROM eligible e
+            LEFT JOIN LATERAL (
+                SELECT bar_date, bar_time, {cols}
+                FROM {indicators_table}
+                WHERE ticker = e.ticker AND bar_date = e.date
+                  AND bar_time <= e.prior_bar
+                ORDER BY bar_time DESC
+                LIMIT %s
+            ) b ON TRUE
+            ORDER BY e.date, e.ticker, e.entry_time, e.trade_id, b.bar_time
         """
 
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(query, (ticker, bar_date, end_bar_time, num_bars))
-            rows = cur.fetchall()
+        with conn.cursor() as cur:
+            self._stage_done_ids(cur)
+
+        with conn.cursor(name='ramp_up_stream') as cur:
+            cur.itersize = _STREAM_ITERSIZE
+            cur.execute(query, (num_bars,))
 
-        # Reverse to chronological order (oldest first)
-        bars = [dict(r) for r in reversed(rows)]
-        return bars
+            for _, rows in groupby(cur, key=itemgetter(0)):
+                rows = list(rows)
+                trade = dict(zip(_TRADE_FIELDS, rows[0]))
+                # LEFT JOIN yields one all-NULL bar row for trades without bars
+                bars = [r[_BAR_OFFSET:] for r in rows if r[_BAR_TIME_IDX] is not None]
+                yield trade, bars
 
     # -----------------------------------------------------------------
     # STEP 3: Build rows for a single trade
     # -----------------------------------------------------------------
 
-    def build_trade_rows(self, trade: dict, bars: List[dict]) -> List[tuple]:
+    def build_trade_rows(self, trade: dict, bars: List[tuple]) -> List[tuple]:
         """
         Build rows for m1_ramp_up_indicator_2 from a trade's ramp-up bars.
 
-        Each bar gets a bar_sequence from 0 (oldest) to len(bars)-1 (newest).
-        Returns list of tuples ready for execute_values INSERT.
+        Bars are tuples as yielded by stream_ramp_up_bars. Each bar gets a
+        bar_sequence from 0 (oldest) to len(bars)-1 (newest).
+        Returns list of tuples in _TARGET_COLUMNS order, ready for insert_rows.
         """
-        rows = []
         trade_id = trade['trade_id']
         ticker = trade['ticker']
-
-        for seq, bar in enumerate(bars):
-            row = (
-                trade_id,
-                seq,
-                ticker,
-                bar['bar_date'],
-                bar['bar_time'],
-                # OHLCV
-                _safe_float(bar.get('open')),
-                _safe_float(bar.get('high')),
-                _safe_float(bar.get('low')),
-                _safe_float(bar.get('close')),
-                _safe_int(bar.get('volume')),
-                # Core Indicators
-                _safe_float(bar.get('candle_range_pct')),
-                _safe_float(bar.get('vol_delta_raw')),
-                _safe_float(bar.get('vol_delta_roll')),
-                _safe_float(bar.get('vol_delta_norm')),
-                _safe_float(bar.get('vol_roc')),
-                _safe_float(bar.get('sma9')),
-                _safe_float(bar.get('sma21')),
-                bar.get('sma_config'),
-                _safe_float(bar.get('sma_spread_pct')),
-                bar.get('sma_momentum_label'),
-                bar.get('price_position'),
-                _safe_float(bar.get('cvd_slope')),
-                # Structure
-                bar.get('m5_structure'),
-                bar.get('m15_structure'),
-                bar.get('h1_structure'),
-                # Composite Scores
-                _safe_int(bar.get('health_score')),
-                _safe_int(bar.get('long_score')),
-                _safe_int(bar.get('short_score')),
-            )
-            rows.append(row)
-
-        return rows
+        # Bar values are already typed by the float8 casts in stream_ramp_up_bars
+        return [(trade_id, seq, ticker) + bar for seq, bar in enumerate(bars)]
 
     # -----------------------------------------------------------------
     # STEP 4: Insert rows
     # -----------------------------------------------------------------
 
-    def insert_rows(self, conn, rows: List[tuple]) -> int:
-        """Insert rows into m1_ramp_up_indicator_2 with ON CONFLICT upsert."""
+    def insert_rows(self, conn, rows: List[tuple],
+                    force_upsert: bool = False) -> int:
+        """
+        Insert rows into m1_ramp_up_indicator_2.
+
+        Rows are sent in one binary COPY into a temp staging table, then
+        written with a single INSERT ... SELECT that casts the staged
+        float8 values to NUMERIC. run() only builds rows for trade_ids not
+        yet in the table, so by default this is a plain INSERT; pass
+        force_upsert=True to add the ON CONFLICT DO UPDATE clause (e.g.
+        when another run may be populating the same trades).
+        """
         if not rows:
             return 0
 
-        query = f"""
-            INSERT INTO {TARGET_TABLE} (
-                trade_id, bar_sequence,
-                ticker, bar_date, bar_time,
-                open, high, low, close, volume,
-                candle_range_pct,
-                vol_delta_raw, vol_delta_roll, vol_delta_norm,
-                vol_roc,
-                sma9, sma21, sma_config, sma_spread_pct,
-                sma_momentum_label, price_position,
-                cvd_slope,
-                m5_structure, m15_structure, h1_structure,
-                health_score, long_score, short_score
-            ) VALUES %s
-            ON CONFLICT (trade_id, bar_sequence) DO UPDATE SET
-                ticker = EXCLUDED.ticker,
-                bar_date = EXCLUDED.bar_date,
-                bar_time = EXCLUDED.bar_time,
-                open = EXCLUDED.open,
-                high = EXCLUDED.high,
-                low = EXCLUDED.low,
-                close = EXCLUDED.close,
-                volume = EXCLUDED.volume,
-                candle_range_pct = EXCLUDED.candle_range_pct,
-                vol_delta_raw = EXCLUDED.vol_delta_raw,
-                vol_delta_roll = EXCLUDED.vol_delta_roll,
-                vol_delta_norm = EXCLUDED.vol_delta_norm,
-                vol_roc = EXCLUDED.vol_roc,
-                sma9 = EXCLUDED.sma9,
-                sma21 = EXCLUDED.sma21,
-                sma_config = EXCLUDED.sma_config,
-                sma_spread_pct = EXCLUDED.sma_spread_pct,
-                sma_momentum_label = EXCLUDED.sma_momentum_label,
-                price_position = EXCLUDED.price_position,
-                cvd_slope = EXCLUDED.cvd_slope,
-                m5_structure = EXCLUDED.m5_structure,
-                m15_structure = EXCLUDED.m15_structure,
-                h1_structure = EXCLUDED.h1_structure,
-                health_score = EXCLUDED.health_score,
-                long_score = EXCLUDED.long_score,
-                short_score = EXCLUDED.short_score,
-                calculated_at = NOW()
-        """
+        columns = ', '.join(_TARGET_COLUMNS)
+        stage_columns = ', '.join(
+            f"{col} {pg_type}" for col, pg_type in zip(_TARGET_COLUMNS, _STAGE_TYPES)
+        )
+        conflict_clause = ""
+        if force_upsert:
+            updates = ',\n                '.join(
+                f"{col} = EXCLUDED.{col}" for col in _TARGET_COLUMNS[2:]
+            )
+            conflict_clause = f"""
+                ON CONFLICT (trade_id, bar_sequence) DO UPDATE SET
+                {updates},
+                calculated_at = NOW()"""
+
+        with conn.cursor() as cur:
+            # Derived table, rebuilt by re-running: don't wait on the WAL
+            # flush when the caller commits
+            cur.execute("SET LOCAL synchronous_commit = off")
+            cur.execute(f"""
+                CREATE TEMP TABLE {_STAGE_TABLE} ({stage_columns})
+                ON COMMIT DROP
+            """)
+
+            cur.copy_expert(
+                f"COPY {_STAGE_TABLE} ({columns}) FROM STDIN WITH (FORMAT binary)",
+                io.BytesIO(_copy_binary(rows))
+            )
+
+            cur.execute(f"""
+                INSERT INTO {TARGET_TABLE} ({columns})
+                SELECT {columns} FROM {_STAGE_TABLE}{conflict_clause}
+            """)
 
-        total_inserted = 0
-        for i in range(0, len(rows), BATCH_SIZE):
-            batch = rows[i:i + BATCH_SIZE]
-            with conn.cursor() as cur:
-                execute_values(cur, query, batch)
-            total_inserted += len(batch)
+            # Drop now so a second call in the same transaction can re-stage
+            cur.execute(f"DROP TABLE {_STAGE_TABLE}")
 
-        return total_inserted
+        return len(rows)
 
     # -----------------------------------------------------------------
     # STATUS: Show pipeline state
@@ -308,24 +422,22 @@ class M1RampUpIndicatorPopulator:
         trades_table = SOURCE_TABLES['trades']
         m5_table = SOURCE_TABLES['m5_atr_stop']
 
-        with conn.cursor() as cur:
-            # Total trades
-            cur.execute(f"SELECT COUNT(*) FROM {trades_table}")
-            total_trades = cur.fetchone()[0]
-
-            # Trades with outcomes
-            cur.execute(f"""
-                SELECT COUNT(*) FROM {trades_table} t
-                INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
-            """)
-            with_outcomes = cur.fetchone()[0]
+        total_sql = f"SELECT COUNT(*) FROM {trades_table}"
+        outcomes_sql = f"""
+            SELECT COUNT(*) FROM {trades_table} t
+            INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
+        """
+        done_sql = f"SELECT COUNT(DISTINCT trade_id) FROM {TARGET_TABLE}"
 
-            # Already populated (count distinct trade_ids)
+        with conn.cursor() as cur:
+            # All three counts in one round trip
             try:
-                cur.execute(f"SELECT COUNT(DISTINCT trade_id) FROM {TARGET_TABLE}")
-                already_done = cur.fetchone()[0]
+                cur.execute(f"SELECT ({total_sql}), ({outcomes_sql}), ({done_sql})")
+                total_trades, with_outcomes, already_done = cur.fetchone()
             except psycopg2.errors.UndefinedTable:
                 conn.rollback()
+                cur.execute(f"SELECT ({total_sql}), ({outcomes_sql})")
+                total_trades, with_outcomes = cur.fetchone()
                 already_done = "TABLE NOT FOUND"
 
             # Ready to process
@@ -351,7 +463,7 @@ class M1RampUpIndicatorPopulator:
     # -----------------------------------------------------------------
 
     def run(self, limit: Optional[int] = None,
-            dry_run: bool = False) -> Dict:
+            dry_run: bool = False, force_upsert: bool = False) -> Dict:
         """
         Main entry point: populate m1_ramp_up_indicator_2.
 
@@ -363,6 +475,8 @@ class M1RampUpIndicatorPopulator:
         Args:
             limit: Maximum trades to process (None = all)
             dry_run: If True, compute but don't write to DB
+            force_upsert: If True, upsert (ON CONFLICT DO UPDATE) instead
+                of plain INSERT
 
         Returns:
             Dict with processing stats
@@ -378,35 +492,24 @@ class M1RampUpIndicatorPopulator:
         }
 
         conn = None
+        writer = None
         try:
             conn = psycopg2.connect(**DB_CONFIG)
             conn.autocommit = False
 
-            # Step 1: Get eligible trades
+            # Steps 1-2: Stream eligible trades with their ramp-up bars,
+            # handing each trade's rows to the insert thread
             print(f"\n[1/4] Querying eligible trades (with outcomes, not yet populated)...")
-            trades = self.get_eligible_trades(conn, limit)
-            stats['total_eligible'] = len(trades)
-
-            if not trades:
-                print("  No new trades to process")
-                return stats
-
-            # Step 2: Build rows
-            print(f"[2/4] Fetching ramp-up bars for {len(trades)} trades ({RAMP_UP_BARS} bars each)...")
-            all_rows = []
-            for idx, trade in enumerate(trades):
+            print(f"[2/4] Streaming ramp-up bars ({RAMP_UP_BARS} bars each)...")
+            if not dry_run:
+                writer = _RowWriter(self, force_upsert)
+                writer.start()
+
+            sample = None
+            for idx, (trade, bars) in enumerate(self.stream_ramp_up_bars(conn, limit)):
+                stats['total_eligible'] += 1
+                trade_rows = None
                 try:
-                    # Calculate the prior M1 bar time (bar_sequence 24)
-                    entry_time = trade['entry_time']
-                    entry_candle_start = _floor_to_minute(entry_time)
-                    prior_bar = _prior_bar_time(entry_candle_start)
-
-                    # Fetch ramp-up bars
-                    bars = self.get_ramp_up_bars(
-                        conn, trade['ticker'], trade['date'],
-                        prior_bar, RAMP_UP_BARS
-                    )
-
                     if not bars:
                         stats['trades_skipped_no_bars'] += 1
                         if self.verbose:
@@ -421,20 +524,31 @@ class M1RampUpIndicatorPopulator:
 
                     # Build rows for this trade
                     trade_rows = self.build_trade_rows(trade, bars)
-                    all_rows.extend(trade_rows)
+                    stats['rows_built'] += len(trade_rows)
                     stats['trades_processed'] += 1
+                    if sample is None and trade_rows:
+                        sample = trade_rows[0]
 
                     # Progress indicator every 100 trades
                     if self.verbose and (idx + 1) % 100 == 0:
-                        print(f"  ... processed {idx + 1}/{len(trades)} trades")
+                        print(f"  ... processed {idx + 1} trades")
 
                 except Exception as e:
                     stats['errors'] += 1
                     logger.error(f"Error processing {trade['trade_id']}: {e}")
                     if self.verbose:
                         print(f"  ERROR: {trade['trade_id']}: {e}")
+                    continue
 
-            stats['rows_built'] = len(all_rows)
+                if writer is not None:
+                    writer.put(trade_rows)
+
+            if self.verbose:
+                print(f"  Found {stats['total_eligible']} trades needing ramp-up data")
+
+            if not stats['total_eligible']:
+                print("  No new trades to process")
+                return stats
 
             # Step 3: Summary
             print(f"[3/4] Summary:")
@@ -447,8 +561,7 @@ class M1RampUpIndicatorPopulator:
             # Step 4: Insert
             if dry_run:
                 print(f"[4/4] DRY RUN - skipping database write")
-                if self.verbose and all_rows:
-                    sample = all_rows[0]
+                if self.verbose and sample:
                     print(f"\n  Sample row:")
                     print(f"    trade_id:     {sample[0]}")
                     print(f"    bar_sequence: {sample[1]}")
@@ -457,9 +570,9 @@ class M1RampUpIndicatorPopulator:
                     print(f"    candle_%:     {sample[10]}")
                     print(f"    vol_roc:      {sample[13]}")
             else:
-                print(f"[4/4] Inserting {len(all_rows)} rows into {TARGET_TABLE}...")
-                inserted = self.insert_rows(conn, all_rows)
-                conn.commit()
+                print(f"[4/4] Flushing {stats['rows_built']} rows into {TARGET_TABLE}...")
+                inserted = writer.close()
+                writer = None
                 stats['rows_inserted'] = inserted
                 print(f"  Inserted: {inserted} rows")
 
@@ -477,6 +590,8 @@ class M1RampUpIndicatorPopulator:
             raise
 
         finally:
+            if writer is not None:
+                writer.close(commit=False)
             if conn:
                 conn.close()
 
@@ -123,7 +123,7 @@ def show_info():
 # MAIN CALCULATION
 # =============================================================================
 
-def run_calculation(limit=None, dry_run=False, verbose=True):
+def run_calculation(limit=None, dry_run=False, verbose=True, force_upsert=False):
     """Run the population calculation."""
     print(f"\n{'='*70}")
     print(f"M1 RAMP-UP INDICATOR POPULATION")
@@ -132,11 +132,13 @@ def run_calculation(limit=None, dry_run=False, verbose=True):
     if limit:
         print(f"  Limit: {limit} trades")
     print(f"  Bars per trade: {RAMP_UP_BARS}")
+    if force_upsert:
+        print(f"  Write: upsert (ON CONFLICT DO UPDATE)")
     print(f"  Target: {TARGET_TABLE}")
     print(f"  Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
     populator = M1RampUpIndicatorPopulator(verbose=verbose)
-    stats = populator.run(limit=limit, dry_run=dry_run)
+    stats = populator.run(limit=limit, dry_run=dry_run, force_upsert=force_upsert)
 
     print(f"\n{'='*70}")
     print(f"POPULATION COMPLETE")
@@ -180,6 +182,7 @@ Examples:
   python runner.py              # Full population run
   python runner.py --dry-run    # Preview without saving
   python runner.py --limit 50   # Process 50 trades
+  python runner.py --force-upsert  # Upsert instead of plain INSERT
   python runner.py --schema     # Create database table
   python runner.py --status     # Show pipeline status
   python runner.py --info       # Show processor information
@@ -195,6 +198,8 @@ Output:
                         help='Process without saving to database')
     parser.add_argument('--limit', type=int, metavar='N',
                         help='Maximum number of trades to process')
+    parser.add_argument('--force-upsert', action='store_true',
+                        help='Upsert rows (ON CONFLICT DO UPDATE) instead of plain INSERT')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose logging')
     parser.add_argument('--schema', action='store_true',
@@ -224,7 +229,8 @@ Output:
         success = run_calculation(
             limit=args.limit,
             dry_run=args.dry_run,
-            verbose=args.verbose
+            verbose=args.verbose,
+            force_upsert=args.force_upsert
         )
         sys.exit(0 if success else 1)
 
@@ -55,3 +55,18 @@ CREATE TABLE IF NOT EXISTS m1_ramp_up_indicator_2 (
 -- Indexes for common query patterns
 CREATE INDEX IF NOT EXISTS idx_ramp_up_trade ON m1_ramp_up_indicator_2 (trade_id);
 CREATE INDEX IF NOT EXISTS idx_ramp_up_ticker_date ON m1_ramp_up_indicator_2 (ticker, bar_date);
+
+-- The done-trade snapshot the eligibility anti-join reads
+-- (SELECT DISTINCT trade_id) is served by idx_ramp_up_trade.
+
+-- Covering index for the trades_2 x m5_atr_stop_2 join in the eligibility
+-- query and --status: the outcome columns ride along in the index so the
+-- m5 side can be an index-only scan instead of a heap fetch per trade.
+CREATE INDEX IF NOT EXISTS idx_m5as2_trade_outcome
+    ON m5_atr_stop_2 (trade_id) INCLUDE (result, max_r);
+
+-- Refresh planner statistics so the new index is costed correctly.
+-- Index-only scans also need an up-to-date visibility map; after a large
+-- m5_atr_stop_2 load run VACUUM ANALYZE m5_atr_stop_2 by hand (VACUUM is
+-- not allowed inside this multi-statement script).
+ANALYZE m5_atr_stop_2;
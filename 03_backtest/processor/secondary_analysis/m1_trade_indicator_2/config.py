@@ -73,5 +73,4 @@ INDICATOR_COLUMNS = [
 # =============================================================================
 # PROCESSING
 # =============================================================================
-BATCH_SIZE = 500  # Rows per execute_values batch
 VERBOSE = True
@@ -11,10 +11,14 @@ before the entry candle, denormalized with trade context and outcome.
 Pipeline:
     1. Query trades in trades_2 INNER JOIN m5_atr_stop_2 (outcome required)
        that are NOT yet in m1_trade_indicator_2
-    2. For each trade: find the M1 bar from m1_indicator_bars_2 that closed
-       just before the entry candle (entry_time floored to minute - 1 minute)
+    2. Join the M1 bar from m1_indicator_bars_2 that closed just before the
+       entry candle (entry_time floored to minute - 1 minute, in SQL)
     3. Merge trade context + outcome + indicator values into single row
-    4. INSERT with ON CONFLICT DO UPDATE
+    4. Upsert with a single INSERT ... SELECT ... ON CONFLICT DO UPDATE,
+       run entirely server-side (no row data crosses the wire)
+
+Dry runs stream the same joined rows through a server-side cursor and
+build them in Python (build_row) for preview.
 
 No indicator calculations - pure data reshaping from existing tables.
 
@@ -22,64 +26,59 @@ Version: 1.0.0
 ================================================================================
 """
 
-import sys
 import logging
-from pathlib import Path
-from datetime import date, time, datetime, timedelta
-from decimal import Decimal
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from typing import Iterator, Dict, Optional
 
 import psycopg2
-from psycopg2.extras import execute_values, RealDictCursor
 
 # Self-contained imports
-from config import DB_CONFIG, SOURCE_TABLES, TARGET_TABLE, INDICATOR_COLUMNS, BATCH_SIZE
+from config import DB_CONFIG, SOURCE_TABLES, TARGET_TABLE, INDICATOR_COLUMNS
 
 logger = logging.getLogger(__name__)
 
+# Target columns, in build_row tuple order
+_TARGET_COLUMNS = (
+    'trade_id',
+    'ticker', 'date', 'direction', 'model', 'zone_type',
+    'entry_time', 'entry_price',
+    'is_winner', 'pnl_r', 'max_r_achieved',
+    'bar_date', 'bar_time',
+    *INDICATOR_COLUMNS,
+)
+_IS_WINNER_IDX = _TARGET_COLUMNS.index('is_winner')
+
+# Upsert conflict clause. Trade context is fixed once a trade exists, so a
+# conflict refreshes only the outcome and indicator snapshot. The eligibility
+# anti-join already leaves out trades in the target, so a conflict only
+# happens when a concurrent run inserts the same trade first; the WHERE then
+# skips the update (no dead tuple, no WAL) when nothing changed.
+_UPDATE_COLUMNS = _TARGET_COLUMNS[_IS_WINNER_IDX:]
+_ON_CONFLICT_SQL = f"""
+    ON CONFLICT (trade_id) DO UPDATE SET
+    {', '.join(f"{col} = EXCLUDED.{col}" for col in _UPDATE_COLUMNS)},
+    calculated_at = NOW()
+    WHERE ({', '.join(f"{TARGET_TABLE}.{col}" for col in _UPDATE_COLUMNS)})
+        IS DISTINCT FROM ({', '.join(f"EXCLUDED.{col}" for col in _UPDATE_COLUMNS)})
+"""
 
-# =============================================================================
-# UTILITY FUNCTIONS
-# =============================================================================
-
-def _safe_float(val) -> Optional[float]:
-    """Convert Decimal/numpy to Python float, None-safe."""
-    if val is None:
-        return None
-    try:
-        return float(val)
-    except (TypeError, ValueError):
-        return None
-
-
-def _safe_int(val) -> Optional[int]:
-    """Convert to Python int, None-safe."""
-    if val is None:
-        return None
-    try:
-        return int(val)
-    except (TypeError, ValueError):
-        return None
-
-
-def _floor_to_minute(entry_time: time) -> time:
-    """Floor a time value to the minute boundary.
-
-    Example: 09:35:15 -> 09:35:00 (this is the entry candle start)
-    """
-    return time(entry_time.hour, entry_time.minute, 0)
-
-
-def _prior_bar_time(entry_candle_start: time) -> time:
-    """Get the time of the M1 bar that closed just before the entry candle.
-
-    Example: entry_candle_start = 09:35:00 -> prior bar = 09:34:00
-    """
-    dt = datetime(2000, 1, 1, entry_candle_start.hour,
-                  entry_candle_start.minute, 0)
-    prior = dt - timedelta(minutes=1)
-    return time(prior.hour, prior.minute, 0)
+# Trade fields at the start of each stream_eligible_trades row, followed
+# by the joined bar: bar_date, bar_time, *INDICATOR_COLUMNS
+_TRADE_FIELDS = (
+    'trade_id', 'ticker', 'date', 'direction', 'model', 'zone_type',
+    'entry_time', 'entry_price', 'result', 'max_r', 'prior_bar',
+)
+_TRADE_ID_IDX, _TICKER_IDX, _DATE_IDX = 0, 1, 2
+_PRIOR_BAR_IDX = _TRADE_FIELDS.index('prior_bar')
+_BAR_OFFSET = len(_TRADE_FIELDS)
+_BAR_TIME_IDX = _BAR_OFFSET + 1
+_STREAM_ITERSIZE = 10_000
+
+# INDICATOR_COLUMNS stored as INTEGER/BIGINT or text; the rest are NUMERIC
+_INT_COLUMNS = ('volume', 'health_score', 'long_score', 'short_score')
+_TEXT_COLUMNS = (
+    'sma_config', 'sma_momentum_label', 'price_position',
+    'm5_structure', 'm15_structure', 'h1_structure',
+)
 
 
 # =============================================================================
@@ -91,7 +90,8 @@ class M1TradeIndicatorPopulator:
     Populates m1_trade_indicator_2 with entry-bar indicator snapshots.
 
     For each trade in trades_2 that has an outcome in m5_atr_stop_2:
-    - Find the M1 bar from m1_indicator_bars_2 that closed just before entry
+    - Join the M1 bar from m1_indicator_bars_2 that closed just before entry
+      (one query for all trades)
     - Merge trade context + outcome + indicator values
     - Insert into m1_trade_indicator_2
     """
@@ -100,208 +100,184 @@ class M1TradeIndicatorPopulator:
         self.verbose = verbose
 
     # -----------------------------------------------------------------
-    # STEP 1: Get eligible trades (have outcomes, not yet populated)
+    # STEPS 1-2: Get eligible trades with their indicator bars
     # -----------------------------------------------------------------
 
-    def get_eligible_trades(self, conn, limit: Optional[int] = None) -> List[dict]:
+    def stream_eligible_trades(self, conn, limit: Optional[int] = None) -> Iterator[tuple]:
         """
-        Query trades that have outcomes but are not yet in m1_trade_indicator_2.
+        Stream trades that have outcomes but are not yet in m1_trade_indicator_2,
+        each joined to its indicator bar.
 
         INNER JOIN m5_atr_stop_2 ensures only trades with completed outcomes
         are returned. Trades without outcomes are SKIPPED entirely.
+
+        The prior bar (entry_time floored to the minute, minus one minute) is
+        computed in SQL and LEFT JOINed to m1_indicator_bars_2, so every trade
+        comes back with bar_date, bar_time and the INDICATOR_COLUMNS in one
+        round trip. Trades without a matching bar have bar_time = NULL.
+        Rows are plain tuples (_TRADE_FIELDS, then bar_date, bar_time,
+        *INDICATOR_COLUMNS) streamed through a server-side cursor in
+        _STREAM_ITERSIZE batches, so memory stays flat however many trades
+        are eligible.
         """
         trades_table = SOURCE_TABLES['trades']
         m5_table = SOURCE_TABLES['m5_atr_stop']
+        indicators_table = SOURCE_TABLES['m1_indicators']
+        # NUMERIC columns are cast to float8 so psycopg2 returns floats
+        # (INTEGER/BIGINT already come back as int) and build_row can use
+        # every value as-is
+        bar_cols = ', '.join(
+            f"ib.{col}" if col in _INT_COLUMNS or col in _TEXT_COLUMNS
+            else f"ib.{col}::float8 AS {col}"
+            for col in INDICATOR_COLUMNS
+        )
 
         query = f"""
-            SELECT
-                t.trade_id,
-                t.ticker,
-                t.date,
-                t.direction,
-                t.model,
-                t.zone_type,
-                t.entry_time,
-                t.entry_price,
-                -- Outcome from m5_atr_stop_2
-                m5.result,
-                m5.max_r
-            FROM {trades_table} t
-            INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
-            WHERE NOT EXISTS (
-                SELECT 1 FROM {TARGET_TABLE} ti
-                WHERE ti.trade_id = t.trade_id
+            WITH eligible AS (
+                SELECT
+                    t.trade_id,
+                    t.ticker,
+                    t.date,
+                    t.direction,
+                    t.model,
+                    t.zone_type,
+                    t.entry_time,
+                    t.entry_price::float8 AS entry_price,
+                    -- Outcome from m5_atr_stop_2
+                    m5.result,
+                    m5.max_r,
+                    (date_trunc('minute', t.entry_time::interval)
+                        - interval '1 minute')::time AS prior_bar
+                FROM {trades_table} t
+                INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
+                LEFT JOIN {TARGET_TABLE} ti ON ti.trade_id = t.trade_id
+                WHERE ti.trade_id IS NULL
             )
-            ORDER BY t.date, t.ticker, t.entry_time
+            SELECT e.*, ib.bar_date, ib.bar_time, {bar_cols}
+            FROM eligible e
+            LEFT JOIN {indicators_table} ib
+                ON ib.ticker = e.ticker
+               AND ib.bar_date = e.date
+               AND ib.bar_time = e.prior_bar
+            ORDER BY e.date, e.ticker, e.entry_time
         """
 
         if limit:
             query += f" LIMIT {limit}"
 
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        with conn.cursor(name='eligible_stream') as cur:
+            cur.itersize = _STREAM_ITERSIZE
             cur.execute(query)
-            rows = cur.fetchall()
-
-        if self.verbose:
-            print(f"  Found {len(rows)} trades needing indicator snapshots")
-
-        return [dict(r) for r in rows]
-
-    # -----------------------------------------------------------------
-    # STEP 2: Get indicator bar for a single trade
-    # -----------------------------------------------------------------
-
-    def get_indicator_bar(self, conn, ticker: str, bar_date: date,
-                          bar_time: time) -> Optional[dict]:
-        """
-        Fetch the M1 indicator bar for a specific ticker/date/time.
-
-        Returns None if no matching bar exists in m1_indicator_bars_2.
-        """
-        indicators_table = SOURCE_TABLES['m1_indicators']
-        cols = ', '.join(INDICATOR_COLUMNS)
-
-        query = f"""
-            SELECT bar_date, bar_time, {cols}
-            FROM {indicators_table}
-            WHERE ticker = %s AND bar_date = %s AND bar_time = %s
-        """
-
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(query, (ticker, bar_date, bar_time))
-            row = cur.fetchone()
-
-        return dict(row) if row else None
+            yield from cur
 
     # -----------------------------------------------------------------
     # STEP 3: Build a single target row
     # -----------------------------------------------------------------
 
-    def build_row(self, trade: dict, indicator_bar: dict) -> tuple:
+    def build_row(self, trade: tuple) -> tuple:
         """
         Build a single row for m1_trade_indicator_2.
 
-        Merges trade context + outcome + indicator values.
-        Returns a tuple ready for execute_values INSERT.
+        Merges trade context + outcome + indicator values from one
+        stream_eligible_trades row (trade fields plus its joined bar).
+        Returns a tuple in _TARGET_COLUMNS order.
         """
+        (trade_id, ticker, trade_date, direction, model, zone_type,
+         entry_time, entry_price, result, max_r, _) = trade[:_BAR_OFFSET]
+
         # Outcome
-        is_winner = (trade['result'] == 'WIN')
-        max_r = _safe_int(trade['max_r']) or -1
+        is_winner = (result == 'WIN')
+        max_r = max_r or -1
         pnl_r = float(max_r)
 
         return (
             # Trade Reference
-            trade['trade_id'],
+            trade_id,
             # Trade Context
-            trade['ticker'],
-            trade['date'],
-            trade['direction'],
-            trade['model'],
-            trade['zone_type'],
-            trade['entry_time'],
-            _safe_float(trade['entry_price']),
+            ticker, trade_date, direction, model, zone_type,
+            entry_time, entry_price,
             # Outcome
-            is_winner,
-            pnl_r,
-            max_r,
-            # Bar Identification
-            indicator_bar['bar_date'],
-            indicator_bar['bar_time'],
-            # OHLCV
-            _safe_float(indicator_bar.get('open')),
-            _safe_float(indicator_bar.get('high')),
-            _safe_float(indicator_bar.get('low')),
-            _safe_float(indicator_bar.get('close')),
-            _safe_int(indicator_bar.get('volume')),
-            # Core Indicators
-            _safe_float(indicator_bar.get('candle_range_pct')),
-            _safe_float(indicator_bar.get('vol_delta_raw')),
-            _safe_float(indicator_bar.get('vol_delta_roll')),
-            _safe_float(indicator_bar.get('vol_delta_norm')),
-            _safe_float(indicator_bar.get('vol_roc')),
-            _safe_float(indicator_bar.get('sma9')),
-            _safe_float(indicator_bar.get('sma21')),
-            indicator_bar.get('sma_config'),
-            _safe_float(indicator_bar.get('sma_spread_pct')),
-            indicator_bar.get('sma_momentum_label'),
-            indicator_bar.get('price_position'),
-            _safe_float(indicator_bar.get('cvd_slope')),
-            # Structure
-            indicator_bar.get('m5_structure'),
-            indicator_bar.get('m15_structure'),
-            indicator_bar.get('h1_structure'),
-            # Composite Scores
-            _safe_int(indicator_bar.get('health_score')),
-            _safe_int(indicator_bar.get('long_score')),
-            _safe_int(indicator_bar.get('short_score')),
-        )
+            is_winner, pnl_r, max_r,
+            # Bar identification + indicator values, already typed by the
+            # float8 casts in stream_eligible_trades
+        ) + trade[_BAR_OFFSET:]
 
-    # -----------------------------------------------------------------
-    # STEP 4: Insert rows
-    # -----------------------------------------------------------------
+    def populate_in_database(self, conn, limit: Optional[int] = None) -> Dict:
+        """
+        Build and upsert trade indicator rows entirely server-side.
 
-    def insert_rows(self, conn, rows: List[tuple]) -> int:
-        """Insert rows into m1_trade_indicator_2 with ON CONFLICT upsert."""
-        if not rows:
-            return 0
+        One INSERT ... SELECT does the work of stream_eligible_trades and
+        build_row plus the upsert: each eligible trade is joined to the bar
+        that closed just before its entry candle, and the outcome follows
+        the same rules as build_row (is_winner = result 'WIN', max_r
+        0/NULL -> -1, pnl_r = max_r). Trades without that bar are left out.
+
+        Returns:
+            Dict with total_eligible, inserted and winners
+        """
+        trades_table = SOURCE_TABLES['trades']
+        m5_table = SOURCE_TABLES['m5_atr_stop']
+        indicators_table = SOURCE_TABLES['m1_indicators']
+        columns = ', '.join(_TARGET_COLUMNS)
+        bar_cols = ', '.join(f"ib.{c}" for c in INDICATOR_COLUMNS)
+        limit_clause = f"LIMIT {int(limit)}" if limit else ""
 
         query = f"""
-            INSERT INTO {TARGET_TABLE} (
-                trade_id,
-                ticker, date, direction, model, zone_type,
-                entry_time, entry_price,
-                is_winner, pnl_r, max_r_achieved,
-                bar_date, bar_time,
-                open, high, low, close, volume,
-                candle_range_pct,
-                vol_delta_raw, vol_delta_roll, vol_delta_norm,
-                vol_roc,
-                sma9, sma21, sma_config, sma_spread_pct,
-                sma_momentum_label, price_position,
-                cvd_slope,
-                m5_structure, m15_structure, h1_structure,
-                health_score, long_score, short_score
-            ) VALUES %s
-            ON CONFLICT (trade_id) DO UPDATE SET
-                is_winner = EXCLUDED.is_winner,
-                pnl_r = EXCLUDED.pnl_r,
-                max_r_achieved = EXCLUDED.max_r_achieved,
-                bar_date = EXCLUDED.bar_date,
-                bar_time = EXCLUDED.bar_time,
-                open = EXCLUDED.open,
-                high = EXCLUDED.high,
-                low = EXCLUDED.low,
-                close = EXCLUDED.close,
-                volume = EXCLUDED.volume,
-                candle_range_pct = EXCLUDED.candle_range_pct,
-                vol_delta_raw = EXCLUDED.vol_delta_raw,
-                vol_delta_roll = EXCLUDED.vol_delta_roll,
-                vol_delta_norm = EXCLUDED.vol_delta_norm,
-                vol_roc = EXCLUDED.vol_roc,
-                sma9 = EXCLUDED.sma9,
-                sma21 = EXCLUDED.sma21,
-                sma_config = EXCLUDED.sma_config,
-                sma_spread_pct = EXCLUDED.sma_spread_pct,
-                sma_momentum_label = EXCLUDED.sma_momentum_label,
-                price_position = EXCLUDED.price_position,
-                cvd_slope = EXCLUDED.cvd_slope,
-                m5_structure = EXCLUDED.m5_structure,
-                m15_structure = EXCLUDED.m15_structure,
-                h1_structure = EXCLUDED.h1_structure,
-                health_score = EXCLUDED.health_score,
-                long_score = EXCLUDED.long_score,
-                short_score = EXCLUDED.short_score,
-                calculated_at = NOW()
+            WITH eligible AS (
+                SELECT
+                    t.trade_id,
+                    t.ticker,
+                    t.date,
+                    t.direction,
+                    t.model,
+                    t.zone_type,
+                    t.entry_time,
+                    t.entry_price,
+                    COALESCE(m5.result = 'WIN', FALSE) AS is_winner,
+                    COALESCE(NULLIF(m5.max_r, 0), -1) AS max_r,
+                    (date_trunc('minute', t.entry_time::interval)
+                        - interval '1 minute')::time AS prior_bar
+                FROM {trades_table} t
+                INNER JOIN {m5_table} m5 ON t.trade_id = m5.trade_id
+                LEFT JOIN {TARGET_TABLE} ti ON ti.trade_id = t.trade_id
+                WHERE ti.trade_id IS NULL
+                ORDER BY t.date, t.ticker, t.entry_time
+                {limit_clause}
+            ),
+            upserted AS (
+                INSERT INTO {TARGET_TABLE} ({columns})
+                SELECT
+                    e.trade_id,
+                    e.ticker, e.date, e.direction, e.model, e.zone_type,
+                    e.entry_time, e.entry_price,
+                    e.is_winner, e.max_r::numeric, e.max_r,
+                    ib.bar_date, ib.bar_time,
+                    {bar_cols}
+                FROM eligible e
+                INNER JOIN {indicators_table} ib
+                    ON ib.ticker = e.ticker
+                   AND ib.bar_date = e.date
+                   AND ib.bar_time = e.prior_bar
+                {_ON_CONFLICT_SQL}
+                RETURNING is_winner
+            )
+            SELECT
+                (SELECT COUNT(*) FROM eligible),
+                COUNT(*),
+                COUNT(*) FILTER (WHERE is_winner)
+            FROM upserted
         """
 
-        total_inserted = 0
-        for i in range(0, len(rows), BATCH_SIZE):
-            batch = rows[i:i + BATCH_SIZE]
-            with conn.cursor() as cur:
-                execute_values(cur, query, batch)
-            total_inserted += len(batch)
+        with conn.cursor() as cur:
+            cur.execute("SET LOCAL synchronous_commit = off")
+            cur.execute(query)
+            eligible, inserted, winners = cur.fetchone()
 
-        return total_inserted
+        return {
+            'total_eligible': int(eligible),
+            'inserted': int(inserted),
+            'winners': int(winners),
+        }
 
     # -----------------------------------------------------------------
     # STATUS: Show pipeline state
@@ -366,7 +342,9 @@ class M1TradeIndicatorPopulator:
 
         Args:
             limit: Maximum trades to process (None = all)
-            dry_run: If True, compute but don't write to DB
+            dry_run: If True, compute but don't write to DB (rows are
+                built in Python for preview; live runs go through
+                populate_in_database)
 
         Returns:
             Dict with processing stats
@@ -384,47 +362,45 @@ class M1TradeIndicatorPopulator:
             conn = psycopg2.connect(**DB_CONFIG)
             conn.autocommit = False
 
-            # Step 1: Get eligible trades
-            print(f"\n[1/4] Querying eligible trades (with outcomes, not yet populated)...")
-            trades = self.get_eligible_trades(conn, limit)
-            stats['total_eligible'] = len(trades)
-
-            if not trades:
-                print("  No new trades to process")
-                return stats
+            if not dry_run:
+                return self._run_in_database(conn, limit, stats)
 
-            # Step 2: Build rows
-            print(f"[2/4] Fetching indicator bars for {len(trades)} trades...")
-            rows = []
-            for trade in trades:
+            # Steps 1-2: Stream eligible trades joined to their indicator bars
+            print(f"\n[1/4] Querying eligible trades (with outcomes, not yet populated)...")
+            print(f"[2/4] Joining indicator bars (bar just before entry candle)...")
+            sample = None
+            win_count = 0
+            for trade in self.stream_eligible_trades(conn, limit):
+                stats['total_eligible'] += 1
                 try:
-                    # Calculate the prior M1 bar time
-                    entry_time = trade['entry_time']
-                    entry_candle_start = _floor_to_minute(entry_time)
-                    prior_bar = _prior_bar_time(entry_candle_start)
-
-                    # Fetch indicator bar
-                    indicator_bar = self.get_indicator_bar(
-                        conn, trade['ticker'], trade['date'], prior_bar
-                    )
-
-                    if indicator_bar is None:
+                    if trade[_BAR_TIME_IDX] is None:
                         stats['skipped_no_indicator'] += 1
                         if self.verbose:
-                            print(f"  SKIP: {trade['trade_id']} - no indicator bar "
-                                  f"at {trade['ticker']} {trade['date']} {prior_bar}")
+                            print(f"  SKIP: {trade[_TRADE_ID_IDX]} - no indicator bar "
+                                  f"at {trade[_TICKER_IDX]} {trade[_DATE_IDX]} "
+                                  f"{trade[_PRIOR_BAR_IDX]}")
                         continue
 
                     # Build target row
-                    row = self.build_row(trade, indicator_bar)
-                    rows.append(row)
+                    row = self.build_row(trade)
                     stats['processed'] += 1
+                    if row[_IS_WINNER_IDX] is True:
+                        win_count += 1
+                    if sample is None:
+                        sample = row
 
                 except Exception as e:
                     stats['errors'] += 1
-                    logger.error(f"Error processing {trade['trade_id']}: {e}")
+                    logger.error(f"Error processing {trade[_TRADE_ID_IDX]}: {e}")
                     if self.verbose:
-                        print(f"  ERROR: {trade['trade_id']}: {e}")
+                        print(f"  ERROR: {trade[_TRADE_ID_IDX]}: {e}")
+
+            if self.verbose:
+                print(f"  Found {stats['total_eligible']} trades needing indicator snapshots")
+
+            if not stats['total_eligible']:
+                print("  No new trades to process")
+                return stats
 
             # Step 3: Summary
             print(f"[3/4] Summary:")
@@ -432,32 +408,24 @@ class M1TradeIndicatorPopulator:
             print(f"  Skipped (no indicator): {stats['skipped_no_indicator']}")
             print(f"  Errors:                 {stats['errors']}")
 
-            if rows:
-                win_count = sum(1 for r in rows if r[8] is True)  # is_winner index
-                loss_count = len(rows) - win_count
+            if stats['processed']:
+                loss_count = stats['processed'] - win_count
                 print(f"  WIN: {win_count}, LOSS: {loss_count}")
 
-            # Step 4: Insert
-            if dry_run:
-                print(f"[4/4] DRY RUN - skipping database write")
-                if self.verbose and rows:
-                    sample = rows[0]
-                    print(f"\n  Sample row:")
-                    print(f"    trade_id:  {sample[0]}")
-                    print(f"    ticker:    {sample[1]}, date: {sample[2]}")
-                    print(f"    direction: {sample[3]}, model: {sample[4]}")
-                    print(f"    is_winner: {sample[8]}, pnl_r: {sample[9]}")
-                    print(f"    bar_time:  {sample[12]}")
-                    print(f"    candle_%:  {sample[18]}")
-                    print(f"    vol_roc:   {sample[21]}")
-                    print(f"    sma_cfg:   {sample[24]}")
-                    print(f"    h1_struct: {sample[31]}")
-            else:
-                print(f"[4/4] Inserting {len(rows)} rows into {TARGET_TABLE}...")
-                inserted = self.insert_rows(conn, rows)
-                conn.commit()
-                stats['inserted'] = inserted
-                print(f"  Inserted: {inserted} rows")
+            # Step 4: Dry run preview
+            print(f"[4/4] DRY RUN - skipping database write")
+            if self.verbose and sample:
+                sample = dict(zip(_TARGET_COLUMNS, sample))
+                print(f"\n  Sample row:")
+                print(f"    trade_id:  {sample['trade_id']}")
+                print(f"    ticker:    {sample['ticker']}, date: {sample['date']}")
+                print(f"    direction: {sample['direction']}, model: {sample['model']}")
+                print(f"    is_winner: {sample['is_winner']}, pnl_r: {sample['pnl_r']}")
+                print(f"    bar_time:  {sample['bar_time']}")
+                print(f"    candle_%:  {sample['candle_range_pct']}")
+                print(f"    vol_roc:   {sample['vol_roc']}")
+                print(f"    sma_cfg:   {sample['sma_config']}")
+                print(f"    h1_struct: {sample['h1_structure']}")
 
         except KeyboardInterrupt:
             print("\n  Interrupted by user")
@@ -477,3 +445,29 @@ class M1TradeIndicatorPopulator:
                 conn.close()
 
         return stats
+
+    def _run_in_database(self, conn, limit: Optional[int], stats: Dict) -> Dict:
+        """Live run: build and upsert all rows with populate_in_database."""
+        print(f"\n[1/4] Querying eligible trades (with outcomes, not yet populated)...")
+        print(f"[2/4] Building indicator snapshots server-side (bar just before entry candle)...")
+        result = self.populate_in_database(conn, limit)
+        stats['total_eligible'] = result['total_eligible']
+
+        if not stats['total_eligible']:
+            conn.rollback()
+            print("  No new trades to process")
+            return stats
+
+        conn.commit()
+        stats['processed'] = stats['inserted'] = result['inserted']
+        stats['skipped_no_indicator'] = stats['total_eligible'] - stats['processed']
+
+        print(f"[3/4] Summary:")
+        print(f"  Processed:              {stats['processed']}")
+        print(f"  Skipped (no indicator): {stats['skipped_no_indicator']}")
+        print(f"  Errors:                 {stats['errors']}")
+        if stats['processed']:
+            print(f"  WIN: {result['winners']}, LOSS: {stats['processed'] - result['winners']}")
+        print(f"[4/4] Inserted: {stats['inserted']} rows into {TARGET_TABLE}")
+
+        return stats